@@ -2,6 +2,9 @@
 
 from dataclasses import dataclass
 from datetime import datetime
+from enum import StrEnum
+
+from app.domain.entities.user import User
 
 
 @dataclass
@@ -31,3 +34,41 @@ class UserDTO:
 	is_active: bool
 	created_at: datetime
 	updated_at: datetime | None = None
+
+	@classmethod
+	def from_entity(cls, user: User) -> "UserDTO":
+		"""Create UserDTO from a persisted domain entity.
+
+		Args:
+		        user: User domain entity
+
+		Returns:
+		        UserDTO instance
+		"""
+		return cls(
+			id=user.id,  # type: ignore
+			name=user.name,
+			email=user.email.value,
+			is_active=user.is_active,
+			created_at=user.created_at,  # type: ignore
+			updated_at=user.updated_at,
+		)
+
+
+class BulkCreateStatus(StrEnum):
+	"""Outcome of a single row in a bulk user import."""
+
+	CREATED = "created"
+	DUPLICATE = "duplicate"
+	INVALID = "invalid"
+
+
+@dataclass
+class BulkCreateUserResultDTO:
+	"""DTO for the result of one row in a bulk user import."""
+
+	index: int
+	email: str
+	status: BulkCreateStatus
+	user: UserDTO | None = None
+	error: str | None = None
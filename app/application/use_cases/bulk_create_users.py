@@ -0,0 +1,73 @@
+"""Bulk create users use case."""
+
+from app.application.dtos.user_dto import BulkCreateStatus, BulkCreateUserResultDTO, CreateUserDTO, UserDTO
+from app.domain.entities.user import User
+from app.domain.repositories.unit_of_work import UnitOfWork
+from app.domain.value_objects.email import Email
+
+
+class BulkCreateUsersUseCase:
+	"""Use case for importing a batch of users in one transaction."""
+
+	def __init__(self, unit_of_work: UnitOfWork) -> None:
+		"""Initialize use case with unit of work.
+
+		Args:
+		        unit_of_work: Unit of work providing the user repository
+		"""
+		self.unit_of_work = unit_of_work
+
+	async def execute(self, data: list[CreateUserDTO]) -> list[BulkCreateUserResultDTO]:
+		"""Execute the bulk create users use case.
+
+		Rows are validated and deduplicated in memory, then written with a single
+		``save_many`` call instead of one existence check and commit per row.
+
+		Args:
+		        data: User creation data, one entry per imported row
+
+		Returns:
+		        One result per input row, in input order
+		"""
+		results: list[BulkCreateUserResultDTO] = []
+		pending: dict[str, int] = {}
+		users: list[User] = []
+
+		for index, row in enumerate(data):
+			try:
+				user = User(name=row.name, email=Email(row.email))
+			except ValueError as e:
+				results.append(BulkCreateUserResultDTO(index=index, email=row.email, status=BulkCreateStatus.INVALID, error=str(e)))
+				continue
+
+			if row.email in pending:
+				results.append(
+					BulkCreateUserResultDTO(
+						index=index,
+						email=row.email,
+						status=BulkCreateStatus.DUPLICATE,
+						error=f"Duplicate of row {pending[row.email]}",
+					)
+				)
+				continue
+
+			pending[row.email] = index
+			users.append(user)
+			# Placeholder until the batch is written
+			results.append(BulkCreateUserResultDTO(index=index, email=row.email, status=BulkCreateStatus.DUPLICATE))
+
+		saved: list[User] = []
+		if users:
+			async with self.unit_of_work:
+				saved = await self.unit_of_work.users.save_many(users)
+				await self.unit_of_work.commit()
+
+		saved_by_email = {user.email.value: user for user in saved}
+		for email, index in pending.items():
+			if email in saved_by_email:
+				results[index].status = BulkCreateStatus.CREATED
+				results[index].user = UserDTO.from_entity(saved_by_email[email])
+			else:
+				results[index].error = f"User with email {email} already exists"
+
+		return results
@@ -2,20 +2,21 @@
 
 from app.application.dtos.user_dto import CreateUserDTO, UserDTO
 from app.domain.entities.user import User
-from app.domain.repositories.user_repository import UserRepository
+from app.domain.exceptions import EmailAlreadyExistsError
+from app.domain.repositories.unit_of_work import UnitOfWork
 from app.domain.value_objects.email import Email
 
 
 class CreateUserUseCase:
 	"""Use case for creating a new user."""
 
-	def __init__(self, user_repository: UserRepository) -> None:
-		"""Initialize use case with repository.
+	def __init__(self, unit_of_work: UnitOfWork) -> None:
+		"""Initialize use case with unit of work.
 
 		Args:
-		        user_repository: User repository instance
+		        unit_of_work: Unit of work providing the user repository
 		"""
-		self.user_repository = user_repository
+		self.unit_of_work = unit_of_work
 
 	async def execute(self, data: CreateUserDTO) -> UserDTO:
 		"""Execute the create user use case.
@@ -35,19 +36,12 @@ class CreateUserUseCase:
 		# Create user entity (validates name)  # noqa: ERA001
 		user = User(name=data.name, email=email)
 
-		# Check if user with email already exists
-		if await self.user_repository.exists_by_email(data.email):
-			raise ValueError(f"User with email {data.email} already exists")
-
-		# Save user
-		saved_user = await self.user_repository.save(user)
+		async with self.unit_of_work:
+			# Insert unless the email is taken, in one atomic statement
+			saved_user = await self.unit_of_work.users.create(user)
+			if saved_user is None:
+				raise EmailAlreadyExistsError(data.email)
+			await self.unit_of_work.commit()
 
 		# Convert to DTO
-		return UserDTO(
-			id=saved_user.id,  # type: ignore
-			name=saved_user.name,
-			email=saved_user.email.value,
-			is_active=saved_user.is_active,
-			created_at=saved_user.created_at,  # type: ignore
-			updated_at=saved_user.updated_at,
-		)
+		return UserDTO.from_entity(saved_user)
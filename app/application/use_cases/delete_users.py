@@ -0,0 +1,40 @@
+"""Delete users use case."""
+
+from app.domain.repositories.unit_of_work import UnitOfWork
+from app.domain.repositories.user_repository import UserFilter
+
+
+class DeleteUsersUseCase:
+	"""Use case for deleting many users with one set-based statement."""
+
+	def __init__(self, unit_of_work: UnitOfWork) -> None:
+		"""Initialize use case with unit of work.
+
+		Args:
+		        unit_of_work: Unit of work providing the user repository
+		"""
+		self.unit_of_work = unit_of_work
+
+	async def execute(self, selection: list[int] | UserFilter) -> list[int]:
+		"""Execute the delete users use case.
+
+		Args:
+		        selection: User identifiers, or a filter the users must match
+
+		Returns:
+		        IDs of users that were deleted
+
+		Raises:
+		        ValueError: If the filter has no conditions
+		"""
+		if isinstance(selection, UserFilter) and selection.is_empty:
+			raise ValueError("User filter must have at least one condition")
+
+		async with self.unit_of_work:
+			if isinstance(selection, UserFilter):
+				user_ids = await self.unit_of_work.users.delete_where(selection)
+			else:
+				user_ids = await self.unit_of_work.users.delete_many(selection)
+			await self.unit_of_work.commit()
+
+		return user_ids
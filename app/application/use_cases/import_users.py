@@ -0,0 +1,38 @@
+"""Import users in the background use case."""
+
+from dataclasses import asdict
+
+from app.application.dtos.user_dto import CreateUserDTO
+from app.domain.repositories.unit_of_work import UnitOfWork
+
+# Job kind run by BulkCreateUsersUseCase in the worker
+IMPORT_USERS_JOB = "users.import"
+
+
+class ImportUsersUseCase:
+	"""Use case for queueing a batch of users to be imported by the job worker."""
+
+	def __init__(self, unit_of_work: UnitOfWork) -> None:
+		"""Initialize use case with unit of work.
+
+		Args:
+		        unit_of_work: Unit of work providing the job queue
+		"""
+		self.unit_of_work = unit_of_work
+
+	async def execute(self, data: list[CreateUserDTO]) -> int:
+		"""Execute the import users use case.
+
+		Rows are validated when the job runs, with the same outcomes as a bulk
+		create.
+
+		Args:
+		        data: User creation data, one entry per imported row
+
+		Returns:
+		        Identifier of the queued job
+		"""
+		async with self.unit_of_work:
+			job_id = await self.unit_of_work.jobs.enqueue(IMPORT_USERS_JOB, {"users": [asdict(row) for row in data]})
+			await self.unit_of_work.commit()
+		return job_id
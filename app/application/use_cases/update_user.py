@@ -0,0 +1,57 @@
+"""Update user use case."""
+
+from app.application.dtos.user_dto import UpdateUserDTO, UserDTO
+from app.domain.entities.user import validate_name
+from app.domain.exceptions import UserNotFoundError
+from app.domain.repositories.unit_of_work import UnitOfWork
+from app.domain.value_objects.email import Email
+
+
+class UpdateUserUseCase:
+	"""Use case for partially updating an existing user."""
+
+	def __init__(self, unit_of_work: UnitOfWork) -> None:
+		"""Initialize use case with unit of work.
+
+		Args:
+		        unit_of_work: Unit of work providing the user repository
+		"""
+		self.unit_of_work = unit_of_work
+
+	async def execute(self, user_id: int, data: UpdateUserDTO) -> UserDTO:
+		"""Execute the update user use case.
+
+		Only fields set in ``data`` are written, in a single statement that also
+		returns the updated user.
+
+		Args:
+		        user_id: User identifier
+		        data: Fields to change, None for fields left as they are
+
+		Returns:
+		        Updated user DTO
+
+		Raises:
+		        UserNotFoundError: If the user does not exist
+		        EmailAlreadyExistsError: If the new email is used by another user
+		        ValueError: If validation fails
+		"""
+		changes: dict[str, object] = {}
+		if data.name is not None:
+			validate_name(data.name)
+			changes["name"] = data.name
+		if data.email is not None:
+			changes["email"] = Email(data.email).value
+		if data.is_active is not None:
+			changes["is_active"] = data.is_active
+
+		async with self.unit_of_work:
+			if changes:
+				user = await self.unit_of_work.users.update_fields(user_id, **changes)
+			else:
+				user = await self.unit_of_work.users.get_by_id(user_id)
+			if user is None:
+				raise UserNotFoundError(user_id)
+			await self.unit_of_work.commit()
+
+		return UserDTO.from_entity(user)
@@ -27,6 +27,62 @@ class Settings(BaseSettings):
 	postgres_password: str = "postgres"
 	postgres_port: int = 5432
 
+	# Connection pool
+	db_pool_size: int = 5
+	db_max_overflow: int = 10
+	db_pool_timeout_seconds: float = 30.0
+	db_pool_recycle_seconds: int = 1800
+	db_pool_pre_ping: bool = True
+	db_statement_cache_size: int = 100
+	db_echo: bool = False
+	db_pool_prewarm: bool = True
+
+	# Readiness probe
+	readiness_cache_seconds: float = 2.0
+	readiness_timeout_seconds: float = 1.0
+
+	# Read replicas
+	database_replica_urls: list[str] = []
+	db_replica_check_interval_seconds: float = 5.0
+	db_replica_check_timeout_seconds: float = 1.0
+
+	# User cache - one per worker process
+	user_cache_enabled: bool = False
+	user_cache_max_size: int = 10_000
+	user_cache_ttl_seconds: float = 60.0
+	user_cache_negative_ttl_seconds: float = 5.0
+	user_count_cache_ttl_seconds: float = 30.0
+
+	# Concurrent identical user lookups of read-only requests share one query
+	read_coalescing_enabled: bool = False
+
+	# Admission control - one per worker process
+	admission_max_concurrency: int = 0  # 0 sizes it to db_pool_size + db_max_overflow
+	admission_max_queue: int = 50
+	admission_queue_timeout_seconds: float = 2.0
+	rate_limit_per_second: float = 0.0  # Per client, 0 disables
+	rate_limit_burst: int = 20
+	rate_limit_trusted_proxies: list[str] = []  # Addresses or networks whose X-Forwarded-For is believed
+
+	# Metrics
+	metrics_enabled: bool = True
+
+	# Background job worker, run with python -m app.worker
+	job_worker_concurrency: int = 10
+	job_visibility_timeout_seconds: float = 300.0
+	job_poll_interval_seconds: float = 1.0
+	job_retry_base_seconds: float = 5.0
+	job_retry_max_seconds: float = 3600.0
+	job_worker_metrics_port: int = 9100
+
+	# Slow query log - one per worker process
+	slow_query_log_enabled: bool = False
+	slow_query_threshold_ms: float = 200.0
+	slow_query_explain_sample_rate: float = 0.0
+	slow_query_explain_analyze: bool = False
+	slow_query_explain_timeout_ms: float = 5000.0
+	slow_query_log_size: int = 100
+
 	# Security
 	secret_key: str = "your-secret-key-change-in-production"
 	allowed_hosts: str = "*"
@@ -41,6 +97,14 @@ class Settings(BaseSettings):
 	oauth2_client_id: str = "association-backend"
 	oauth2_client_secret: str = "change-this"
 	oauth2_redirect_uri: str = "http://localhost:8000/auth/callback"
+	oauth2_issuer: str = ""  # Defaults to authelia_url
+	oauth2_jwks_ttl_seconds: float = 3600.0
+	oauth2_introspection_cache_size: int = 10_000
+	oauth2_introspection_cache_seconds: float = 300.0
+	oauth2_http_timeout_seconds: float = 5.0
+	oauth2_http_max_connections: int = 20
+	oauth2_admin_scope: str = "admin"
+	oauth2_admin_group: str = "admins"
 
 	# CORS
 	cors_origins: list[str] = ["http://localhost:3000", "http://localhost:8000"]
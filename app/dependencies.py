@@ -1,10 +1,113 @@
 """Dependency injection for FastAPI."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import Annotated
 
+import httpx
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.infrastructure.database import AsyncSessionLocal
+from app.config import settings
+from app.domain.repositories.unit_of_work import UnitOfWork
+from app.domain.repositories.user_repository import UserRepository
+from app.infrastructure.auth import (
+	AccessToken,
+	AuthProviderUnavailableError,
+	InvalidTokenError,
+	JWKSCache,
+	TokenVerifier,
+)
+from app.infrastructure.cache import LRUCache
+from app.infrastructure.database import AsyncSessionLocal, replica_router
+from app.infrastructure.loaders import UserLoader
+from app.infrastructure.repositories.cached_user_repository import UserCache, register_user_cache_metrics
+from app.infrastructure.repositories.coalescing_user_repository import ReadCoalescer
+from app.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+from app.infrastructure.slow_queries import query_origin
+from app.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+# Clients send this to read from the primary, e.g. right after their own write
+CONSISTENCY_HEADER = "X-Consistency"
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+user_cache = UserCache(
+	max_size=settings.user_cache_max_size,
+	ttl=settings.user_cache_ttl_seconds,
+	negative_ttl=settings.user_cache_negative_ttl_seconds,
+)
+register_user_cache_metrics(user_cache)
+
+# Exact user counts reused across requests by CountMode.CACHED
+user_count_cache: LRUCache[str, int] = LRUCache(max_size=1, ttl=settings.user_count_cache_ttl_seconds)
+
+# Connections to Authelia, reused across requests
+auth_http_client = httpx.AsyncClient(
+	timeout=settings.oauth2_http_timeout_seconds,
+	limits=httpx.Limits(max_connections=settings.oauth2_http_max_connections),
+)
+
+token_verifier = TokenVerifier(
+	auth_http_client,
+	JWKSCache(auth_http_client, f"{settings.authelia_url}/jwks.json", ttl=settings.oauth2_jwks_ttl_seconds),
+	introspection_url=f"{settings.authelia_url}/api/oidc/introspection",
+	client_id=settings.oauth2_client_id,
+	client_secret=settings.oauth2_client_secret,
+	issuer=settings.oauth2_issuer or settings.authelia_url,
+	audience=settings.oauth2_client_id,
+	cache_size=settings.oauth2_introspection_cache_size,
+	max_cache_seconds=settings.oauth2_introspection_cache_seconds,
+)
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+async def get_access_token(
+	credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(bearer_scheme)],
+) -> AccessToken:
+	"""Dependency for the request's verified bearer token.
+
+	JWTs are verified locally; opaque tokens are introspected once and cached.
+	"""
+	if credentials is None:
+		raise HTTPException(
+			status_code=status.HTTP_401_UNAUTHORIZED,
+			detail="Not authenticated",
+			headers={"WWW-Authenticate": "Bearer"},
+		)
+	try:
+		return await token_verifier.verify(credentials.credentials)
+	except InvalidTokenError as e:
+		raise HTTPException(
+			status_code=status.HTTP_401_UNAUTHORIZED,
+			detail=str(e),
+			headers={"WWW-Authenticate": 'Bearer error="invalid_token"'},
+		) from e
+	except AuthProviderUnavailableError as e:
+		raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)) from e
+
+
+async def require_admin(token: Annotated[AccessToken, Depends(get_access_token)]) -> AccessToken:
+	"""Dependency for the request's access token, rejecting tokens without admin rights.
+
+	Admins hold the admin scope, or belong to the admin group.
+	"""
+	groups = token.claims.get("groups", [])
+	if settings.oauth2_admin_scope in token.scopes or (isinstance(groups, list) and settings.oauth2_admin_group in groups):
+		return token
+	raise HTTPException(
+		status_code=status.HTTP_403_FORBIDDEN,
+		detail="Admin rights required",
+		headers={"WWW-Authenticate": f'Bearer error="insufficient_scope", scope="{settings.oauth2_admin_scope}"'},
+	)
+
+
+async def track_query_origin(request: Request) -> None:
+	"""Dependency attributing the request's SQL statements to its route template."""
+	route = request.scope.get("route")
+	query_origin.set(getattr(route, "path", None))
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -14,3 +117,90 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 			yield session
 		finally:
 			await session.close()
+
+
+def requires_strong_consistency(request: Request) -> bool:
+	"""Whether a request asked to see every committed write."""
+	return request.headers.get(CONSISTENCY_HEADER, "").lower() == "strong"
+
+
+def allows_stale_reads(request: Request) -> bool:
+	"""Whether a request may read data slightly older than its own transaction would.
+
+	Requests that write, and requests asking for strong consistency, may not,
+	so they see their own writes.
+	"""
+	return not requires_strong_consistency(request) and request.method in SAFE_METHODS
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession | None, None]:
+	"""Dependency for a read replica session, None when reads must use the primary."""
+	sessionmaker = await replica_router.pick() if allows_stale_reads(request) else None
+	if sessionmaker is None:
+		yield None
+		return
+
+	async with sessionmaker() as session:
+		yield session
+
+
+async def get_unit_of_work(
+	request: Request,
+	db: Annotated[AsyncSession, Depends(get_db)],
+	read_db: Annotated[AsyncSession | None, Depends(get_read_db)],
+) -> UnitOfWork:
+	"""Dependency for the request's unit of work.
+
+	Staged changes not committed by the use case are rolled back when the
+	request session closes. Requests asking for strong consistency read
+	around the user cache.
+	"""
+	coalesce = settings.read_coalescing_enabled and allows_stale_reads(request)
+	return SqlAlchemyUnitOfWork(
+		db,
+		read_session=read_db,
+		user_cache=user_cache if settings.user_cache_enabled else None,
+		count_cache=user_count_cache,
+		coalescer=read_coalescer if coalesce else None,
+		consistent_reads=requires_strong_consistency(request),
+	)
+
+
+async def get_user_repository(unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)]) -> UserRepository:
+	"""Dependency for user repository of the request's unit of work."""
+	return unit_of_work.users
+
+
+async def get_user_loader(repository: Annotated[UserRepository, Depends(get_user_repository)]) -> UserLoader:
+	"""Dependency for the request's user loader.
+
+	Batches lookups by ID and email made in the same event loop iteration into
+	one query each, and remembers results until the request ends. Resolve lists
+	of IDs with ``load_many`` rather than ``get_by_id`` in a loop.
+	"""
+	return UserLoader(repository)
+
+
+@asynccontextmanager
+async def user_repository_scope() -> AsyncIterator[UserRepository]:
+	"""Open a user repository on its own session.
+
+	For streaming responses, which keep reading after request dependencies have
+	been torn down.
+	"""
+	sessionmaker = await replica_router.pick()
+	async with AsyncSessionLocal() as session:
+		if sessionmaker is None:
+			yield UserRepositoryImpl(session)
+			return
+		async with sessionmaker() as read_session:
+			yield UserRepositoryImpl(session, read_db=read_session)
+
+
+# User lookups in flight, shared by concurrent requests for the same user
+read_coalescer = ReadCoalescer()
+
+
+def get_user_repository_scope() -> Callable[[], AbstractAsyncContextManager[UserRepository]]:
+	"""Dependency for opening user repositories that outlive the request handler."""
+	return user_repository_scope
@@ -5,8 +5,26 @@ from datetime import datetime
 
 from app.domain.value_objects.email import Email
 
+# Longest name the users table stores
+MAX_NAME_LENGTH = 255
 
-@dataclass
+
+def validate_name(name: str) -> None:
+	"""Validate a user name.
+
+	Args:
+	        name: Name to validate
+
+	Raises:
+	        ValueError: If name is empty, whitespace only or too long
+	"""
+	if not name or not name.strip():
+		raise ValueError("Name cannot be empty")
+	if len(name) > MAX_NAME_LENGTH:
+		raise ValueError(f"Name cannot be longer than {MAX_NAME_LENGTH} characters")
+
+
+@dataclass(slots=True)
 class User:
 	"""User domain entity representing a registered association member."""
 
@@ -19,8 +37,42 @@ class User:
 
 	def __post_init__(self) -> None:
 		"""Validate user data after initialization."""
-		if not self.name or not self.name.strip():
-			raise ValueError("Name cannot be empty")
+		validate_name(self.name)
+
+	@classmethod
+	def restore(
+		cls,
+		user_id: int,
+		name: str,
+		email: Email,
+		is_active: bool,
+		created_at: datetime,
+		updated_at: datetime | None,
+	) -> "User":
+		"""Rebuild a persisted user without re-running validation.
+
+		Only for data that was validated when it was written, such as rows read
+		back from the database.
+
+		Args:
+		        user_id: User identifier
+		        name: Stored name
+		        email: Stored email address
+		        is_active: Stored active status
+		        created_at: Creation timestamp
+		        updated_at: Last update timestamp
+
+		Returns:
+		        User domain entity
+		"""
+		user = object.__new__(cls)
+		user.id = user_id
+		user.name = name
+		user.email = email
+		user.is_active = is_active
+		user.created_at = created_at
+		user.updated_at = updated_at
+		return user
 
 	def change_email(self, new_email: Email) -> None:
 		"""Change user email address.
@@ -50,8 +102,7 @@ class User:
 		Raises:
 		        ValueError: If name is empty or whitespace only
 		"""
-		if not new_name or not new_name.strip():
-			raise ValueError("Name cannot be empty")
+		validate_name(new_name)
 		self.name = new_name
 
 	def __str__(self) -> str:
@@ -0,0 +1,19 @@
+"""Domain exceptions."""
+
+
+class UserNotFoundError(ValueError):
+	"""Raised when a user does not exist."""
+
+	def __init__(self, user_id: int) -> None:
+		"""Initialize error for the missing user ID."""
+		super().__init__(f"User with id {user_id} not found")
+		self.user_id = user_id
+
+
+class EmailAlreadyExistsError(ValueError):
+	"""Raised when an email address is already used by another user."""
+
+	def __init__(self, email: str) -> None:
+		"""Initialize error for the taken email address."""
+		super().__init__(f"User with email {email} already exists")
+		self.email = email
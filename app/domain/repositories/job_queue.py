@@ -0,0 +1,33 @@
+"""Background job queue interface."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any
+
+
+class JobQueue(ABC):
+	"""Queue of work to run outside the request, by a separate worker process.
+
+	Enqueued jobs are staged like other writes of the owning ``UnitOfWork``, so
+	a job is only ever run if the changes it was enqueued with were committed.
+	"""
+
+	@abstractmethod
+	async def enqueue(
+		self,
+		kind: str,
+		payload: dict[str, Any],
+		run_at: datetime | None = None,
+		max_attempts: int | None = None,
+	) -> int:
+		"""Stage a job for the worker.
+
+		Args:
+		        kind: Name of the handler that runs the job
+		        payload: JSON-serializable arguments of the handler
+		        run_at: Earliest time to run the job, now if None
+		        max_attempts: Runs before the job is given up, the queue's default if None
+
+		Returns:
+		        Job identifier
+		"""
@@ -0,0 +1,42 @@
+"""Unit of work interface."""
+
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import Self
+
+from app.domain.repositories.job_queue import JobQueue
+from app.domain.repositories.user_repository import UserRepository
+
+
+class UnitOfWork(ABC):
+	"""Unit of work grouping repository changes into one atomic transaction.
+
+	Repositories obtained from a unit of work only stage their writes. Nothing
+	is persisted until ``commit`` is called, and leaving the context with an
+	exception rolls staged changes back.
+	"""
+
+	users: UserRepository
+	jobs: JobQueue
+
+	async def __aenter__(self) -> Self:
+		"""Enter the unit of work."""
+		return self
+
+	async def __aexit__(
+		self,
+		exc_type: type[BaseException] | None,
+		exc: BaseException | None,
+		traceback: TracebackType | None,
+	) -> None:
+		"""Roll back staged changes if the block raised."""
+		if exc_type is not None:
+			await self.rollback()
+
+	@abstractmethod
+	async def commit(self) -> None:
+		"""Persist all staged changes atomically."""
+
+	@abstractmethod
+	async def rollback(self) -> None:
+		"""Discard all staged changes."""
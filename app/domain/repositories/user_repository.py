@@ -1,12 +1,76 @@
 """User repository interface."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
 
 from app.domain.entities.user import User
+from app.domain.value_objects.page_cursor import PageCursor, SearchCursor
+
+
+class CountMode(StrEnum):
+	"""How a user count trades accuracy for cost."""
+
+	# Full count of every row, cost grows with the table
+	EXACT = "exact"
+	# Planner statistics, near free but only as fresh as the last ANALYZE
+	ESTIMATED = "estimated"
+	# Exact count reused until its TTL expires
+	CACHED = "cached"
+
+
+@dataclass
+class UserPage:
+	"""A page of users returned by keyset pagination."""
+
+	users: list[User]
+	next_cursor: PageCursor | None = None
+
+
+@dataclass
+class UserSearchPage:
+	"""A page of search results, best matches first."""
+
+	users: list[User]
+	next_cursor: SearchCursor | None = None
+
+
+@dataclass(frozen=True)
+class UserWatermark:
+	"""Cheap summary of the users table that changes whenever a user is created or updated.
+
+	Deletes don't move it; pair it with a count to notice them.
+	"""
+
+	# Highest user ID, None while there are no users
+	last_id: int | None
+	# Latest updated_at, None while no user was ever updated
+	last_updated_at: datetime | None
+
+
+@dataclass(frozen=True)
+class UserFilter:
+	"""Conditions selecting users for set-based operations; all given conditions must hold."""
+
+	is_active: bool | None = None
+	created_before: datetime | None = None
+	# Last change is updated_at, or created_at for users never updated
+	changed_before: datetime | None = None
+
+	@property
+	def is_empty(self) -> bool:
+		"""Whether no condition is set, which would select every user."""
+		return self.is_active is None and self.created_before is None and self.changed_before is None
 
 
 class UserRepository(ABC):
-	"""User repository interface defining data access operations."""
+	"""User repository interface defining data access operations.
+
+	Writes are staged in the current transaction; the owning ``UnitOfWork``
+	commits them.
+	"""
 
 	@abstractmethod
 	async def get_by_id(self, user_id: int) -> User | None:
@@ -19,6 +83,25 @@ class UserRepository(ABC):
 		        User entity if found, None otherwise
 		"""
 
+	@abstractmethod
+	async def get_last_modified(self, user_id: int) -> datetime | None:
+		"""Get when a user last changed, without loading the user.
+
+		Args:
+		        user_id: User identifier
+
+		Returns:
+		        Update time, or creation time if never updated; None if not found
+		"""
+
+	@abstractmethod
+	async def get_watermark(self) -> UserWatermark:
+		"""Summarize the users table for change detection, without loading users.
+
+		Returns:
+		        Highest user ID and the latest update time
+		"""
+
 	@abstractmethod
 	async def get_by_email(self, email: str) -> User | None:
 		"""Get user by email address.
@@ -30,9 +113,31 @@ class UserRepository(ABC):
 		        User entity if found, None otherwise
 		"""
 
+	@abstractmethod
+	async def get_many_by_ids(self, user_ids: list[int]) -> list[User]:
+		"""Get users by ID in one query.
+
+		Args:
+		        user_ids: User identifiers
+
+		Returns:
+		        Users found, in no particular order; unknown IDs are left out
+		"""
+
+	@abstractmethod
+	async def get_many_by_emails(self, emails: list[str]) -> list[User]:
+		"""Get users by email address in one query.
+
+		Args:
+		        emails: Email addresses
+
+		Returns:
+		        Users found, in no particular order; unknown addresses are left out
+		"""
+
 	@abstractmethod
 	async def list_all(self, skip: int = 0, limit: int = 100) -> list[User]:
-		"""List all users with pagination.
+		"""List all users with offset pagination ordered by ``(created_at, id)``.
 
 		Args:
 		        skip: Number of records to skip
@@ -42,6 +147,73 @@ class UserRepository(ABC):
 		        List of user entities
 		"""
 
+	@abstractmethod
+	async def list_page(self, limit: int = 100, cursor: PageCursor | None = None) -> UserPage:
+		"""List users with keyset pagination ordered by ``(created_at, id)``.
+
+		Unlike ``list_all``, the cost of a page does not grow with its depth.
+
+		Args:
+		        limit: Maximum number of records to return
+		        cursor: Cursor of the last row of the previous page, None for the first page
+
+		Returns:
+		        Page of user entities with the cursor for the next page, if any
+		"""
+
+	@abstractmethod
+	def stream_all(self, batch_size: int = 1000) -> AsyncIterator[User]:
+		"""Stream all users ordered by ``(created_at, id)``.
+
+		Rows are fetched in batches from a server-side cursor, so memory use does
+		not depend on the number of users.
+
+		Args:
+		        batch_size: Number of rows fetched per round trip
+
+		Returns:
+		        Async iterator of user entities
+		"""
+
+	@abstractmethod
+	async def search(self, query: str, limit: int = 20, cursor: SearchCursor | None = None) -> UserSearchPage:
+		"""Search users by partial name or email, or by whole words of either.
+
+		Args:
+		        query: Search text
+		        limit: Maximum number of records to return
+		        cursor: Cursor of the last row of the previous page, None for the first page
+
+		Returns:
+		        Page of matching user entities ordered by similarity to the query,
+		        with the cursor for the next page, if any
+		"""
+
+	@abstractmethod
+	async def count(self, mode: CountMode = CountMode.EXACT) -> int:
+		"""Count all users.
+
+		Args:
+		        mode: Counting strategy
+
+		Returns:
+		        Total number of users, approximate unless mode is EXACT
+		"""
+
+	@abstractmethod
+	async def create(self, user: User) -> User | None:
+		"""Create a new user unless the email is already taken.
+
+		The uniqueness check and the insert are a single atomic statement, so
+		concurrent signups with the same email cannot both succeed.
+
+		Args:
+		        user: New user entity
+
+		Returns:
+		        Created user entity with ID assigned, None if the email already exists
+		"""
+
 	@abstractmethod
 	async def save(self, user: User) -> User:
 		"""Save user (create or update).
@@ -53,6 +225,34 @@ class UserRepository(ABC):
 		        Saved user entity with ID assigned
 		"""
 
+	@abstractmethod
+	async def update_fields(self, user_id: int, **changes: object) -> User | None:
+		"""Update only the given columns of a user.
+
+		Args:
+		        user_id: User identifier
+		        **changes: New values by field name (name, email, is_active)
+
+		Returns:
+		        Updated user entity, None if not found
+
+		Raises:
+		        EmailAlreadyExistsError: If the new email is used by another user
+		"""
+
+	@abstractmethod
+	async def save_many(self, users: list[User]) -> list[User]:
+		"""Create new users in a single transaction.
+
+		Users whose email is already taken are skipped rather than raising.
+
+		Args:
+		        users: New user entities, with unique emails
+
+		Returns:
+		        Created user entities with IDs assigned, in no particular order
+		"""
+
 	@abstractmethod
 	async def delete(self, user_id: int) -> bool:
 		"""Delete user by ID.
@@ -64,6 +264,56 @@ class UserRepository(ABC):
 		        True if user was deleted, False if not found
 		"""
 
+	@abstractmethod
+	async def deactivate_many(self, user_ids: list[int]) -> list[int]:
+		"""Deactivate users by ID with a single statement.
+
+		Args:
+		        user_ids: User identifiers
+
+		Returns:
+		        IDs of users that were deactivated; missing and already inactive users are left out
+		"""
+
+	@abstractmethod
+	async def deactivate_where(self, user_filter: UserFilter) -> list[int]:
+		"""Deactivate all active users matching a filter with a single statement.
+
+		Args:
+		        user_filter: Conditions the users must match
+
+		Returns:
+		        IDs of users that were deactivated
+
+		Raises:
+		        ValueError: If the filter has no conditions
+		"""
+
+	@abstractmethod
+	async def delete_many(self, user_ids: list[int]) -> list[int]:
+		"""Delete users by ID with a single statement.
+
+		Args:
+		        user_ids: User identifiers
+
+		Returns:
+		        IDs of users that were deleted; missing users are left out
+		"""
+
+	@abstractmethod
+	async def delete_where(self, user_filter: UserFilter) -> list[int]:
+		"""Delete all users matching a filter with a single statement.
+
+		Args:
+		        user_filter: Conditions the users must match
+
+		Returns:
+		        IDs of users that were deleted
+
+		Raises:
+		        ValueError: If the filter has no conditions
+		"""
+
 	@abstractmethod
 	async def exists_by_email(self, email: str) -> bool:
 		"""Check if user exists by email.
@@ -3,19 +3,39 @@
 import re
 from dataclasses import dataclass
 
+EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
 
-@dataclass(frozen=True)
+# Longest address the users table stores
+MAX_EMAIL_LENGTH = 255
+
+
+@dataclass(frozen=True, slots=True)
 class Email:
 	"""Email value object - immutable."""
 
 	value: str
 
 	def __post_init__(self) -> None:
-		"""Validate email format."""
-		pattern = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
-		if not re.match(pattern, self.value):
+		"""Validate email length and format."""
+		if len(self.value) > MAX_EMAIL_LENGTH:
+			raise ValueError(f"Email cannot be longer than {MAX_EMAIL_LENGTH} characters")
+		if not EMAIL_PATTERN.match(self.value):
 			raise ValueError(f"Invalid email format: {self.value}")
 
+	@classmethod
+	def trusted(cls, value: str) -> "Email":
+		"""Create Email from an already validated address, skipping the format check.
+
+		Args:
+		        value: Email address validated when it was stored
+
+		Returns:
+		        Email instance
+		"""
+		email = object.__new__(cls)
+		object.__setattr__(email, "value", value)
+		return email
+
 	def __str__(self) -> str:
 		"""String representation."""
 		return self.value
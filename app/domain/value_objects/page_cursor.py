@@ -0,0 +1,98 @@
+"""Page cursor value objects."""
+
+import base64
+import binascii
+import json
+import operator
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+
+def _encode_token(values: list[Any]) -> str:
+	"""Encode JSON values as an opaque URL-safe token."""
+	raw = json.dumps(values, separators=(",", ":"))
+	return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_token(token: str) -> Any:
+	"""Decode the JSON values of an opaque token."""
+	return json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+
+
+@dataclass(frozen=True)
+class PageCursor:
+	"""Keyset pagination cursor - immutable.
+
+	Points at the last row of a page by its ``(created_at, id)`` sort key, so the
+	next page can be fetched with a range condition instead of an ``OFFSET``.
+	"""
+
+	created_at: datetime
+	id: int
+
+	def encode(self) -> str:
+		"""Encode cursor as an opaque URL-safe token.
+
+		Returns:
+		        Opaque cursor token
+		"""
+		return _encode_token([self.created_at.isoformat(), self.id])
+
+	@classmethod
+	def decode(cls, token: str) -> "PageCursor":
+		"""Decode an opaque cursor token.
+
+		Args:
+		        token: Cursor token produced by ``encode``
+
+		Returns:
+		        Decoded page cursor
+
+		Raises:
+		        ValueError: If the token is malformed
+		"""
+		try:
+			created_at, user_id = _decode_token(token)
+			return cls(created_at=datetime.fromisoformat(created_at), id=operator.index(user_id))
+		except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+			raise ValueError(f"Invalid cursor: {token}") from e
+
+
+@dataclass(frozen=True)
+class SearchCursor:
+	"""Search results cursor - immutable.
+
+	Points at the last row of a page of search results by its ``(score, id)``
+	sort key, best score first.
+	"""
+
+	score: float
+	id: int
+
+	def encode(self) -> str:
+		"""Encode cursor as an opaque URL-safe token.
+
+		Returns:
+		        Opaque cursor token
+		"""
+		return _encode_token([self.score, self.id])
+
+	@classmethod
+	def decode(cls, token: str) -> "SearchCursor":
+		"""Decode an opaque cursor token.
+
+		Args:
+		        token: Cursor token produced by ``encode``
+
+		Returns:
+		        Decoded search cursor
+
+		Raises:
+		        ValueError: If the token is malformed
+		"""
+		try:
+			score, user_id = _decode_token(token)
+			return cls(score=float(score), id=operator.index(user_id))
+		except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+			raise ValueError(f"Invalid cursor: {token}") from e
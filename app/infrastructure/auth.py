@@ -0,0 +1,299 @@
+"""OAuth2 bearer token verification against Authelia."""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+import httpx
+from jose import JWTError, jwt
+
+from app.infrastructure.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# Asymmetric only, so a public key can never be used as an HMAC secret
+JWT_ALGORITHMS = ["RS256", "PS256", "ES256"]
+
+# Lifetime of cached introspection results for inactive tokens
+INACTIVE_TOKEN_TTL = 10.0
+
+# Dots in a compact JWS: header.payload.signature
+JWT_SEPARATORS = 2
+
+_MISSING = object()
+
+
+class InvalidTokenError(ValueError):
+	"""Raised when a bearer token is malformed, expired, revoked or not meant for us."""
+
+
+class AuthProviderUnavailableError(RuntimeError):
+	"""Raised when a token can't be verified because the provider can't be reached."""
+
+
+@dataclass(frozen=True, slots=True)
+class AccessToken:
+	"""Verified access token."""
+
+	subject: str
+	scopes: frozenset[str]
+	expires_at: datetime | None
+	claims: dict[str, Any] = field(compare=False, repr=False)
+
+	@classmethod
+	def from_claims(cls, claims: dict[str, Any]) -> "AccessToken":
+		"""Create from JWT claims or an introspection response."""
+		scopes = claims.get("scope", claims.get("scp", ""))
+		exp = claims.get("exp")
+		return cls(
+			subject=str(claims.get("sub", "")),
+			scopes=frozenset(scopes.split() if isinstance(scopes, str) else scopes),
+			expires_at=datetime.fromtimestamp(exp, UTC) if exp is not None else None,
+			claims=claims,
+		)
+
+
+def _json_object(body: Any) -> dict[str, Any]:
+	"""Check that a decoded JSON body is an object.
+
+	Raises:
+	        TypeError: If it is anything else
+	"""
+	if not isinstance(body, dict):
+		raise TypeError(f"Expected a JSON object, got {type(body).__name__}")
+	return body
+
+
+def _index_keys(body: Any) -> dict[str, dict[str, Any]]:
+	"""Index the keys of a JWKS document by key ID.
+
+	Raises:
+	        TypeError: If the document is malformed
+	"""
+	keys = _json_object(body).get("keys")
+	if not isinstance(keys, list):
+		raise TypeError("JWKS has no list of keys")
+	return {key.get("kid", ""): key for key in map(_json_object, keys)}
+
+
+class JWKSCache:
+	"""Signing keys of the provider, cached and refreshed on lookup.
+
+	Keys are refetched after ``ttl`` seconds, or earlier when a token names a key
+	we don't have, as after a key rotation; the latter at most every
+	``min_refresh_interval`` seconds so forged key IDs can't flood the provider.
+	Concurrent lookups share one fetch. When a refresh fails the previous keys
+	stay in use. While no keys could be fetched yet, a failed fetch is not
+	retried for ``min_refresh_interval`` seconds either, and lookups meanwhile
+	fail straight away.
+	"""
+
+	def __init__(
+		self,
+		client: httpx.AsyncClient,
+		url: str,
+		ttl: float = 3600.0,
+		min_refresh_interval: float = 30.0,
+		clock: Callable[[], float] = time.monotonic,
+	) -> None:
+		"""Initialize cache.
+
+		Args:
+		        client: Pooled HTTP client
+		        url: JWKS endpoint
+		        ttl: Seconds before keys are refetched
+		        min_refresh_interval: Minimum seconds between fetches for unknown key IDs
+		        clock: Monotonic time source in seconds
+		"""
+		self.client = client
+		self.url = url
+		self.ttl = ttl
+		self.min_refresh_interval = min_refresh_interval
+		self._clock = clock
+		self._keys: dict[str, dict[str, Any]] | None = None
+		self._fetched_at = 0.0
+		self._failed = False
+		self._refresh_task: asyncio.Task[None] | None = None
+
+	async def get(self, kid: str | None) -> dict[str, Any] | None:
+		"""Get the JWK with the given key ID.
+
+		Args:
+		        kid: Key ID from the token header
+
+		Returns:
+		        JWK, None when the provider has no such key
+
+		Raises:
+		        AuthProviderUnavailableError: If no keys could ever be fetched
+		"""
+		age = self._clock() - self._fetched_at
+		keys = self._keys
+		if keys is None and self._failed and age < self.min_refresh_interval:
+			raise AuthProviderUnavailableError("Could not fetch signing keys")
+		if keys is None or age >= self.ttl or (kid not in keys and age >= self.min_refresh_interval):
+			await self._refresh()
+		return (self._keys or {}).get(kid or "")
+
+	async def _refresh(self) -> None:
+		"""Fetch keys, sharing one fetch between concurrent callers."""
+		if self._refresh_task is None:
+			self._refresh_task = asyncio.create_task(self._fetch())
+		await asyncio.shield(self._refresh_task)
+
+	async def _fetch(self) -> None:
+		"""Fetch and index keys by key ID."""
+		try:
+			response = await self.client.get(self.url)
+			response.raise_for_status()
+			keys = _index_keys(response.json())
+		except (httpx.HTTPError, ValueError, TypeError) as e:
+			if self._keys is None:
+				self._failed = True
+				raise AuthProviderUnavailableError("Could not fetch signing keys") from e
+			logger.warning("Could not refresh signing keys, keeping the previous ones", exc_info=True)
+		else:
+			self._keys = keys
+			self._failed = False
+		finally:
+			self._fetched_at = self._clock()
+			self._refresh_task = None
+
+
+class TokenVerifier:
+	"""Verifies bearer tokens without a provider round trip per request.
+
+	JWTs are verified locally against the provider's cached signing keys. Opaque
+	tokens are introspected, and the outcome cached until the token expires, at
+	most ``max_cache_seconds`` so revocations are seen eventually. Concurrent
+	requests with the same opaque token share one introspection.
+	"""
+
+	def __init__(
+		self,
+		client: httpx.AsyncClient,
+		jwks: JWKSCache,
+		introspection_url: str,
+		client_id: str,
+		client_secret: str,
+		issuer: str,
+		audience: str,
+		cache_size: int = 10_000,
+		max_cache_seconds: float = 300.0,
+		clock: Callable[[], float] = time.time,
+	) -> None:
+		"""Initialize verifier.
+
+		Args:
+		        client: Pooled HTTP client
+		        jwks: Signing keys of the provider
+		        introspection_url: Token introspection endpoint
+		        client_id: Client ID authenticating introspection requests
+		        client_secret: Client secret authenticating introspection requests
+		        issuer: Expected issuer of JWTs
+		        audience: Expected audience of JWTs
+		        cache_size: Maximum number of cached introspection results
+		        max_cache_seconds: Longest time an introspection result is reused
+		        clock: Wall clock in epoch seconds, compared with token expiry
+		"""
+		self.client = client
+		self.jwks = jwks
+		self.introspection_url = introspection_url
+		self.client_id = client_id
+		self.client_secret = client_secret
+		self.issuer = issuer
+		self.audience = audience
+		self.max_cache_seconds = max_cache_seconds
+		self._clock = clock
+		self._introspected: LRUCache[str, AccessToken | None] = LRUCache(
+			max_size=cache_size, ttl=max_cache_seconds, clock=clock
+		)
+		self._inflight: dict[str, asyncio.Task[AccessToken | None]] = {}
+
+	async def verify(self, token: str) -> AccessToken:
+		"""Verify a bearer token.
+
+		Args:
+		        token: Bearer token from the Authorization header
+
+		Returns:
+		        Verified token
+
+		Raises:
+		        InvalidTokenError: If the token is not valid
+		        AuthProviderUnavailableError: If the provider is needed but unreachable
+		"""
+		if token.count(".") == JWT_SEPARATORS:
+			return await self._verify_jwt(token)
+		return await self._verify_opaque(token)
+
+	async def _verify_jwt(self, token: str) -> AccessToken:
+		"""Check signature, expiry, issuer and audience of a JWT locally."""
+		try:
+			header = jwt.get_unverified_header(token)
+		except JWTError as e:
+			raise InvalidTokenError("Malformed token") from e
+		key = await self.jwks.get(header.get("kid"))
+		if key is None:
+			raise InvalidTokenError("Token signed with an unknown key")
+		try:
+			claims = jwt.decode(
+				token,
+				key,
+				algorithms=JWT_ALGORITHMS,
+				audience=self.audience,
+				issuer=self.issuer,
+				options={"require_exp": True, "require_aud": True, "require_iss": True},
+			)
+		except JWTError as e:
+			raise InvalidTokenError(str(e)) from e
+		return AccessToken.from_claims(claims)
+
+	async def _verify_opaque(self, token: str) -> AccessToken:
+		"""Introspect an opaque token, reusing cached and in-flight results."""
+		# Keyed by digest, so the cache never holds usable tokens
+		key = hashlib.sha256(token.encode()).hexdigest()
+		result = self._introspected.get(key, _MISSING)
+		if result is _MISSING:
+			task = self._inflight.get(key)
+			if task is None:
+				task = asyncio.create_task(self._introspect(key, token))
+				self._inflight[key] = task
+			result = await asyncio.shield(task)
+		if not isinstance(result, AccessToken):
+			raise InvalidTokenError("Token is not active")
+		return result
+
+	def _cache(self, key: str, result: AccessToken | None) -> None:
+		"""Cache an introspection result until the token expires."""
+		if result is None:
+			self._introspected.set(key, None, ttl=INACTIVE_TOKEN_TTL)
+			return
+		ttl = self.max_cache_seconds
+		if result.expires_at is not None:
+			ttl = min(ttl, result.expires_at.timestamp() - self._clock())
+		if ttl > 0:
+			self._introspected.set(key, result, ttl=ttl)
+
+	async def _introspect(self, key: str, token: str) -> AccessToken | None:
+		"""Ask the provider about a token and cache the answer, None when it is not active."""
+		try:
+			response = await self.client.post(
+				self.introspection_url,
+				data={"token": token, "token_type_hint": "access_token"},
+				auth=(self.client_id, self.client_secret),
+			)
+			response.raise_for_status()
+			claims = _json_object(response.json())
+		except (httpx.HTTPError, ValueError, TypeError) as e:
+			raise AuthProviderUnavailableError("Could not introspect token") from e
+		finally:
+			self._inflight.pop(key, None)
+		result = AccessToken.from_claims(claims) if claims.get("active") else None
+		self._cache(key, result)
+		return result
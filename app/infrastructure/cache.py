@@ -0,0 +1,72 @@
+"""In-process caching primitives."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+
+class LRUCache[K, V]:
+	"""Bounded least-recently-used cache whose entries expire after a TTL.
+
+	Not thread-safe; meant to be shared between coroutines of one event loop.
+	"""
+
+	def __init__(self, max_size: int, ttl: float, clock: Callable[[], float] = time.monotonic) -> None:
+		"""Initialize cache.
+
+		Args:
+		        max_size: Maximum number of entries kept
+		        ttl: Default entry lifetime in seconds
+		        clock: Monotonic time source in seconds
+		"""
+		self.max_size = max_size
+		self.ttl = ttl
+		self.evictions = 0
+		self._clock = clock
+		self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+	def get[D](self, key: K, default: D) -> V | D:
+		"""Get a live entry and mark it as recently used.
+
+		Args:
+		        key: Entry key
+		        default: Value returned when the key is absent or expired
+
+		Returns:
+		        Cached value, or default
+		"""
+		entry = self._entries.get(key)
+		if entry is None:
+			return default
+		expires_at, value = entry
+		if expires_at <= self._clock():
+			del self._entries[key]
+			return default
+		self._entries.move_to_end(key)
+		return value
+
+	def set(self, key: K, value: V, ttl: float | None = None) -> None:
+		"""Store an entry, evicting the least recently used one when full.
+
+		Args:
+		        key: Entry key
+		        value: Value to cache
+		        ttl: Entry lifetime in seconds, defaults to the cache TTL
+		"""
+		self._entries[key] = (self._clock() + (self.ttl if ttl is None else ttl), value)
+		self._entries.move_to_end(key)
+		while len(self._entries) > self.max_size:
+			self._entries.popitem(last=False)
+			self.evictions += 1
+
+	def delete(self, key: K) -> None:
+		"""Remove an entry if present."""
+		self._entries.pop(key, None)
+
+	def clear(self) -> None:
+		"""Remove all entries."""
+		self._entries.clear()
+
+	def __len__(self) -> int:
+		"""Number of stored entries, including expired ones not yet purged."""
+		return len(self._entries)
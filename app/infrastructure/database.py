@@ -1,15 +1,109 @@
 """Database configuration and session management."""
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy import make_url
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import settings
+from app.infrastructure.health import DatabaseCheck
+from app.infrastructure.pool import InstrumentedAsyncAdaptedQueuePool, register_pool_gauges
+from app.infrastructure.replicas import ReplicaRouter
+from app.infrastructure.slow_queries import SlowQueryLog
+
+logger = logging.getLogger(__name__)
+
+
+def _connect_args(url: str) -> dict[str, Any]:
+	"""Driver arguments for new connections to ``url``."""
+	connect_args: dict[str, Any] = {}
+	if make_url(url).get_driver_name() == "asyncpg":
+		# Set to 0 behind transaction-pooling pgbouncer, which can't keep prepared statements
+		connect_args["prepared_statement_cache_size"] = settings.db_statement_cache_size
+	return connect_args
+
+
+def build_engine(url: str) -> AsyncEngine:
+	"""Create an async engine with the configured pool settings.
+
+	Args:
+	        url: Database URL
+
+	Returns:
+	        Async engine
+	"""
+	return create_async_engine(
+		url,
+		echo=settings.db_echo,
+		future=True,
+		poolclass=InstrumentedAsyncAdaptedQueuePool,
+		pool_size=settings.db_pool_size,
+		max_overflow=settings.db_max_overflow,
+		pool_timeout=settings.db_pool_timeout_seconds,
+		pool_recycle=settings.db_pool_recycle_seconds,
+		pool_pre_ping=settings.db_pool_pre_ping,
+		connect_args=_connect_args(url),
+	)
+
+
+def build_probe_engine(url: str) -> AsyncEngine:
+	"""Create an engine keeping a single connection for health checks.
+
+	Checks on it don't queue behind requests for the application's pool, so
+	a saturated pool isn't mistaken for an unreachable database.
+
+	Args:
+	        url: Database URL
+
+	Returns:
+	        Async engine
+	"""
+	return create_async_engine(
+		url,
+		poolclass=AsyncAdaptedQueuePool,
+		pool_size=1,
+		max_overflow=0,
+		pool_recycle=settings.db_pool_recycle_seconds,
+		connect_args=_connect_args(url),
+	)
+
 
 # Create async engine
-engine = create_async_engine(
-	settings.database_url,
-	echo=settings.debug,
-	future=True,
+engine = build_engine(settings.database_url)
+
+# Read replicas, used for reads that don't need to see the request's own writes
+replica_engines = {f"replica-{i}": build_engine(url) for i, url in enumerate(settings.database_replica_urls)}
+replica_router = ReplicaRouter(
+	replica_engines,
+	check_interval=settings.db_replica_check_interval_seconds,
+	check_timeout=settings.db_replica_check_timeout_seconds,
+)
+
+register_pool_gauges({"primary": engine, **replica_engines})
+
+# Slow statements of this worker, with EXPLAIN plans for a sample of slow reads
+slow_query_log = SlowQueryLog(
+	threshold_seconds=settings.slow_query_threshold_ms / 1000,
+	explain_sample_rate=settings.slow_query_explain_sample_rate,
+	explain_analyze=settings.slow_query_explain_analyze,
+	explain_timeout_seconds=settings.slow_query_explain_timeout_ms / 1000,
+	max_entries=settings.slow_query_log_size,
+)
+if settings.slow_query_log_enabled:
+	for name, instrumented in {"primary": engine, **replica_engines}.items():
+		slow_query_log.attach(name, instrumented)
+
+# Primary reachability behind the readiness probe, checked apart from the request pool
+probe_engine = build_probe_engine(settings.database_url)
+database_check = DatabaseCheck(
+	probe_engine,
+	ttl=settings.readiness_cache_seconds,
+	timeout=settings.readiness_timeout_seconds,
 )
 
 # Create async session factory
@@ -29,6 +123,62 @@ async def init_db() -> None:
 		await conn.run_sync(Base.metadata.create_all)
 
 
+async def prewarm_pool(
+	target: AsyncEngine,
+	connections: int,
+	warm_up: Callable[[AsyncSession], Awaitable[None]] | None = None,
+) -> None:
+	"""Open pooled connections ahead of traffic.
+
+	All connections are held at once, so the pool keeps that many distinct
+	connections, and each runs ``warm_up`` to prepare its hot statements.
+	Every connection that opened is returned to the pool, even when others
+	failed to open or warm up; the first failure is then raised.
+
+	Args:
+	        target: Engine whose pool to fill
+	        connections: Connections to open, at most the pool size to keep them all
+	        warm_up: Statements to run on every new connection
+	"""
+
+	async def warm(connection: AsyncConnection) -> None:
+		if warm_up is not None:
+			async with AsyncSession(bind=connection) as session:
+				await warm_up(session)
+
+	connected = await asyncio.gather(*(target.connect().start() for _ in range(connections)), return_exceptions=True)
+	opened = [result for result in connected if isinstance(result, AsyncConnection)]
+	try:
+		# Connections are only given back once every warm-up stopped using them
+		warmed = await asyncio.gather(*(warm(connection) for connection in opened), return_exceptions=True)
+	finally:
+		for connection in opened:
+			await connection.close()
+	for result in (*connected, *warmed):
+		if isinstance(result, BaseException):
+			raise result
+
+
+async def open_db(warm_up: Callable[[AsyncSession], Awaitable[None]] | None = None) -> None:
+	"""Fill the primary and replica pools and run the first replica health check.
+
+	Failures are logged, not raised, so the application still starts while the
+	database is down; the readiness probe keeps traffic away until it is back.
+
+	Args:
+	        warm_up: Statements to run on every new connection
+	"""
+	for name, target in {"primary": engine, **replica_engines}.items():
+		try:
+			await prewarm_pool(target, settings.db_pool_size, warm_up)
+		except Exception:
+			logger.warning("Could not prewarm the %s connection pool", name, exc_info=True)
+	if replica_router.enabled:
+		await replica_router.check()
+
+
 async def close_db() -> None:
 	"""Close database connections."""
 	await engine.dispose()
+	await probe_engine.dispose()
+	await replica_router.dispose()
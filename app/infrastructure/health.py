@@ -0,0 +1,72 @@
+"""Database readiness checks."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseCheck:
+	"""Cached reachability check of a database, for readiness probes.
+
+	Probes within ``ttl`` seconds of the last check reuse its outcome and
+	concurrent probes share one check, so frequent probes from several
+	orchestrators don't add database load. Give it an engine of its own, see
+	``build_probe_engine``: on the application's engine, a check waiting for
+	a busy pool times out and reports a healthy database as down.
+	"""
+
+	def __init__(
+		self,
+		engine: AsyncEngine,
+		ttl: float = 2.0,
+		timeout: float = 1.0,
+		clock: Callable[[], float] = time.monotonic,
+	) -> None:
+		"""Initialize check.
+
+		Args:
+		        engine: Engine of the database to check
+		        ttl: Seconds a check outcome is reused
+		        timeout: Seconds before the check fails
+		        clock: Monotonic time source in seconds
+		"""
+		self.engine = engine
+		self.ttl = ttl
+		self.timeout = timeout
+		self._clock = clock
+		self._checked_at: float | None = None
+		self._healthy = False
+		self._check_task: asyncio.Task[bool] | None = None
+
+	async def is_healthy(self) -> bool:
+		"""Whether the database answered a trivial query recently."""
+		if self._checked_at is not None and self._clock() - self._checked_at < self.ttl:
+			return self._healthy
+		if self._check_task is None:
+			self._check_task = asyncio.create_task(self._check())
+		# Shielded, so a probe that disconnects doesn't cancel the check others wait on
+		return await asyncio.shield(self._check_task)
+
+	async def _check(self) -> bool:
+		"""Run a trivial query and record the outcome."""
+		try:
+			async with asyncio.timeout(self.timeout), self.engine.connect() as conn:
+				await conn.execute(text("SELECT 1"))
+		except Exception:
+			if self._healthy:
+				logger.warning("Database failed its readiness check")
+			self._healthy = False
+		else:
+			if not self._healthy:
+				logger.info("Database is ready")
+			self._healthy = True
+		finally:
+			self._checked_at = self._clock()
+			self._check_task = None
+		return self._healthy
@@ -0,0 +1,307 @@
+"""Background job worker claiming jobs from PostgreSQL."""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import Update, delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.infrastructure.models.job import JobModel, JobStatus
+
+logger = logging.getLogger(__name__)
+
+jobs_table = JobModel.__table__
+
+# Longest error message kept on a job row
+MAX_ERROR_LENGTH = 2000
+
+JobHandler = Callable[[dict[str, Any]], Awaitable[None]]
+
+JOBS_CLAIMED = Counter(
+	"jobs_claimed_total",
+	"Jobs claimed by workers",
+	["kind"],
+)
+JOBS_PROCESSED = Counter(
+	"jobs_processed_total",
+	"Job runs by outcome: succeeded, retried or failed",
+	["kind", "outcome"],
+)
+JOB_DURATION = Histogram(
+	"job_duration_seconds",
+	"Time spent running jobs",
+	["kind"],
+	buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0),
+)
+JOB_LAG = Histogram(
+	"job_queue_lag_seconds",
+	"Time jobs waited between becoming runnable and being claimed",
+	["kind"],
+	buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0),
+)
+JOBS_RUNNING = Gauge(
+	"jobs_running",
+	"Jobs currently running in this worker",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Job:
+	"""A job claimed by a worker.
+
+	``attempts`` counts this run and doubles as the claim token: settling the
+	job only takes effect while no other worker claimed it since.
+	"""
+
+	id: int
+	kind: str
+	payload: dict[str, Any]
+	attempts: int
+	max_attempts: int
+	lag_seconds: float = 0.0
+
+
+def retry_delay(attempts: int, base: float, maximum: float) -> float:
+	"""Delay before retrying a job, doubling with each failed run.
+
+	Args:
+	        attempts: Runs so far, including the one that failed
+	        base: Delay after the first failure in seconds
+	        maximum: Longest delay in seconds
+
+	Returns:
+	        Seconds to wait
+	"""
+	return float(min(maximum, base * 2 ** (attempts - 1)))
+
+
+class JobStore:
+	"""Claims and settles jobs, each operation in a short transaction of its own."""
+
+	def __init__(self, sessionmaker: async_sessionmaker[AsyncSession]) -> None:
+		"""Initialize store.
+
+		Args:
+		        sessionmaker: Session factory for the primary database
+		"""
+		self.sessionmaker = sessionmaker
+
+	@staticmethod
+	def claim_statement(limit: int, visibility_timeout: float) -> Update:
+		"""Build the statement claiming up to ``limit`` runnable jobs, oldest first.
+
+		``FOR UPDATE SKIP LOCKED`` lets concurrent workers claim disjoint batches
+		without waiting on each other. Claimed jobs stay invisible to other
+		workers for ``visibility_timeout`` seconds; running jobs whose timeout
+		passed, as after a worker crash, are claimed again.
+		"""
+		claimable = (
+			select(jobs_table.c.id, jobs_table.c.run_at)
+			.where(jobs_table.c.status.in_([JobStatus.QUEUED, JobStatus.RUNNING]), jobs_table.c.run_at <= func.now())
+			.order_by(jobs_table.c.run_at)
+			.limit(limit)
+			.with_for_update(skip_locked=True)
+			.cte("claimable")
+		)
+		return (
+			update(jobs_table)
+			.where(jobs_table.c.id == claimable.c.id)
+			.values(
+				status=JobStatus.RUNNING,
+				attempts=jobs_table.c.attempts + 1,
+				run_at=func.now() + timedelta(seconds=visibility_timeout),
+			)
+			.returning(
+				jobs_table.c.id,
+				jobs_table.c.kind,
+				jobs_table.c.payload,
+				jobs_table.c.attempts,
+				jobs_table.c.max_attempts,
+				func.extract("epoch", func.now() - claimable.c.run_at),
+			)
+		)
+
+	async def claim(self, limit: int, visibility_timeout: float) -> list[Job]:
+		"""Claim up to ``limit`` runnable jobs for ``visibility_timeout`` seconds."""
+		async with self.sessionmaker.begin() as session:
+			result = await session.execute(self.claim_statement(limit, visibility_timeout))
+			return [
+				Job(id=row[0], kind=row[1], payload=row[2], attempts=row[3], max_attempts=row[4], lag_seconds=float(row[5]))
+				for row in result
+			]
+
+	async def complete(self, job: Job) -> None:
+		"""Delete a job that succeeded."""
+		await self._settle(delete(jobs_table).where(*self._claimed_by(job)))
+
+	async def retry(self, job: Job, delay: float, error: str) -> None:
+		"""Queue a failed job again after ``delay`` seconds."""
+		await self._settle(
+			update(jobs_table)
+			.where(*self._claimed_by(job))
+			.values(
+				status=JobStatus.QUEUED,
+				run_at=func.now() + timedelta(seconds=delay),
+				last_error=error[:MAX_ERROR_LENGTH],
+			)
+		)
+
+	async def fail(self, job: Job, error: str) -> None:
+		"""Give a job up, keeping it with its last error for inspection."""
+		await self._settle(
+			update(jobs_table).where(*self._claimed_by(job)).values(status=JobStatus.FAILED, last_error=error[:MAX_ERROR_LENGTH])
+		)
+
+	async def _settle(self, statement: Any) -> None:
+		"""Run a statement settling a job in its own transaction."""
+		async with self.sessionmaker.begin() as session:
+			await session.execute(statement)
+
+	@staticmethod
+	def _claimed_by(job: Job) -> tuple[Any, ...]:
+		"""Conditions matching a job only while it is still claimed by this run."""
+		return (
+			jobs_table.c.id == job.id,
+			jobs_table.c.status == JobStatus.RUNNING,
+			jobs_table.c.attempts == job.attempts,
+		)
+
+
+class JobWorker:
+	"""Runs claimed jobs concurrently with their handlers.
+
+	Claims as many jobs as there are free slots, polling when the queue is
+	empty. A failing job is retried with exponential backoff until it used up
+	its attempts, then kept as failed. A run outlasting the visibility timeout
+	is cancelled and counts as failed, as another worker may claim the job by
+	then. Jobs of unknown kinds fail right away.
+	"""
+
+	def __init__(
+		self,
+		store: JobStore,
+		handlers: Mapping[str, JobHandler],
+		concurrency: int = 10,
+		visibility_timeout: float = 300.0,
+		poll_interval: float = 1.0,
+		retry_base_delay: float = 5.0,
+		retry_max_delay: float = 3600.0,
+	) -> None:
+		"""Initialize worker.
+
+		Args:
+		        store: Job storage
+		        handlers: Handler of each job kind, called with the job payload
+		        concurrency: Jobs run at the same time
+		        visibility_timeout: Seconds a claimed job is hidden from other workers
+		        poll_interval: Seconds between claims while the queue is empty
+		        retry_base_delay: Seconds before the first retry of a failed job
+		        retry_max_delay: Longest delay between retries in seconds
+		"""
+		self.store = store
+		self.handlers = handlers
+		self.concurrency = concurrency
+		self.visibility_timeout = visibility_timeout
+		self.poll_interval = poll_interval
+		self.retry_base_delay = retry_base_delay
+		self.retry_max_delay = retry_max_delay
+
+	async def run(self, stop: asyncio.Event) -> None:
+		"""Claim and run jobs until ``stop`` is set, then wait for running jobs to finish.
+
+		Args:
+		        stop: Set to shut down gracefully
+		"""
+		running: set[asyncio.Task[None]] = set()
+		while not stop.is_set():
+			free = self.concurrency - len(running)
+			if not free:
+				await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+				continue
+
+			jobs = await self._claim(free)
+			for job in jobs:
+				task = asyncio.create_task(self.process(job))
+				running.add(task)
+				task.add_done_callback(running.discard)
+			if len(jobs) < free:
+				# Queue drained, or the database is unreachable
+				with contextlib.suppress(TimeoutError):
+					async with asyncio.timeout(self.poll_interval):
+						await stop.wait()
+
+		if running:
+			logger.info("Waiting for %d running jobs to finish", len(running))
+			await asyncio.wait(running)
+
+	async def process(self, job: Job) -> None:
+		"""Run a claimed job and record its outcome.
+
+		Args:
+		        job: Claimed job
+		"""
+		JOBS_RUNNING.inc()
+		started = time.perf_counter()
+		try:
+			outcome = await self._run(job)
+		finally:
+			JOBS_RUNNING.dec()
+			JOB_DURATION.labels(job.kind).observe(time.perf_counter() - started)
+		JOBS_PROCESSED.labels(job.kind, outcome).inc()
+
+	async def _claim(self, limit: int) -> list[Job]:
+		"""Claim jobs, treating an unreachable database as an empty queue."""
+		try:
+			jobs = await self.store.claim(limit, self.visibility_timeout)
+		except Exception:
+			logger.exception("Could not claim jobs")
+			return []
+		for job in jobs:
+			JOBS_CLAIMED.labels(job.kind).inc()
+			JOB_LAG.labels(job.kind).observe(job.lag_seconds)
+		return jobs
+
+	async def _run(self, job: Job) -> str:
+		"""Run a job's handler and settle the job, returning the outcome."""
+		handler = self.handlers.get(job.kind)
+		if handler is None:
+			return await self._give_up(job, f"No handler for job kind {job.kind!r}")
+		if job.attempts > job.max_attempts:
+			# Claimed again after a worker died or timed out during its last attempt
+			return await self._give_up(job, "Visibility timeout expired on the last attempt")
+
+		try:
+			async with asyncio.timeout(self.visibility_timeout):
+				await handler(job.payload)
+		except Exception as e:
+			error = f"{type(e).__name__}: {e}"
+			if job.attempts >= job.max_attempts:
+				logger.exception("Job %d (%s) failed for the last time", job.id, job.kind)
+				return await self._give_up(job, error)
+			delay = retry_delay(job.attempts, self.retry_base_delay, self.retry_max_delay)
+			logger.warning("Job %d (%s) failed, retrying in %.0f seconds: %s", job.id, job.kind, delay, error)
+			await self._settle(self.store.retry(job, delay, error))
+			return "retried"
+
+		await self._settle(self.store.complete(job))
+		return "succeeded"
+
+	async def _give_up(self, job: Job, error: str) -> str:
+		"""Keep a job as failed."""
+		await self._settle(self.store.fail(job, error))
+		return "failed"
+
+	@staticmethod
+	async def _settle(operation: Awaitable[None]) -> None:
+		"""Settle a job, leaving it to reappear after its visibility timeout if that fails."""
+		try:
+			await operation
+		except Exception:
+			logger.exception("Could not record job outcome")
@@ -0,0 +1,158 @@
+"""Per-request batching of user lookups."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+
+from app.domain.entities.user import User
+from app.domain.repositories.user_repository import UserRepository
+
+
+class UserLoader:
+	"""Batches and memoizes user lookups of one request, in the manner of DataLoader.
+
+	Lookups requested in the same event loop iteration, for example by
+	``load_many`` or by handlers gathering several lookups, are resolved
+	together: one ``WHERE id = ANY(:ids)`` query for the IDs and one for the
+	emails. Results, misses included, are remembered for the rest of the
+	request, and users found by ID also answer lookups by their email and vice
+	versa. Failed lookups are not remembered.
+
+	Batches run one at a time, as they share the request's session. Create one
+	loader per request; it never sees writes made after a user was loaded.
+	"""
+
+	def __init__(self, repository: UserRepository) -> None:
+		"""Initialize loader.
+
+		Args:
+		        repository: Repository of the request to query through
+		"""
+		self.repository = repository
+		self.batches = 0
+		self._by_id: dict[int, asyncio.Future[User | None]] = {}
+		self._by_email: dict[str, asyncio.Future[User | None]] = {}
+		self._pending_ids: list[int] = []
+		self._pending_emails: list[str] = []
+		self._scheduled = False
+		self._lock = asyncio.Lock()
+		self._tasks: set[asyncio.Task[None]] = set()
+
+	async def load(self, user_id: int) -> User | None:
+		"""Get a user by ID, batched with the other lookups of this iteration.
+
+		Args:
+		        user_id: User identifier
+
+		Returns:
+		        User entity if found, None otherwise
+		"""
+		return await asyncio.shield(self._request(self._by_id, self._pending_ids, user_id))
+
+	async def load_many(self, user_ids: Iterable[int]) -> list[User | None]:
+		"""Get users by ID with one query for those not loaded yet.
+
+		Args:
+		        user_ids: User identifiers
+
+		Returns:
+		        User or None for each ID, in the order given
+		"""
+		futures = [self._request(self._by_id, self._pending_ids, user_id) for user_id in user_ids]
+		return list(await asyncio.shield(asyncio.gather(*futures)))
+
+	async def load_by_email(self, email: str) -> User | None:
+		"""Get a user by email address, batched with the other lookups of this iteration.
+
+		Args:
+		        email: Email address
+
+		Returns:
+		        User entity if found, None otherwise
+		"""
+		return await asyncio.shield(self._request(self._by_email, self._pending_emails, email))
+
+	async def load_many_by_email(self, emails: Iterable[str]) -> list[User | None]:
+		"""Get users by email address with one query for those not loaded yet.
+
+		Args:
+		        emails: Email addresses
+
+		Returns:
+		        User or None for each address, in the order given
+		"""
+		futures = [self._request(self._by_email, self._pending_emails, email) for email in emails]
+		return list(await asyncio.shield(asyncio.gather(*futures)))
+
+	def prime(self, user: User) -> None:
+		"""Remember a user loaded some other way, so lookups of it need no query."""
+		if user.id is not None:
+			self._remember(self._by_id, user.id, user)
+		self._remember(self._by_email, user.email.value, user)
+
+	def _request[K: Hashable](
+		self, memo: dict[K, asyncio.Future[User | None]], pending: list[K], key: K
+	) -> asyncio.Future[User | None]:
+		"""Get the future result of a lookup, queueing it for the next batch when new."""
+		future = memo.get(key)
+		if future is None:
+			future = asyncio.get_running_loop().create_future()
+			memo[key] = future
+			pending.append(key)
+			if not self._scheduled:
+				# Runs after every task already ready, so their lookups join the batch
+				asyncio.get_running_loop().call_soon(self._dispatch)
+				self._scheduled = True
+		return future
+
+	def _dispatch(self) -> None:
+		"""Start a batch with the lookups queued so far."""
+		self._scheduled = False
+		ids, self._pending_ids = self._pending_ids, []
+		emails, self._pending_emails = self._pending_emails, []
+		task = asyncio.create_task(self._run_batch(ids, emails))
+		self._tasks.add(task)
+		task.add_done_callback(self._tasks.discard)
+
+	async def _run_batch(self, ids: list[int], emails: list[str]) -> None:
+		"""Query queued IDs and emails, one query each."""
+		async with self._lock:
+			self.batches += 1
+			if ids:
+				await self._resolve(self._by_id, ids, self.repository.get_many_by_ids)
+			# Emails of users just found by ID are answered already
+			emails = [email for email in emails if not self._by_email[email].done()]
+			if emails:
+				await self._resolve(self._by_email, emails, self.repository.get_many_by_emails)
+
+	async def _resolve[K: Hashable](
+		self,
+		memo: dict[K, asyncio.Future[User | None]],
+		keys: list[K],
+		fetch: Callable[[list[K]], Awaitable[list[User]]],
+	) -> None:
+		"""Fetch users for keys and settle their futures, None for keys not found."""
+		try:
+			users = await fetch(keys)
+		except Exception as e:
+			for key in keys:
+				future = memo.pop(key)
+				if not future.done():
+					future.set_exception(e)
+			return
+
+		for user in users:
+			self.prime(user)
+		for key in keys:
+			future = memo[key]
+			if not future.done():
+				future.set_result(None)
+
+	@staticmethod
+	def _remember[K: Hashable](memo: dict[K, asyncio.Future[User | None]], key: K, user: User) -> None:
+		"""Settle a lookup with a user, unless it already has a result."""
+		future = memo.get(key)
+		if future is None:
+			future = asyncio.get_running_loop().create_future()
+			memo[key] = future
+		if not future.done():
+			future.set_result(user)
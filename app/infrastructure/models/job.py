@@ -0,0 +1,57 @@
+"""SQLAlchemy background job model."""
+
+from datetime import datetime
+from enum import StrEnum
+from typing import Any
+
+from sqlalchemy import JSON, BigInteger, DateTime, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.infrastructure.database import Base
+
+# Runs of a job before it is given up, unless enqueued with another limit
+DEFAULT_MAX_ATTEMPTS = 5
+
+
+class JobStatus(StrEnum):
+	"""Lifecycle of a job row; succeeded jobs are deleted."""
+
+	QUEUED = "queued"
+	RUNNING = "running"
+	FAILED = "failed"
+
+
+class JobModel(Base):
+	"""SQLAlchemy model of a background job waiting for, or claimed by, a worker."""
+
+	__tablename__ = "jobs"
+	__table_args__ = (
+		# Claim order; failed jobs are left out as they are never claimed again
+		Index(
+			"ix_jobs_claimable_run_at",
+			"run_at",
+			postgresql_where=text(f"status IN ('{JobStatus.QUEUED}', '{JobStatus.RUNNING}')"),
+		),
+	)
+
+	id: Mapped[int] = mapped_column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+	kind: Mapped[str] = mapped_column(String(100), nullable=False)
+	payload: Mapped[dict[str, Any]] = mapped_column(JSON().with_variant(JSONB, "postgresql"), nullable=False)
+	status: Mapped[str] = mapped_column(String(20), default=JobStatus.QUEUED, nullable=False)
+	attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+	max_attempts: Mapped[int] = mapped_column(Integer, default=DEFAULT_MAX_ATTEMPTS, nullable=False)
+	# Next time the job can be claimed, which is its scheduled or retry time
+	# while queued and the end of its visibility timeout while running
+	run_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+	last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+	created_at: Mapped[datetime] = mapped_column(
+		DateTime(timezone=True),
+		server_default=func.now(),
+		nullable=False,
+	)
+
+	def __repr__(self) -> str:
+		"""String representation of JobModel."""
+		return f"<JobModel(id={self.id}, kind='{self.kind}', status='{self.status}')>"
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Integer, String
+from sqlalchemy import DDL, Boolean, DateTime, Index, Integer, String, event
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -13,6 +13,14 @@ class UserModel(Base):
 	"""SQLAlchemy User model for database persistence."""
 
 	__tablename__ = "users"
+	__table_args__ = (
+		# Sort key for keyset pagination
+		Index("ix_users_created_at_id", "created_at", "id"),
+		# Latest change for conditional GETs on user lists
+		Index("ix_users_updated_at", "updated_at"),
+	)
+	# Fetch server defaults with RETURNING on flush instead of a refresh SELECT
+	__mapper_args__ = {"eager_defaults": True}  # noqa: RUF012
 
 	id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
 	name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -32,3 +40,16 @@ class UserModel(Base):
 	def __repr__(self) -> str:
 		"""String representation of UserModel."""
 		return f"<UserModel(id={self.id}, name='{self.name}', email='{self.email}')>"
+
+
+# Search needs pg_trgm, so these are kept out of the mapped columns and only
+# created on PostgreSQL; they mirror migration 8b4e6d2f1a35 for create_all
+SEARCH_DDL = (
+	"CREATE EXTENSION IF NOT EXISTS pg_trgm",
+	"ALTER TABLE users ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (to_tsvector('simple', name || ' ' || email)) STORED",
+	"CREATE INDEX ix_users_search_vector ON users USING gin (search_vector)",
+	"CREATE INDEX ix_users_name_trgm ON users USING gin (name gin_trgm_ops)",
+	"CREATE INDEX ix_users_email_trgm ON users USING gin (email gin_trgm_ops)",
+)
+for statement in SEARCH_DDL:
+	event.listen(UserModel.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql"))  # type: ignore[no-untyped-call]
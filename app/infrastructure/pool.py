@@ -0,0 +1,67 @@
+"""Instrumented connection pool."""
+
+import time
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Gauge, Histogram
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from sqlalchemy.util.queue import AsyncAdaptedQueue, Empty
+
+POOL_CHECKOUT_WAIT = Histogram(
+	"db_pool_checkout_wait_seconds",
+	"Time spent waiting for a pooled connection",
+	buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+POOL_CHECKOUT_TIMEOUTS = Counter(
+	"db_pool_checkout_timeouts_total",
+	"Checkouts that gave up after the pool timeout",
+)
+
+
+class _InstrumentedQueue(AsyncAdaptedQueue[Any]):
+	"""Pool queue recording how long checkouts wait for an idle connection."""
+
+	def get(self, block: bool = True, timeout: float | None = None) -> Any:
+		"""Take an idle connection, recording wait time and timeouts."""
+		started = time.perf_counter()
+		try:
+			return super().get(block, timeout)
+		except Empty:
+			if block:
+				POOL_CHECKOUT_TIMEOUTS.inc()
+			raise
+		finally:
+			POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started)
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+	"""Async queue pool exporting checkout wait time and timeouts."""
+
+	_queue_class = _InstrumentedQueue
+
+
+def register_pool_gauges(engines: Mapping[str, AsyncEngine], registry: CollectorRegistry = REGISTRY) -> None:
+	"""Export live pool occupancy of engines, labelled by engine name.
+
+	Gauges read the pool at scrape time, so they cost nothing between scrapes.
+	``engine.pool`` is looked up on every read because ``dispose()`` replaces it.
+
+	Args:
+	        engines: Engines with a queue pool, by name
+	        registry: Registry to export to
+	"""
+	gauges: dict[str, tuple[str, Callable[[QueuePool], float]]] = {
+		"db_pool_size": ("Configured number of persistent connections", lambda pool: pool.size()),
+		"db_pool_checked_out": ("Connections currently checked out", lambda pool: pool.checkedout()),
+		"db_pool_checked_in": ("Idle connections in the pool", lambda pool: pool.checkedin()),
+		# The overflow counter starts at minus the pool size
+		"db_pool_overflow": ("Connections open beyond the pool size", lambda pool: max(pool.overflow(), 0)),
+	}
+	for name, (documentation, read) in gauges.items():
+		gauge = Gauge(name, documentation, ["engine"], registry=registry)
+		for engine_name, engine in engines.items():
+			gauge.labels(engine_name).set_function(
+				lambda read=read, engine=engine: read(engine.pool)  # type: ignore
+			)
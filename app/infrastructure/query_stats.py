@@ -0,0 +1,74 @@
+"""Per-scope SQL statement accounting."""
+
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Attribute of the statement's execution context holding its start time, gone with the context if it raises
+_STARTED_ATTR = "_query_stats_started"
+
+
+@dataclass(slots=True)
+class QueryStats:
+	"""SQL statements executed within a scope and the time spent in them."""
+
+	count: int = 0
+	seconds: float = 0.0
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+	"""Count statements executed by the current task and its children.
+
+	Yields:
+	        Stats updated as statements complete
+	"""
+	stats = QueryStats()
+	token = _current.set(stats)
+	try:
+		yield stats
+	finally:
+		_current.reset(token)
+
+
+def _before_cursor_execute(
+	_conn: Connection, _cursor: Any, _statement: str, _parameters: Any, context: ExecutionContext, *_args: Any
+) -> None:
+	"""Remember when a tracked statement started."""
+	if _current.get() is not None:
+		setattr(context, _STARTED_ATTR, time.perf_counter())
+
+
+def _after_cursor_execute(
+	_conn: Connection, _cursor: Any, _statement: str, _parameters: Any, context: ExecutionContext, *_args: Any
+) -> None:
+	"""Add a finished tracked statement to the current stats."""
+	stats = _current.get()
+	started = getattr(context, _STARTED_ATTR, None)
+	if stats is None or started is None:
+		return
+	stats.count += 1
+	stats.seconds += time.perf_counter() - started
+
+
+def instrument_queries(engines: Iterable[AsyncEngine]) -> None:
+	"""Record statements of engines into the stats of the scope executing them.
+
+	Outside ``track_queries`` the hooks return after a context variable lookup.
+
+	Args:
+	        engines: Engines to instrument
+	"""
+	for engine in engines:
+		event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+		event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,119 @@
+"""Read replica routing."""
+
+import asyncio
+import itertools
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from prometheus_client import Gauge
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+REPLICA_HEALTHY = Gauge("db_replica_healthy", "Whether a read replica passed its last health check", ["engine"])
+
+
+@dataclass
+class Replica:
+	"""A read replica and its last known health."""
+
+	name: str
+	engine: AsyncEngine
+	sessionmaker: async_sessionmaker[AsyncSession] = field(init=False)
+	healthy: bool = False
+
+	def __post_init__(self) -> None:
+		"""Create the session factory for the replica."""
+		self.sessionmaker = async_sessionmaker(self.engine, class_=AsyncSession, expire_on_commit=False)
+
+
+class ReplicaRouter:
+	"""Spread read-only sessions over healthy replicas.
+
+	Replicas are health-checked at most every ``check_interval`` seconds. The
+	first check runs before the first read, later ones in the background, so no
+	request waits on them. When no replica is healthy, ``pick`` returns None and
+	callers read from the primary.
+	"""
+
+	def __init__(
+		self,
+		engines: dict[str, AsyncEngine],
+		check_interval: float = 5.0,
+		check_timeout: float = 1.0,
+		clock: Callable[[], float] = time.monotonic,
+	) -> None:
+		"""Initialize router.
+
+		Args:
+		        engines: Replica engines by name
+		        check_interval: Seconds between health checks
+		        check_timeout: Seconds before a replica health check fails
+		        clock: Monotonic time source in seconds
+		"""
+		self.replicas = [Replica(name=name, engine=engine) for name, engine in engines.items()]
+		self.check_interval = check_interval
+		self.check_timeout = check_timeout
+		self._clock = clock
+		self._checked_at: float | None = None
+		self._check_task: asyncio.Task[None] | None = None
+		self._next = itertools.count()
+
+	@property
+	def enabled(self) -> bool:
+		"""Whether any replicas are configured."""
+		return bool(self.replicas)
+
+	async def pick(self) -> async_sessionmaker[AsyncSession] | None:
+		"""Pick the session factory of a healthy replica, round-robin.
+
+		Returns:
+		        Replica session factory, None if reads should go to the primary
+		"""
+		if not self.replicas:
+			return None
+
+		if self._checked_at is None:
+			await self.check()
+		elif self._clock() - self._checked_at >= self.check_interval and self._check_task is None:
+			self._check_task = asyncio.create_task(self.check())
+			self._check_task.add_done_callback(self._check_done)
+
+		healthy = [replica for replica in self.replicas if replica.healthy]
+		if not healthy:
+			return None
+		return healthy[next(self._next) % len(healthy)].sessionmaker
+
+	async def check(self) -> None:
+		"""Health-check all replicas concurrently."""
+		self._checked_at = self._clock()
+		await asyncio.gather(*(self._check_replica(replica) for replica in self.replicas))
+
+	async def dispose(self) -> None:
+		"""Close connections to all replicas."""
+		if self._check_task is not None:
+			self._check_task.cancel()
+		for replica in self.replicas:
+			await replica.engine.dispose()
+
+	async def _check_replica(self, replica: Replica) -> None:
+		"""Run a trivial query on a replica and record the outcome."""
+		try:
+			async with asyncio.timeout(self.check_timeout), replica.engine.connect() as conn:
+				await conn.execute(text("SELECT 1"))
+		except Exception:
+			if replica.healthy:
+				logger.warning("Read replica %s failed its health check, reading from primary", replica.name)
+			replica.healthy = False
+		else:
+			if not replica.healthy:
+				logger.info("Read replica %s is healthy", replica.name)
+			replica.healthy = True
+		REPLICA_HEALTHY.labels(replica.name).set(int(replica.healthy))
+
+	def _check_done(self, _task: asyncio.Task[None]) -> None:
+		"""Allow the next background check."""
+		self._check_task = None
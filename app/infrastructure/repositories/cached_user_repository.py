@@ -0,0 +1,435 @@
+"""Read-through caching decorator for UserRepository."""
+
+import copy
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Final
+
+from prometheus_client import REGISTRY, CollectorRegistry
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+from prometheus_client.registry import Collector
+
+from app.domain.entities.user import User
+from app.domain.repositories.user_repository import (
+	CountMode,
+	UserFilter,
+	UserPage,
+	UserRepository,
+	UserSearchPage,
+	UserWatermark,
+)
+from app.domain.value_objects.page_cursor import PageCursor, SearchCursor
+from app.infrastructure.cache import LRUCache
+
+
+class _Missing(Enum):
+	"""Nothing cached for a key, unlike a cached miss, which is None."""
+
+	MISSING = 0
+
+
+_MISSING: Final = _Missing.MISSING
+
+
+@dataclass
+class UserCacheStats:
+	"""Snapshot of user cache counters."""
+
+	hits: int
+	misses: int
+	evictions: int
+	size: int
+
+
+class UserCache:
+	"""Process-wide cache of users keyed by ID and by email.
+
+	Emails map to user IDs, so one cached entity serves both lookups and
+	invalidating an ID is enough to drop it. Misses are cached for a shorter
+	``negative_ttl``.
+
+	Every invalidation bumps ``generation`` and records it for the key. A read
+	captures the generation before querying and only caches its result if none
+	of the keys it stores was invalidated since, so a read that raced a commit
+	cannot put back the row the commit replaced. The most recent ``max_size``
+	invalidations are remembered; a read older than a forgotten one caches
+	nothing.
+	"""
+
+	def __init__(
+		self,
+		max_size: int,
+		ttl: float,
+		negative_ttl: float,
+		clock: Callable[[], float] = time.monotonic,
+	) -> None:
+		"""Initialize cache.
+
+		Args:
+		        max_size: Maximum number of entries per key type
+		        ttl: Lifetime of cached users in seconds
+		        negative_ttl: Lifetime of cached misses in seconds
+		        clock: Monotonic time source in seconds
+		"""
+		self.negative_ttl = negative_ttl
+		self.hits = 0
+		self.misses = 0
+		self.by_id: LRUCache[int, User | None] = LRUCache(max_size, ttl, clock)
+		self.by_email: LRUCache[str, int | None] = LRUCache(max_size, ttl, clock)
+		self.generation = 0
+		self._max_invalidations = max_size
+		self._invalidated: OrderedDict[int | str, int] = OrderedDict()
+		self._forgotten = 0
+
+	def invalidate_id(self, user_id: int) -> None:
+		"""Drop cached entries for a user known only by ID."""
+		cached = self.by_id.get(user_id, None)
+		if cached is not None:
+			self.by_email.delete(cached.email.value)
+		self.by_id.delete(user_id)
+		self._record_invalidation(user_id)
+
+	def invalidate_email(self, email: str) -> None:
+		"""Drop the cached user ID or miss of an email."""
+		self.by_email.delete(email)
+		self._record_invalidation(email)
+
+	def is_current(self, generation: int, *keys: int | str | None) -> bool:
+		"""Whether none of the keys was invalidated after the given generation.
+
+		Args:
+		        generation: Generation captured before reading
+		        keys: User IDs and emails the read would cache, None entries are ignored
+
+		Returns:
+		        True when the read may be cached
+		"""
+		if self._forgotten > generation:
+			return False
+		return all(self._invalidated.get(key, 0) <= generation for key in keys if key is not None)
+
+	def _record_invalidation(self, key: int | str) -> None:
+		"""Remember the generation a key was invalidated at, forgetting the oldest when full."""
+		self.generation += 1
+		self._invalidated[key] = self.generation
+		self._invalidated.move_to_end(key)
+		while len(self._invalidated) > self._max_invalidations:
+			_key, forgotten = self._invalidated.popitem(last=False)
+			self._forgotten = max(self._forgotten, forgotten)
+
+	def stats(self) -> UserCacheStats:
+		"""Return current cache counters."""
+		return UserCacheStats(
+			hits=self.hits,
+			misses=self.misses,
+			evictions=self.by_id.evictions + self.by_email.evictions,
+			size=len(self.by_id) + len(self.by_email),
+		)
+
+	def clear(self) -> None:
+		"""Drop all cached entries."""
+		self.by_id.clear()
+		self.by_email.clear()
+		self.generation = 0
+		self._invalidated.clear()
+		self._forgotten = 0
+
+
+class _UserCacheCollector(Collector):
+	"""Reads user cache counters at scrape time."""
+
+	def __init__(self, cache: UserCache) -> None:
+		"""Initialize collector.
+
+		Args:
+		        cache: Cache to read counters from
+		"""
+		self.cache = cache
+
+	def collect(self) -> Iterator[Metric]:
+		"""Export the cache's current counters."""
+		stats = self.cache.stats()
+		yield CounterMetricFamily("user_cache_hits", "User lookups answered from the cache", value=stats.hits)
+		yield CounterMetricFamily("user_cache_misses", "User lookups read through to the database", value=stats.misses)
+		yield CounterMetricFamily(
+			"user_cache_evictions", "User cache entries evicted by the size bound", value=stats.evictions
+		)
+		yield GaugeMetricFamily("user_cache_entries", "Entries in the user cache, by ID and by email", value=stats.size)
+
+
+def register_user_cache_metrics(cache: UserCache, registry: CollectorRegistry = REGISTRY) -> None:
+	"""Export hits, misses, evictions and size of a user cache.
+
+	Counters are read from the cache at scrape time, so lookups pay nothing for them.
+
+	Args:
+	        cache: Cache to export
+	        registry: Registry to export to
+	"""
+	registry.register(_UserCacheCollector(cache))
+
+
+class CachedUserRepository(UserRepository):
+	"""UserRepository decorator caching ``get_by_id`` and ``get_by_email``.
+
+	Writes go through to the wrapped repository and mark the affected users
+	dirty. Their entries are only invalidated by ``commit_invalidations`` once
+	the unit of work committed, so other requests keep reading the committed
+	rows meanwhile and a rollback leaves the cache alone. Until then, lookups
+	of dirty users bypass the cache and nothing read is cached, as it may be
+	uncommitted. Reads that raced a commit are not cached either, see
+	``UserCache``. Other processes do not see these invalidations, so entries
+	may be stale for up to the cache TTL after a write elsewhere.
+	"""
+
+	def __init__(self, repository: UserRepository, cache: UserCache, serve: bool = True, fill: bool = True) -> None:
+		"""Initialize decorator.
+
+		Args:
+		        repository: Repository to read through to
+		        cache: Cache shared between requests
+		        serve: Answer lookups from the cache; off for reads that must see every commit
+		        fill: Cache what lookups read; off when the wrapped repository reads from a
+		                replica, which may still return rows a commit invalidated
+		"""
+		self.repository = repository
+		self.cache = cache
+		self.serve = serve
+		self.fill = fill
+		self._dirty_ids: set[int] = set()
+		self._dirty_emails: set[str] = set()
+
+	def commit_invalidations(self) -> None:
+		"""Invalidate the entries of users written since the last commit or rollback."""
+		for user_id in self._dirty_ids:
+			self.cache.invalidate_id(user_id)
+		for email in self._dirty_emails:
+			self.cache.invalidate_email(email)
+		self.discard_invalidations()
+
+	def discard_invalidations(self) -> None:
+		"""Forget writes that were rolled back, leaving the cache untouched."""
+		self._dirty_ids.clear()
+		self._dirty_emails.clear()
+
+	async def get_by_id(self, user_id: int) -> User | None:
+		"""Get user by ID, from cache when possible."""
+		if self._bypasses(user_id):
+			return await self.repository.get_by_id(user_id)
+		cached = self.cache.by_id.get(user_id, _MISSING)
+		if cached is not _MISSING:
+			self.cache.hits += 1
+			return copy.copy(cached)
+
+		self.cache.misses += 1
+		generation = self.cache.generation
+		user = await self.repository.get_by_id(user_id)
+		self._store(generation, user_id, None, user)
+		return user
+
+	async def get_last_modified(self, user_id: int) -> datetime | None:
+		"""Get when a user last changed, from cache when possible."""
+		if self._bypasses(user_id):
+			return await self.repository.get_last_modified(user_id)
+		cached = self.cache.by_id.get(user_id, _MISSING)
+		if cached is not _MISSING:
+			self.cache.hits += 1
+			if cached is None:
+				return None
+			return cached.updated_at or cached.created_at
+
+		self.cache.misses += 1
+		return await self.repository.get_last_modified(user_id)
+
+	async def get_watermark(self) -> UserWatermark:
+		"""Summarize the users table."""
+		return await self.repository.get_watermark()
+
+	async def get_by_email(self, email: str) -> User | None:
+		"""Get user by email address, from cache when possible."""
+		if not self.serve:
+			return await self.repository.get_by_email(email)
+		user_id = self._cached_email(email)
+		if user_id is None:
+			self.cache.hits += 1
+			return None
+		if user_id is not _MISSING:
+			cached = self.cache.by_id.get(user_id, None)
+			# Mappings go stale when an email changes, so check the address matches
+			if cached is not None and cached.email.value == email:
+				self.cache.hits += 1
+				return copy.copy(cached)
+
+		self.cache.misses += 1
+		generation = self.cache.generation
+		user = await self.repository.get_by_email(email)
+		self._store(generation, None, email, user)
+		return user
+
+	async def get_many_by_ids(self, user_ids: list[int]) -> list[User]:
+		"""Get users by ID, querying only those not cached."""
+		if not self.serve:
+			return await self.repository.get_many_by_ids(user_ids)
+		users: list[User] = []
+		missing: list[int] = []
+		for user_id in user_ids:
+			cached = _MISSING if self._bypasses(user_id) else self.cache.by_id.get(user_id, _MISSING)
+			if cached is _MISSING:
+				missing.append(user_id)
+			elif cached is not None:
+				users.append(copy.copy(cached))
+		self.cache.hits += len(user_ids) - len(missing)
+		if not missing:
+			return users
+
+		self.cache.misses += len(missing)
+		generation = self.cache.generation
+		found = await self.repository.get_many_by_ids(missing)
+		for user in found:
+			self._store(generation, None, None, user)
+		found_ids = {user.id for user in found}
+		for user_id in missing:
+			if user_id not in found_ids:
+				self._store(generation, user_id, None, None)
+		return users + found
+
+	async def get_many_by_emails(self, emails: list[str]) -> list[User]:
+		"""Get users by email address, caching those found."""
+		if not self.serve:
+			return await self.repository.get_many_by_emails(emails)
+		self.cache.misses += len(emails)
+		generation = self.cache.generation
+		users = await self.repository.get_many_by_emails(emails)
+		for user in users:
+			self._store(generation, None, None, user)
+		return users
+
+	async def exists_by_email(self, email: str) -> bool:
+		"""Check if user exists by email, from cache when possible."""
+		if not self.serve:
+			return await self.repository.exists_by_email(email)
+		user_id = self._cached_email(email)
+		if user_id is not _MISSING:
+			self.cache.hits += 1
+			return user_id is not None
+
+		self.cache.misses += 1
+		return await self.repository.exists_by_email(email)
+
+	async def list_all(self, skip: int = 0, limit: int = 100) -> list[User]:
+		"""List all users with offset pagination."""
+		return await self.repository.list_all(skip=skip, limit=limit)
+
+	async def list_page(self, limit: int = 100, cursor: PageCursor | None = None) -> UserPage:
+		"""List users with keyset pagination."""
+		return await self.repository.list_page(limit=limit, cursor=cursor)
+
+	def stream_all(self, batch_size: int = 1000) -> AsyncIterator[User]:
+		"""Stream all users."""
+		return self.repository.stream_all(batch_size=batch_size)
+
+	async def search(self, query: str, limit: int = 20, cursor: SearchCursor | None = None) -> UserSearchPage:
+		"""Search users."""
+		return await self.repository.search(query, limit=limit, cursor=cursor)
+
+	async def count(self, mode: CountMode = CountMode.EXACT) -> int:
+		"""Count all users."""
+		return await self.repository.count(mode)
+
+	async def create(self, user: User) -> User | None:
+		"""Create a new user, dropping any cached miss for its email on commit."""
+		created = await self.repository.create(user)
+		self._dirty_emails.add(user.email.value)
+		if created is not None and created.id is not None:
+			self._dirty_ids.add(created.id)
+		return created
+
+	async def save(self, user: User) -> User:
+		"""Save user, invalidating its cached entries on commit."""
+		saved = await self.repository.save(user)
+		self._mark(saved)
+		return saved
+
+	async def update_fields(self, user_id: int, **changes: object) -> User | None:
+		"""Update the given columns, invalidating the user's cached entries on commit."""
+		updated = await self.repository.update_fields(user_id, **changes)
+		self._dirty_ids.add(user_id)
+		if updated is not None:
+			self._mark(updated)
+		return updated
+
+	async def save_many(self, users: list[User]) -> list[User]:
+		"""Create new users, dropping any cached misses for their emails on commit."""
+		created = await self.repository.save_many(users)
+		self._dirty_emails.update(user.email.value for user in users)
+		self._dirty_ids.update(user.id for user in created if user.id is not None)
+		return created
+
+	async def delete(self, user_id: int) -> bool:
+		"""Delete user by ID, invalidating its cached entries on commit."""
+		deleted = await self.repository.delete(user_id)
+		self._dirty_ids.add(user_id)
+		return deleted
+
+	async def deactivate_many(self, user_ids: list[int]) -> list[int]:
+		"""Deactivate users by ID, invalidating their cached entries on commit."""
+		return self._mark_ids(await self.repository.deactivate_many(user_ids))
+
+	async def deactivate_where(self, user_filter: UserFilter) -> list[int]:
+		"""Deactivate users matching a filter, invalidating their cached entries on commit."""
+		return self._mark_ids(await self.repository.deactivate_where(user_filter))
+
+	async def delete_many(self, user_ids: list[int]) -> list[int]:
+		"""Delete users by ID, invalidating their cached entries on commit."""
+		return self._mark_ids(await self.repository.delete_many(user_ids))
+
+	async def delete_where(self, user_filter: UserFilter) -> list[int]:
+		"""Delete users matching a filter, invalidating their cached entries on commit."""
+		return self._mark_ids(await self.repository.delete_where(user_filter))
+
+	def _bypasses(self, user_id: int) -> bool:
+		"""Whether a lookup by ID must skip the cache, when not serving from it or the user is dirty."""
+		return not self.serve or user_id in self._dirty_ids
+
+	def _cached_email(self, email: str) -> int | None | _Missing:
+		"""Get the cached user ID of an email, or _MISSING when it or its user is dirty."""
+		if email in self._dirty_emails:
+			return _MISSING
+		user_id = self.cache.by_email.get(email, _MISSING)
+		return _MISSING if user_id in self._dirty_ids else user_id
+
+	def _store(self, generation: int, user_id: int | None, email: str | None, user: User | None) -> None:
+		"""Cache a lookup result read since a generation, or a miss for the looked up key."""
+		if not self.fill or self._dirty_ids or self._dirty_emails:
+			# Reads after a write may see uncommitted rows
+			return
+		keys = (user_id, email) if user is None else (user_id, email, user.id, user.email.value)
+		if not self.cache.is_current(generation, *keys):
+			# Invalidated while reading, the result may predate the write
+			return
+		if user is None:
+			if user_id is not None:
+				self.cache.by_id.set(user_id, None, ttl=self.cache.negative_ttl)
+			if email is not None:
+				self.cache.by_email.set(email, None, ttl=self.cache.negative_ttl)
+			return
+		if user.id is None:
+			return
+
+		self.cache.by_id.set(user.id, copy.copy(user))
+		self.cache.by_email.set(user.email.value, user.id)
+
+	def _mark_ids(self, user_ids: list[int]) -> list[int]:
+		"""Mark users changed by a set-based write dirty, passing their IDs through."""
+		self._dirty_ids.update(user_ids)
+		return user_ids
+
+	def _mark(self, user: User) -> None:
+		"""Mark a user dirty under its ID and current email; its previous email goes with the ID."""
+		if user.id is not None:
+			self._dirty_ids.add(user.id)
+		self._dirty_emails.add(user.email.value)
@@ -0,0 +1,190 @@
+"""Single-flight coalescing decorator for UserRepository."""
+
+import asyncio
+import copy
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
+from datetime import datetime
+from typing import Any, cast
+
+from app.domain.entities.user import User
+from app.domain.repositories.user_repository import (
+	CountMode,
+	UserFilter,
+	UserPage,
+	UserRepository,
+	UserSearchPage,
+	UserWatermark,
+)
+from app.domain.value_objects.page_cursor import PageCursor, SearchCursor
+
+
+class ReadCoalescer:
+	"""Process-wide registry of in-flight reads, shared by identical concurrent lookups.
+
+	A read runs once, on the repository of the caller that started it, so
+	coalescing takes no connection beyond those the requests already hold. That
+	caller's session can only be used while it waits: when it is cancelled the
+	read stops, and the callers that joined run it again on their own
+	repositories. A caller that joined and is cancelled stops waiting without
+	affecting the others. Results are not kept once the read finishes.
+
+	Not thread-safe; meant to be shared between coroutines of one event loop.
+	"""
+
+	def __init__(self) -> None:
+		"""Initialize coalescer with no reads in flight."""
+		self.queries = 0
+		self.coalesced = 0
+		self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+
+	async def run[T](self, key: Hashable, read: Callable[[], Awaitable[T]]) -> T:
+		"""Run a read, or join the identical one already in flight.
+
+		Args:
+		        key: Identity of the read; equal keys must mean equal results
+		        read: Read on the caller's own repository, run when no identical read is in flight
+
+		Returns:
+		        Result of the shared read
+		"""
+		shared = self._inflight.get(key)
+		if shared is None:
+			return await self._lead(key, read)
+
+		self.coalesced += 1
+		try:
+			return cast(T, await asyncio.shield(shared))
+		except asyncio.CancelledError:
+			current = asyncio.current_task()
+			if not shared.cancelled() or (current is not None and current.cancelling()):
+				raise
+		# The caller running the read went away with its session
+		return await self.run(key, read)
+
+	async def _lead[T](self, key: Hashable, read: Callable[[], Awaitable[T]]) -> T:
+		"""Run a read in the caller's task, sharing its outcome with callers that join meanwhile."""
+		shared: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+		self._inflight[key] = shared
+		self.queries += 1
+		try:
+			result = await read()
+		except Exception as e:
+			shared.set_exception(e)
+			# Raised here and in every joined caller, so nobody else needs to retrieve it
+			shared.exception()
+			raise
+		else:
+			shared.set_result(result)
+			return result
+		finally:
+			if self._inflight.get(key) is shared:
+				del self._inflight[key]
+			if not shared.done():
+				shared.cancel()
+
+
+class CoalescingUserRepository(UserRepository):
+	"""UserRepository decorator coalescing concurrent identical user lookups.
+
+	``get_by_id``, ``get_by_email`` and ``get_last_modified`` share one query
+	with every identical lookup in flight in the process. The shared query
+	reads in the transaction of whichever request started it, so use this only
+	for requests that don't write. Everything else goes to the wrapped repository.
+	"""
+
+	def __init__(self, repository: UserRepository, coalescer: ReadCoalescer) -> None:
+		"""Initialize decorator.
+
+		Args:
+		        repository: Repository of the request, for its reads and writes
+		        coalescer: Registry of in-flight reads shared between requests
+		"""
+		self.repository = repository
+		self.coalescer = coalescer
+
+	async def get_by_id(self, user_id: int) -> User | None:
+		"""Get user by ID, sharing the query with concurrent identical lookups."""
+		user = await self.coalescer.run(("get_by_id", user_id), lambda: self.repository.get_by_id(user_id))
+		# Each caller gets its own entity, as they are mutable
+		return copy.copy(user)
+
+	async def get_last_modified(self, user_id: int) -> datetime | None:
+		"""Get when a user last changed, sharing the query with concurrent identical lookups."""
+		return await self.coalescer.run(("get_last_modified", user_id), lambda: self.repository.get_last_modified(user_id))
+
+	async def get_watermark(self) -> UserWatermark:
+		"""Summarize the users table."""
+		return await self.repository.get_watermark()
+
+	async def get_by_email(self, email: str) -> User | None:
+		"""Get user by email address, sharing the query with concurrent identical lookups."""
+		user = await self.coalescer.run(("get_by_email", email), lambda: self.repository.get_by_email(email))
+		return copy.copy(user)
+
+	async def get_many_by_ids(self, user_ids: list[int]) -> list[User]:
+		"""Get users by ID."""
+		return await self.repository.get_many_by_ids(user_ids)
+
+	async def get_many_by_emails(self, emails: list[str]) -> list[User]:
+		"""Get users by email address."""
+		return await self.repository.get_many_by_emails(emails)
+
+	async def exists_by_email(self, email: str) -> bool:
+		"""Check if user exists by email."""
+		return await self.repository.exists_by_email(email)
+
+	async def list_all(self, skip: int = 0, limit: int = 100) -> list[User]:
+		"""List all users with offset pagination."""
+		return await self.repository.list_all(skip=skip, limit=limit)
+
+	async def list_page(self, limit: int = 100, cursor: PageCursor | None = None) -> UserPage:
+		"""List users with keyset pagination."""
+		return await self.repository.list_page(limit=limit, cursor=cursor)
+
+	def stream_all(self, batch_size: int = 1000) -> AsyncIterator[User]:
+		"""Stream all users."""
+		return self.repository.stream_all(batch_size=batch_size)
+
+	async def search(self, query: str, limit: int = 20, cursor: SearchCursor | None = None) -> UserSearchPage:
+		"""Search users."""
+		return await self.repository.search(query, limit=limit, cursor=cursor)
+
+	async def count(self, mode: CountMode = CountMode.EXACT) -> int:
+		"""Count all users."""
+		return await self.repository.count(mode)
+
+	async def create(self, user: User) -> User | None:
+		"""Create a new user."""
+		return await self.repository.create(user)
+
+	async def save(self, user: User) -> User:
+		"""Save user."""
+		return await self.repository.save(user)
+
+	async def update_fields(self, user_id: int, **changes: object) -> User | None:
+		"""Update the given columns of a user."""
+		return await self.repository.update_fields(user_id, **changes)
+
+	async def save_many(self, users: list[User]) -> list[User]:
+		"""Create new users."""
+		return await self.repository.save_many(users)
+
+	async def delete(self, user_id: int) -> bool:
+		"""Delete user by ID."""
+		return await self.repository.delete(user_id)
+
+	async def deactivate_many(self, user_ids: list[int]) -> list[int]:
+		"""Deactivate users by ID."""
+		return await self.repository.deactivate_many(user_ids)
+
+	async def deactivate_where(self, user_filter: UserFilter) -> list[int]:
+		"""Deactivate users matching a filter."""
+		return await self.repository.deactivate_where(user_filter)
+
+	async def delete_many(self, user_ids: list[int]) -> list[int]:
+		"""Delete users by ID."""
+		return await self.repository.delete_many(user_ids)
+
+	async def delete_where(self, user_filter: UserFilter) -> list[int]:
+		"""Delete users matching a filter."""
+		return await self.repository.delete_where(user_filter)
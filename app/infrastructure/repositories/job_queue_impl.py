@@ -0,0 +1,46 @@
+"""Job queue implementation using SQLAlchemy."""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.repositories.job_queue import JobQueue
+from app.infrastructure.models.job import DEFAULT_MAX_ATTEMPTS, JobModel
+
+jobs_table = JobModel.__table__
+
+
+class SqlAlchemyJobQueue(JobQueue):
+	"""SQLAlchemy implementation of JobQueue storing jobs in the ``jobs`` table.
+
+	Jobs are inserted in the session transaction but never committed; the unit
+	of work owning the session commits them with the rest of its writes.
+	"""
+
+	def __init__(self, db: AsyncSession) -> None:
+		"""Initialize queue with database session.
+
+		Args:
+		        db: Async database session on the primary
+		"""
+		self.db = db
+
+	async def enqueue(
+		self,
+		kind: str,
+		payload: dict[str, Any],
+		run_at: datetime | None = None,
+		max_attempts: int | None = None,
+	) -> int:
+		"""Stage a job with a single ``INSERT ... RETURNING id``."""
+		values: dict[str, Any] = {
+			"kind": kind,
+			"payload": payload,
+			"max_attempts": max_attempts or DEFAULT_MAX_ATTEMPTS,
+		}
+		if run_at is not None:
+			values["run_at"] = run_at
+		result = await self.db.execute(insert(jobs_table).values(**values).returning(jobs_table.c.id))
+		return int(result.scalar_one())
@@ -1,45 +1,278 @@
 """User repository implementation using SQLAlchemy."""
 
-from sqlalchemy import select
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import (
+	ColumnElement,
+	Integer,
+	Row,
+	Select,
+	String,
+	and_,
+	any_,
+	bindparam,
+	column,
+	delete,
+	func,
+	literal,
+	literal_column,
+	or_,
+	select,
+	text,
+	tuple_,
+	update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR, insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.user import User
-from app.domain.repositories.user_repository import UserRepository
+from app.domain.exceptions import EmailAlreadyExistsError
+from app.domain.repositories.user_repository import (
+	CountMode,
+	UserFilter,
+	UserPage,
+	UserRepository,
+	UserSearchPage,
+	UserWatermark,
+)
 from app.domain.value_objects.email import Email
+from app.domain.value_objects.page_cursor import PageCursor, SearchCursor
+from app.infrastructure.cache import LRUCache
 from app.infrastructure.models.user import UserModel
 
+# Rows per multi-row INSERT, well below the 32767 bind parameter limit
+SAVE_MANY_CHUNK_SIZE = 1000
+
+# Core columns read into plain row tuples, bypassing ORM instances and the identity map
+users_table = UserModel.__table__
+USER_COLUMNS = (
+	users_table.c.id,
+	users_table.c.name,
+	users_table.c.email,
+	users_table.c.is_active,
+	users_table.c.created_at,
+	users_table.c.updated_at,
+)
+
+# Generated column created by the search migration, not mapped on UserModel
+search_vector = column("search_vector", TSVECTOR)
+
+# Row estimate kept by VACUUM and ANALYZE, -1 while the table has never been analyzed
+ESTIMATE_QUERY = text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)").bindparams(
+	table=users_table.name
+)
+
+
+def contains_pattern(value: str) -> str:
+	"""Build a ``LIKE`` pattern matching ``value`` anywhere, with its wildcards escaped."""
+	escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+	return f"%{escaped}%"
+
+
+def search_query(query: str, cursor: SearchCursor | None = None) -> Select[Any]:
+	"""Build the user search statement, best matches first.
+
+	Args:
+	        query: Search text
+	        cursor: Cursor of the last row of the previous page, None for the first page
+
+	Returns:
+	        Select of ``USER_COLUMNS`` followed by the similarity score
+	"""
+	pattern = contains_pattern(query)
+	score = func.greatest(func.similarity(users_table.c.name, query), func.similarity(users_table.c.email, query))
+	# Each branch is served by its own GIN index and combined with a BitmapOr
+	matches = or_(
+		users_table.c.name.ilike(pattern, escape="\\"),
+		users_table.c.email.ilike(pattern, escape="\\"),
+		search_vector.bool_op("@@")(func.plainto_tsquery(literal_column("'simple'"), query)),
+	)
+	statement = select(*USER_COLUMNS, score).where(matches).order_by(score.desc(), users_table.c.id)
+	if cursor is not None:
+		statement = statement.where(or_(score < cursor.score, and_(score == cursor.score, users_table.c.id > cursor.id)))
+	return statement
+
+
+async def warm_statement_cache(session: AsyncSession) -> None:
+	"""Run the hottest reads once on a new connection.
+
+	Compiles them into the engine's statement cache and, on asyncpg, prepares
+	them on the connection, so the first requests skip both steps. Lookups use
+	an ID and email no user has; counts are left out as they scan the table.
+
+	Args:
+	        session: Session on the connection to warm
+	"""
+	repository = UserRepositoryImpl(session)
+	await repository.get_by_id(0)
+	await repository.get_last_modified(0)
+	await repository.get_by_email("")
+	await repository.list_page(limit=1)
+
 
 class UserRepositoryImpl(UserRepository):
-	"""SQLAlchemy implementation of UserRepository."""
+	"""SQLAlchemy implementation of UserRepository.
 
-	def __init__(self, db: AsyncSession) -> None:
+	Writes are flushed to the session transaction but never committed; the
+	unit of work owning the session commits them.
+	"""
+
+	def __init__(
+		self,
+		db: AsyncSession,
+		read_db: AsyncSession | None = None,
+		count_cache: LRUCache[str, int] | None = None,
+	) -> None:
 		"""Initialize repository with database session.
 
 		Args:
-		        db: Async database session
+		        db: Async database session on the primary
+		        read_db: Optional session on a read replica for reads
+		        count_cache: Optional cache shared between requests for CACHED counts
 		"""
 		self.db = db
+		self.read_db = read_db
+		self.count_cache = count_cache
+		self._wrote = False
+
+	@property
+	def reader(self) -> AsyncSession:
+		"""Session for reads: the replica until this repository has written."""
+		if self.read_db is None or self._wrote:
+			return self.db
+		return self.read_db
 
 	async def get_by_id(self, user_id: int) -> User | None:
 		"""Get user by ID."""
-		result = await self.db.execute(select(UserModel).where(UserModel.id == user_id))
-		model = result.scalar_one_or_none()
-		return self._to_entity(model) if model else None
+		result = await self.reader.execute(select(*USER_COLUMNS).where(users_table.c.id == user_id))
+		row = result.one_or_none()
+		return self._row_to_entity(row) if row else None
+
+	async def get_last_modified(self, user_id: int) -> datetime | None:
+		"""Get when a user last changed from its timestamps alone."""
+		result = await self.reader.execute(
+			select(func.coalesce(users_table.c.updated_at, users_table.c.created_at)).where(users_table.c.id == user_id)
+		)
+		last_modified: datetime | None = result.scalar_one_or_none()
+		return last_modified
+
+	async def get_watermark(self) -> UserWatermark:
+		"""Summarize the users table with two index-only aggregates."""
+		# Separate subqueries let each max read one end of an index, the primary key and
+		# ix_users_updated_at, instead of scanning
+		result = await self.reader.execute(
+			select(
+				select(func.max(users_table.c.id)).scalar_subquery(),
+				select(func.max(users_table.c.updated_at)).scalar_subquery(),
+			)
+		)
+		last_id, last_updated_at = result.one()
+		return UserWatermark(last_id=last_id, last_updated_at=last_updated_at)
 
 	async def get_by_email(self, email: str) -> User | None:
 		"""Get user by email address."""
-		result = await self.db.execute(select(UserModel).where(UserModel.email == email))
-		model = result.scalar_one_or_none()
-		return self._to_entity(model) if model else None
+		result = await self.reader.execute(select(*USER_COLUMNS).where(users_table.c.email == email))
+		row = result.one_or_none()
+		return self._row_to_entity(row) if row else None
+
+	async def get_many_by_ids(self, user_ids: list[int]) -> list[User]:
+		"""Get users with ``SELECT ... WHERE id = ANY(:ids)``."""
+		result = await self.reader.execute(select(*USER_COLUMNS).where(self._ids_condition(user_ids)))
+		return [self._row_to_entity(row) for row in result]
+
+	async def get_many_by_emails(self, emails: list[str]) -> list[User]:
+		"""Get users with ``SELECT ... WHERE email = ANY(:emails)``."""
+		condition = users_table.c.email == any_(bindparam("emails", list(emails), type_=ARRAY(String)))
+		result = await self.reader.execute(select(*USER_COLUMNS).where(condition))
+		return [self._row_to_entity(row) for row in result]
 
 	async def list_all(self, skip: int = 0, limit: int = 100) -> list[User]:
 		"""List all users with pagination."""
-		result = await self.db.execute(select(UserModel).offset(skip).limit(limit))
-		models = result.scalars().all()
-		return [self._to_entity(model) for model in models]
+		result = await self.reader.execute(
+			select(*USER_COLUMNS).order_by(users_table.c.created_at, users_table.c.id).offset(skip).limit(limit)
+		)
+		return [self._row_to_entity(row) for row in result]
+
+	async def list_page(self, limit: int = 100, cursor: PageCursor | None = None) -> UserPage:
+		"""List users with keyset pagination ordered by ``(created_at, id)``."""
+		query = select(*USER_COLUMNS).order_by(users_table.c.created_at, users_table.c.id)
+		if cursor is not None:
+			# Row comparison is served by ix_users_created_at_id, so deep pages seek instead of scanning
+			query = query.where(
+				tuple_(users_table.c.created_at, users_table.c.id) > tuple_(literal(cursor.created_at), literal(cursor.id))
+			)
+
+		# Fetch one extra row to know whether another page follows
+		result = await self.reader.execute(query.limit(limit + 1))
+		rows = result.all()
+		users = [self._row_to_entity(row) for row in rows[:limit]]
+
+		next_cursor = None
+		if len(rows) > limit:
+			last = users[-1]
+			next_cursor = PageCursor(created_at=last.created_at, id=last.id)  # type: ignore
+		return UserPage(users=users, next_cursor=next_cursor)
+
+	async def stream_all(self, batch_size: int = 1000) -> AsyncIterator[User]:
+		"""Stream all users ordered by ``(created_at, id)`` from a server-side cursor."""
+		query = (
+			select(*USER_COLUMNS).order_by(users_table.c.created_at, users_table.c.id).execution_options(yield_per=batch_size)
+		)
+		result = await self.reader.stream(query)
+		try:
+			async for row in result:
+				yield self._row_to_entity(row)
+		finally:
+			await result.close()
+
+	async def search(self, query: str, limit: int = 20, cursor: SearchCursor | None = None) -> UserSearchPage:
+		"""Search users with trigram and full-text GIN indexes, ranked by trigram similarity."""
+		# Fetch one extra row to know whether another page follows
+		result = await self.reader.execute(search_query(query, cursor).limit(limit + 1))
+		rows = result.all()
+		users = [self._row_to_entity(row.tuple()[:-1]) for row in rows[:limit]]
+
+		next_cursor = None
+		if len(rows) > limit:
+			last = rows[limit - 1]
+			next_cursor = SearchCursor(score=last[-1], id=last.id)
+		return UserSearchPage(users=users, next_cursor=next_cursor)
+
+	async def count(self, mode: CountMode = CountMode.EXACT) -> int:
+		"""Count all users exactly, from planner statistics, or from the count cache."""
+		if mode is CountMode.ESTIMATED:
+			result = await self.reader.execute(ESTIMATE_QUERY)
+			estimate: int = result.scalar_one()
+			if estimate >= 0:
+				return estimate
+		elif mode is CountMode.CACHED and self.count_cache is not None:
+			cached = self.count_cache.get(users_table.name, None)
+			if cached is not None:
+				return cached
+			total = await self._count_exact()
+			self.count_cache.set(users_table.name, total)
+			return total
+
+		return await self._count_exact()
+
+	async def create(self, user: User) -> User | None:
+		"""Create a new user with ``INSERT ... ON CONFLICT (email) DO NOTHING RETURNING``."""
+		self._wrote = True
+		result = await self.db.execute(
+			insert(UserModel)
+			.values(name=user.name, email=user.email.value, is_active=user.is_active)
+			.on_conflict_do_nothing(index_elements=[UserModel.email])
+			.returning(*USER_COLUMNS)
+		)
+		row = result.one_or_none()
+		return self._row_to_entity(row) if row else None
 
 	async def save(self, user: User) -> User:
 		"""Save user (create or update)."""
+		self._wrote = True
 		if user.id is None:
 			# Create new user
 			model = self._to_model(user)
@@ -52,26 +285,124 @@ class UserRepositoryImpl(UserRepository):
 				raise ValueError(f"User with id {user.id} not found")
 			self._update_model(model, user)
 
-		await self.db.commit()
-		await self.db.refresh(model)
+		# Flushing fetches server-generated columns, see eager_defaults on UserModel
+		await self.db.flush()
 		return self._to_entity(model)
 
+	async def update_fields(self, user_id: int, **changes: object) -> User | None:
+		"""Update only the given columns with a single ``UPDATE ... RETURNING``."""
+		self._wrote = True
+		statement = update(users_table).where(users_table.c.id == user_id).values(**changes).returning(*USER_COLUMNS)
+		try:
+			result = await self.db.execute(statement)
+		except IntegrityError as e:
+			if "email" in changes:
+				raise EmailAlreadyExistsError(str(changes["email"])) from e
+			raise
+		row = result.one_or_none()
+		return self._row_to_entity(row) if row else None
+
+	async def save_many(self, users: list[User]) -> list[User]:
+		"""Create new users with chunked ``INSERT ... ON CONFLICT (email) DO NOTHING RETURNING``."""
+		self._wrote = True
+		created: list[User] = []
+		for start in range(0, len(users), SAVE_MANY_CHUNK_SIZE):
+			chunk = users[start : start + SAVE_MANY_CHUNK_SIZE]
+			statement = (
+				insert(UserModel)
+				.values([{"name": user.name, "email": user.email.value, "is_active": user.is_active} for user in chunk])
+				.on_conflict_do_nothing(index_elements=[UserModel.email])
+				.returning(*USER_COLUMNS)
+			)
+			result = await self.db.execute(statement)
+			created.extend(self._row_to_entity(row) for row in result)
+
+		return created
+
 	async def delete(self, user_id: int) -> bool:
-		"""Delete user by ID."""
-		result = await self.db.execute(select(UserModel).where(UserModel.id == user_id))
-		model = result.scalar_one_or_none()
-		if model is None:
-			return False
+		"""Delete user by ID with a single ``DELETE ... RETURNING``."""
+		return bool(await self._delete(users_table.c.id == user_id))
+
+	async def deactivate_many(self, user_ids: list[int]) -> list[int]:
+		"""Deactivate users with ``UPDATE ... WHERE id = ANY(:ids) RETURNING id``."""
+		return await self._deactivate(self._ids_condition(user_ids))
 
-		await self.db.delete(model)
-		await self.db.commit()
-		return True
+	async def deactivate_where(self, user_filter: UserFilter) -> list[int]:
+		"""Deactivate active users matching a filter with ``UPDATE ... RETURNING id``."""
+		return await self._deactivate(self._filter_condition(user_filter))
+
+	async def delete_many(self, user_ids: list[int]) -> list[int]:
+		"""Delete users with ``DELETE ... WHERE id = ANY(:ids) RETURNING id``."""
+		return await self._delete(self._ids_condition(user_ids))
+
+	async def delete_where(self, user_filter: UserFilter) -> list[int]:
+		"""Delete users matching a filter with ``DELETE ... RETURNING id``."""
+		return await self._delete(self._filter_condition(user_filter))
 
 	async def exists_by_email(self, email: str) -> bool:
 		"""Check if user exists by email."""
-		result = await self.db.execute(select(UserModel.id).where(UserModel.email == email))
+		result = await self.reader.execute(select(UserModel.id).where(UserModel.email == email))
 		return result.scalar_one_or_none() is not None
 
+	async def _count_exact(self) -> int:
+		"""Count all users with ``COUNT(*)``."""
+		result = await self.reader.execute(select(func.count()).select_from(users_table))
+		return result.scalar_one()
+
+	async def _deactivate(self, condition: ColumnElement[bool]) -> list[int]:
+		"""Deactivate active users matching a condition, returning their IDs."""
+		self._wrote = True
+		result = await self.db.execute(
+			update(users_table)
+			.where(condition, users_table.c.is_active.is_(True))
+			.values(is_active=False)
+			.returning(users_table.c.id)
+		)
+		return list(result.scalars())
+
+	async def _delete(self, condition: ColumnElement[bool]) -> list[int]:
+		"""Delete users matching a condition, returning their IDs."""
+		self._wrote = True
+		result = await self.db.execute(delete(users_table).where(condition).returning(users_table.c.id))
+		return list(result.scalars())
+
+	def _ids_condition(self, user_ids: list[int]) -> ColumnElement[bool]:
+		"""Match users by ID with one array parameter, whatever the number of IDs.
+
+		Args:
+		        user_ids: User identifiers
+
+		Returns:
+		        ``id = ANY(:user_ids)`` condition
+		"""
+		condition: ColumnElement[bool] = users_table.c.id == any_(bindparam("user_ids", list(user_ids), type_=ARRAY(Integer)))
+		return condition
+
+	def _filter_condition(self, user_filter: UserFilter) -> ColumnElement[bool]:
+		"""Translate a user filter to a SQL condition.
+
+		Args:
+		        user_filter: Conditions the users must match
+
+		Returns:
+		        Conjunction of the filter's conditions
+
+		Raises:
+		        ValueError: If the filter has no conditions
+		"""
+		if user_filter.is_empty:
+			raise ValueError("User filter must have at least one condition")
+
+		conditions: list[ColumnElement[bool]] = []
+		if user_filter.is_active is not None:
+			conditions.append(users_table.c.is_active.is_(user_filter.is_active))
+		if user_filter.created_before is not None:
+			conditions.append(users_table.c.created_at < user_filter.created_before)
+		if user_filter.changed_before is not None:
+			last_change = func.coalesce(users_table.c.updated_at, users_table.c.created_at)
+			conditions.append(last_change < user_filter.changed_before)
+		return and_(*conditions)
+
 	def _to_entity(self, model: UserModel) -> User:
 		"""Convert SQLAlchemy model to domain entity.
 
@@ -81,15 +412,29 @@ class UserRepositoryImpl(UserRepository):
 		Returns:
 		        User domain entity
 		"""
-		return User(
-			id=model.id,
+		return User.restore(
+			user_id=model.id,
 			name=model.name,
-			email=Email(model.email),
+			email=Email.trusted(model.email),
 			is_active=model.is_active,
 			created_at=model.created_at,
 			updated_at=model.updated_at,
 		)
 
+	def _row_to_entity(self, row: Row[Any] | tuple[Any, ...]) -> User:
+		"""Convert a row of ``USER_COLUMNS`` to domain entity.
+
+		Stored rows were validated on write, so validation is skipped.
+
+		Args:
+		        row: Row tuple in ``USER_COLUMNS`` order
+
+		Returns:
+		        User domain entity
+		"""
+		user_id, name, email, is_active, created_at, updated_at = row
+		return User.restore(user_id, name, Email.trusted(email), is_active, created_at, updated_at)
+
 	def _to_model(self, entity: User) -> UserModel:
 		"""Convert domain entity to SQLAlchemy model.
 
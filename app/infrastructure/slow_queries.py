@@ -0,0 +1,208 @@
+"""Slow SQL statement recording with sampled EXPLAIN plans."""
+
+import asyncio
+import contextvars
+import logging
+import random
+import re
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+# Attribute of the statement's execution context holding its start time, gone with the context if it raises
+_STARTED_ATTR = "_slow_query_started"
+
+# EXPLAIN ANALYZE, when enabled, executes the statement again, so only plain reads are explained
+_READ_ONLY = re.compile(r"^\s*SELECT\b", re.IGNORECASE)
+_LOCKING = re.compile(r"\bFOR\s+(NO\s+KEY\s+)?(UPDATE|SHARE|KEY\s+SHARE)\b", re.IGNORECASE)
+
+# Route template of the request executing statements, set per request
+query_origin: contextvars.ContextVar[str | None] = contextvars.ContextVar("query_origin", default=None)
+
+# Set in EXPLAIN tasks so their own statements aren't recorded
+_explaining: contextvars.ContextVar[bool] = contextvars.ContextVar("slow_query_explaining", default=False)
+
+
+@dataclass(slots=True)
+class SlowQuery:
+	"""A statement that ran longer than the slow query threshold."""
+
+	statement: str
+	parameters: list[str] | dict[str, str]
+	duration_seconds: float
+	engine: str
+	route: str | None
+	recorded_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+	plan: Any = None
+
+
+def parameter_shapes(parameters: Any) -> list[str] | dict[str, str]:
+	"""Describe bound parameters by type and length, never by value.
+
+	Args:
+	        parameters: DBAPI parameters of one statement execution
+
+	Returns:
+	        Type names in parameter order, or by name for named parameters
+	"""
+
+	def shape(value: object) -> str:
+		if isinstance(value, list | tuple | set | frozenset | str | bytes):
+			return f"{type(value).__name__}[{len(value)}]"
+		return type(value).__name__
+
+	if isinstance(parameters, dict):
+		return {name: shape(value) for name, value in parameters.items()}
+	return [shape(value) for value in parameters or ()]
+
+
+class SlowQueryLog:
+	"""Records slow statements of instrumented engines into a ring buffer.
+
+	Statements above the threshold are logged with their parameter shapes,
+	duration and originating route. A sample of slow reads is explained in a
+	background task on the same engine, one at a time, and the plan is
+	attached to the recorded entry. Plain ``EXPLAIN`` only plans the statement;
+	``EXPLAIN (ANALYZE, BUFFERS)`` runs it again with whatever side effects its
+	functions have, so it is opt-in. Either way the EXPLAIN runs in a read-only
+	transaction under a statement timeout.
+	"""
+
+	def __init__(
+		self,
+		threshold_seconds: float,
+		explain_sample_rate: float = 0.0,
+		explain_analyze: bool = False,
+		explain_timeout_seconds: float = 5.0,
+		max_entries: int = 100,
+		sample: Callable[[], float] = random.random,
+	) -> None:
+		"""Initialize log.
+
+		Args:
+		        threshold_seconds: Statements taking at least this long are recorded
+		        explain_sample_rate: Fraction of slow reads to EXPLAIN, 0 disables EXPLAIN
+		        explain_analyze: Execute explained reads again for actual row counts and timings
+		        explain_timeout_seconds: Statement timeout of each EXPLAIN
+		        max_entries: Most recent slow statements kept
+		        sample: Random source in [0, 1), replaceable in tests
+		"""
+		self._threshold = threshold_seconds
+		self._explain_sample_rate = explain_sample_rate
+		self._explain_options = "ANALYZE, BUFFERS, FORMAT JSON" if explain_analyze else "FORMAT JSON"
+		self._explain_timeout_ms = max(1, round(explain_timeout_seconds * 1000))
+		self._sample = sample
+		self._entries: deque[SlowQuery] = deque(maxlen=max_entries)
+		self._explain_task: asyncio.Task[None] | None = None
+
+	def entries(self) -> list[SlowQuery]:
+		"""Return recorded slow statements, most recent first."""
+		return list(reversed(self._entries))
+
+	def clear(self) -> None:
+		"""Forget recorded slow statements."""
+		self._entries.clear()
+
+	async def wait_for_explain(self) -> None:
+		"""Wait for the EXPLAIN in progress, if any."""
+		if self._explain_task is not None:
+			await asyncio.shield(self._explain_task)
+
+	def attach(self, name: str, engine: AsyncEngine) -> None:
+		"""Record slow statements executed on an engine.
+
+		Args:
+		        name: Engine name reported with its slow statements
+		        engine: Engine to instrument
+		"""
+
+		def before_cursor_execute(
+			_conn: Connection, _cursor: Any, _statement: str, _parameters: Any, context: ExecutionContext, *_args: Any
+		) -> None:
+			setattr(context, _STARTED_ATTR, time.perf_counter())
+
+		def after_cursor_execute(
+			_conn: Connection,
+			_cursor: Any,
+			statement: str,
+			parameters: Any,
+			context: ExecutionContext,
+			executemany: bool,
+		) -> None:
+			started = getattr(context, _STARTED_ATTR, None)
+			if started is None:
+				return
+			duration = time.perf_counter() - started
+			if duration < self._threshold or _explaining.get():
+				return
+			self._record(engine, name, statement, parameters, duration, executemany)
+
+		event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+		event.listen(engine.sync_engine, "after_cursor_execute", after_cursor_execute)
+
+	def _record(
+		self,
+		engine: AsyncEngine,
+		name: str,
+		statement: str,
+		parameters: Any,
+		duration: float,
+		executemany: bool,
+	) -> None:
+		"""Record a slow statement and maybe schedule its EXPLAIN."""
+		shapes = parameter_shapes(parameters[0] if executemany and parameters else parameters)
+		entry = SlowQuery(
+			statement=statement,
+			parameters=shapes,
+			duration_seconds=duration,
+			engine=name,
+			route=query_origin.get(),
+		)
+		self._entries.append(entry)
+		logger.warning(
+			"Slow query on %s took %.1f ms (route %s, parameters %s): %s",
+			name,
+			duration * 1000,
+			entry.route,
+			shapes,
+			statement,
+		)
+
+		if (
+			executemany
+			or self._explain_sample_rate <= 0
+			or engine.dialect.name != "postgresql"
+			or not _READ_ONLY.match(statement)
+			or _LOCKING.search(statement)
+			or (self._explain_task is not None and not self._explain_task.done())
+			or self._sample() >= self._explain_sample_rate
+		):
+			return
+		# Fresh context, so the EXPLAIN isn't counted against the request
+		self._explain_task = asyncio.get_running_loop().create_task(
+			self._explain(engine, entry, statement, parameters),
+			context=contextvars.Context(),
+		)
+
+	async def _explain(self, engine: AsyncEngine, entry: SlowQuery, statement: str, parameters: Any) -> None:
+		"""Attach the plan of a slow read to its entry."""
+		_explaining.set(True)
+		try:
+			async with engine.connect() as connection:
+				# Writes from volatile functions fail rather than run, and nothing runs for long
+				await connection.exec_driver_sql("SET TRANSACTION READ ONLY")
+				await connection.exec_driver_sql(f"SET LOCAL statement_timeout = {self._explain_timeout_ms}")
+				result = await connection.exec_driver_sql(f"EXPLAIN ({self._explain_options}) {statement}", parameters)
+				entry.plan = result.scalar_one()
+				await connection.rollback()
+		except Exception:
+			logger.exception("EXPLAIN of slow query failed")
@@ -0,0 +1,61 @@
+"""Unit of work implementation using SQLAlchemy."""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.repositories.unit_of_work import UnitOfWork
+from app.domain.repositories.user_repository import UserRepository
+from app.infrastructure.cache import LRUCache
+from app.infrastructure.repositories.cached_user_repository import CachedUserRepository, UserCache
+from app.infrastructure.repositories.coalescing_user_repository import CoalescingUserRepository, ReadCoalescer
+from app.infrastructure.repositories.job_queue_impl import SqlAlchemyJobQueue
+from app.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+
+
+class SqlAlchemyUnitOfWork(UnitOfWork):
+	"""SQLAlchemy implementation of UnitOfWork sharing one session between repositories and the job queue."""
+
+	def __init__(
+		self,
+		session: AsyncSession,
+		read_session: AsyncSession | None = None,
+		user_cache: UserCache | None = None,
+		count_cache: LRUCache[str, int] | None = None,
+		coalescer: ReadCoalescer | None = None,
+		consistent_reads: bool = False,
+	) -> None:
+		"""Initialize unit of work with database sessions.
+
+		Args:
+		        session: Async database session on the primary
+		        read_session: Optional session on a read replica for reads
+		        user_cache: Optional cache to read users through
+		        count_cache: Optional cache for CACHED user counts
+		        coalescer: Optional registry sharing lookups with concurrent requests, only for read-only work
+		        consistent_reads: Whether reads must see every committed write, so bypass the user cache
+		"""
+		self.session = session
+		users: UserRepository = UserRepositoryImpl(session, read_db=read_session, count_cache=count_cache)
+		# Replica reads aren't cached, as a lagging replica may still hold rows that a commit invalidated
+		self._cached_users = (
+			CachedUserRepository(users, user_cache, serve=not consistent_reads, fill=read_session is None)
+			if user_cache is not None
+			else None
+		)
+		users = self._cached_users or users
+		if coalescer is not None:
+			# Outermost, so only the request running a shared miss caches its result
+			users = CoalescingUserRepository(users, coalescer)
+		self.users = users
+		self.jobs = SqlAlchemyJobQueue(session)
+
+	async def commit(self) -> None:
+		"""Commit the session transaction, then invalidate cached users it changed."""
+		await self.session.commit()
+		if self._cached_users is not None:
+			self._cached_users.commit_invalidations()
+
+	async def rollback(self) -> None:
+		"""Roll back the session transaction, keeping cached users as they were."""
+		await self.session.rollback()
+		if self._cached_users is not None:
+			self._cached_users.discard_invalidations()
@@ -1,18 +1,61 @@
 """FastAPI application entry point."""
 
-from fastapi import FastAPI
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 from app.config import settings
-from app.presentation.api.v1 import users
+from app.dependencies import auth_http_client, track_query_origin
+from app.infrastructure.database import close_db, database_check, engine, open_db, replica_engines
+from app.infrastructure.query_stats import instrument_queries
+from app.infrastructure.repositories.user_repository_impl import warm_statement_cache
+from app.presentation.api.v1 import admin, exports, users
+from app.presentation.middleware.admission import AdmissionControlMiddleware, ConcurrencyLimiter, TokenBucketLimiter
+from app.presentation.middleware.metrics import MetricsMiddleware
+
+# Probes and scrapes, answered even under overload
+PROBE_PATHS = ("/health", "/ready", "/metrics")
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+	"""Open database connections before serving and close connections after the last request."""
+	if settings.db_pool_prewarm:
+		await open_db(warm_up=warm_statement_cache)
+	yield
+	await close_db()
+	await auth_http_client.aclose()
+
 
 app = FastAPI(
+	lifespan=lifespan,
 	title=settings.app_name,
 	description="Backend API for registered association management",
 	version="0.1.0",
 	docs_url="/docs",
 	redoc_url="/redoc",
 	openapi_url="/openapi.json",
+	dependencies=[Depends(track_query_origin)],
+)
+
+# Load shedding, inside CORS so rejections carry CORS headers
+app.add_middleware(
+	AdmissionControlMiddleware,
+	limiter=ConcurrencyLimiter(
+		limit=settings.admission_max_concurrency or settings.db_pool_size + settings.db_max_overflow,
+		max_queue=settings.admission_max_queue,
+		queue_timeout=settings.admission_queue_timeout_seconds,
+	),
+	rate_limiter=(
+		TokenBucketLimiter(rate=settings.rate_limit_per_second, burst=settings.rate_limit_burst)
+		if settings.rate_limit_per_second > 0
+		else None
+	),
+	exempt_paths=PROBE_PATHS,
+	trusted_proxies=settings.rate_limit_trusted_proxies,
 )
 
 # CORS middleware
@@ -24,6 +67,11 @@ app.add_middleware(
 	allow_headers=["*"],
 )
 
+# Request metrics, added last so they time every other middleware too
+if settings.metrics_enabled:
+	instrument_queries([engine, *replica_engines.values()])
+	app.add_middleware(MetricsMiddleware)
+
 
 @app.get("/health", tags=["health"])
 async def health_check() -> dict[str, str]:
@@ -35,5 +83,25 @@ async def health_check() -> dict[str, str]:
 	}
 
 
+@app.get("/ready", tags=["health"])
+async def readiness_check(response: Response) -> dict[str, str]:
+	"""Readiness endpoint, 503 while the database is unreachable.
+
+	The database check is cached for READINESS_CACHE_SECONDS, so probes don't load it.
+	"""
+	if await database_check.is_healthy():
+		return {"status": "ready"}
+	response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+	return {"status": "unavailable"}
+
+
+@app.get("/metrics", tags=["health"], include_in_schema=False)
+async def metrics() -> Response:
+	"""Prometheus metrics endpoint."""
+	return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 # Include routers
 app.include_router(users.router, prefix="/api/v1", tags=["users"])
+app.include_router(exports.router, prefix="/api/v1", tags=["exports"])
+app.include_router(admin.router, prefix="/api/v1", tags=["admin"])
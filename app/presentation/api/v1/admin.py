@@ -0,0 +1,18 @@
+"""Admin API endpoints."""
+
+from fastapi import APIRouter, Depends
+
+from app.dependencies import require_admin
+from app.infrastructure.database import slow_query_log
+from app.presentation.schemas.admin import SlowQueryResponse
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+@router.get("/admin/slow-queries", response_model=list[SlowQueryResponse])
+async def list_slow_queries() -> list[SlowQueryResponse]:
+	"""List the most recent slow SQL statements of this worker, newest first.
+
+	Empty unless SLOW_QUERY_LOG_ENABLED is set.
+	"""
+	return [SlowQueryResponse.from_entry(entry) for entry in slow_query_log.entries()]
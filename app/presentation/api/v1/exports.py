@@ -0,0 +1,97 @@
+"""Export API endpoints."""
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager
+from enum import StrEnum
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from app.dependencies import get_user_repository_scope, require_admin
+from app.domain.entities.user import User
+from app.domain.repositories.user_repository import UserRepository
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+# Rows encoded per response chunk
+CHUNK_ROWS = 500
+
+CSV_COLUMNS = ("id", "name", "email", "is_active", "created_at", "updated_at")
+
+
+class ExportFormat(StrEnum):
+	"""Supported export encodings."""
+
+	NDJSON = "ndjson"
+	CSV = "csv"
+
+
+MEDIA_TYPES = {
+	ExportFormat.NDJSON: "application/x-ndjson",
+	ExportFormat.CSV: "text/csv",
+}
+
+
+def _user_row(user: User) -> tuple[object, ...]:
+	"""Flatten a user into export column order."""
+	return (
+		user.id,
+		user.name,
+		user.email.value,
+		user.is_active,
+		user.created_at.isoformat() if user.created_at else None,
+		user.updated_at.isoformat() if user.updated_at else None,
+	)
+
+
+def _encode_ndjson(users: list[User]) -> bytes:
+	"""Encode users as newline-delimited JSON."""
+	return "".join(
+		json.dumps(dict(zip(CSV_COLUMNS, _user_row(user), strict=True)), separators=(",", ":")) + "\n" for user in users
+	).encode()
+
+
+def _encode_csv(users: list[User]) -> bytes:
+	"""Encode users as CSV rows without a header."""
+	buffer = io.StringIO()
+	csv.writer(buffer).writerows(_user_row(user) for user in users)
+	return buffer.getvalue().encode()
+
+
+async def _export_chunks(
+	repository_scope: Callable[[], AbstractAsyncContextManager[UserRepository]],
+	export_format: ExportFormat,
+) -> AsyncIterator[bytes]:
+	"""Stream encoded chunks of the member roster."""
+	encode = _encode_csv if export_format is ExportFormat.CSV else _encode_ndjson
+	if export_format is ExportFormat.CSV:
+		yield (",".join(CSV_COLUMNS) + "\r\n").encode()
+
+	async with repository_scope() as repository:
+		batch: list[User] = []
+		async for user in repository.stream_all(batch_size=CHUNK_ROWS):
+			batch.append(user)
+			if len(batch) >= CHUNK_ROWS:
+				yield encode(batch)
+				batch = []
+		if batch:
+			yield encode(batch)
+
+
+@router.get("/exports/users", summary="Export all users", response_class=StreamingResponse)
+async def export_users(
+	repository_scope: Annotated[
+		Callable[[], AbstractAsyncContextManager[UserRepository]], Depends(get_user_repository_scope)
+	],
+	export_format: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.NDJSON,
+) -> StreamingResponse:
+	"""Stream the whole member roster as NDJSON or CSV with flat memory use."""
+	return StreamingResponse(
+		_export_chunks(repository_scope, export_format),
+		media_type=MEDIA_TYPES[export_format],
+		headers={"Content-Disposition": f'attachment; filename="users.{export_format.value}"'},
+	)
@@ -1,17 +1,251 @@
 """User API endpoints."""
 
-from fastapi import APIRouter
+from typing import Annotated
 
-router = APIRouter()
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 
+from app.application.dtos.user_dto import BulkCreateStatus, CreateUserDTO, UpdateUserDTO
+from app.application.use_cases.bulk_create_users import BulkCreateUsersUseCase
+from app.application.use_cases.deactivate_users import DeactivateUsersUseCase
+from app.application.use_cases.delete_users import DeleteUsersUseCase
+from app.application.use_cases.import_users import ImportUsersUseCase
+from app.application.use_cases.update_user import UpdateUserUseCase
+from app.dependencies import get_unit_of_work, get_user_repository, require_admin
+from app.domain.exceptions import EmailAlreadyExistsError, UserNotFoundError
+from app.domain.repositories.unit_of_work import UnitOfWork
+from app.domain.repositories.user_repository import CountMode, UserFilter, UserPage, UserRepository
+from app.domain.value_objects.page_cursor import PageCursor, SearchCursor
+from app.presentation.middleware.conditional import ConditionalRequest
+from app.presentation.responses import json_response
+from app.presentation.schemas.user import (
+	UserBulkActionResponse,
+	UserBulkCreate,
+	UserBulkCreateResponse,
+	UserBulkCreateResult,
+	UserBulkSelection,
+	UserImportResponse,
+	UserListResponse,
+	UserResponse,
+	UserSearchResponse,
+	UserUpdate,
+)
 
-@router.get("/users", summary="List all users")
-async def list_users() -> dict[str, str]:
-	"""List all users - placeholder endpoint."""
-	return {"message": "User list endpoint - to be implemented"}
+router = APIRouter(default_response_class=ORJSONResponse)
 
+# Serializers for the hot read paths, which return pre-rendered JSON
+USER_ADAPTER = TypeAdapter(UserResponse)
+USER_LIST_ADAPTER = TypeAdapter(UserListResponse)
+USER_SEARCH_ADAPTER = TypeAdapter(UserSearchResponse)
+USER_BULK_CREATE_ADAPTER = TypeAdapter(UserBulkCreateResponse)
 
-@router.get("/users/{user_id}", summary="Get user by ID")
-async def get_user(user_id: int) -> dict[str, int]:
-	"""Get user by ID - placeholder endpoint."""
-	return {"message": "Get user endpoint - to be implemented", "user_id": user_id}
+
+@router.get("/users", summary="List all users", response_model=UserListResponse)
+async def list_users(
+	repository: Annotated[UserRepository, Depends(get_user_repository)],
+	conditional: Annotated[ConditionalRequest, Depends()],
+	limit: Annotated[int, Query(ge=1, le=1000, description="Maximum number of records to return")] = 100,
+	cursor: Annotated[str | None, Query(description="Cursor from a previous page's next_cursor")] = None,
+	skip: Annotated[int, Query(ge=0, description="Offset pagination, prefer cursor for deep pages")] = 0,
+	count: Annotated[
+		CountMode, Query(description="How total is computed: exact, estimated from planner statistics, or cached")
+	] = CountMode.CACHED,
+) -> Response:
+	"""List users, paginated by cursor (keyset) or by offset.
+
+	Entity tags cover the count mode and the total, so a client's copy is only
+	as fresh as the total it asked for. Revalidations are answered with
+	``304 Not Modified`` from them and a table watermark when the client's copy
+	is current. Other requests are tagged from the page rows instead, sparing
+	them the watermark query.
+	"""
+	if cursor is not None and skip:
+		raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Use either cursor or skip, not both")
+	try:
+		page_cursor = PageCursor.decode(cursor) if cursor is not None else None
+	except ValueError as e:
+		raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+	# Deletes only show in the total, so lists get no Last-Modified
+	total = await repository.count(count)
+	watermark = None
+	if conditional.has_validators:
+		watermark = await repository.get_watermark()
+		not_modified = conditional.evaluate(count.value, total, watermark.last_id, watermark.last_updated_at)
+		if not_modified is not None:
+			return not_modified
+
+	if skip:
+		users = await repository.list_all(skip=skip, limit=limit)
+		last = users[-1] if len(users) == limit else None
+		page = UserPage(
+			users=users,
+			next_cursor=PageCursor(created_at=last.created_at, id=last.id) if last else None,  # type: ignore
+		)
+	else:
+		page = await repository.list_page(limit=limit, cursor=page_cursor)
+
+	versions = [(user.id, user.updated_at or user.created_at) for user in page.users]
+	if watermark is None:
+		# Only sets the validators, as the request carries none to check
+		conditional.evaluate(count.value, total, *versions)
+	elif conditional.matches(count.value, total, *versions):
+		# Tagged from the page earlier, the 304 hands the client the watermark's tag for next time
+		return conditional.not_modified()
+
+	body = UserListResponse(
+		users=[UserResponse.from_entity(user) for user in page.users],
+		total=total,
+		skip=skip,
+		limit=limit,
+		next_cursor=page.next_cursor.encode() if page.next_cursor else None,
+	)
+	return json_response(USER_LIST_ADAPTER, body, conditional.response)
+
+
+@router.get("/users/search", summary="Search users", response_model=UserSearchResponse)
+async def search_users(
+	repository: Annotated[UserRepository, Depends(get_user_repository)],
+	q: Annotated[str, Query(min_length=3, max_length=255, description="Part of a name or email address")],
+	limit: Annotated[int, Query(ge=1, le=100, description="Maximum number of records to return")] = 20,
+	cursor: Annotated[str | None, Query(description="Cursor from a previous page's next_cursor")] = None,
+) -> Response:
+	"""Search users by partial name or email, best matches first."""
+	try:
+		search_cursor = SearchCursor.decode(cursor) if cursor is not None else None
+	except ValueError as e:
+		raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+	page = await repository.search(q, limit=limit, cursor=search_cursor)
+	body = UserSearchResponse(
+		users=[UserResponse.from_entity(user) for user in page.users],
+		next_cursor=page.next_cursor.encode() if page.next_cursor else None,
+	)
+	return json_response(USER_SEARCH_ADAPTER, body)
+
+
+@router.post("/users/bulk", summary="Import users in bulk", response_model=UserBulkCreateResponse)
+async def bulk_create_users(
+	payload: UserBulkCreate,
+	unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
+) -> Response:
+	"""Create a batch of users in one transaction, reporting the outcome of each row."""
+	results = await BulkCreateUsersUseCase(unit_of_work).execute(
+		[CreateUserDTO(name=row.name, email=row.email) for row in payload.users]
+	)
+	statuses = [result.status for result in results]
+	body = UserBulkCreateResponse(
+		results=[
+			UserBulkCreateResult(
+				index=result.index,
+				email=result.email,
+				status=result.status,
+				user=UserResponse.model_validate(result.user) if result.user else None,
+				error=result.error,
+			)
+			for result in results
+		],
+		created=statuses.count(BulkCreateStatus.CREATED),
+		duplicates=statuses.count(BulkCreateStatus.DUPLICATE),
+		invalid=statuses.count(BulkCreateStatus.INVALID),
+	)
+	return json_response(USER_BULK_CREATE_ADAPTER, body)
+
+
+@router.post(
+	"/users/imports",
+	summary="Import users in the background",
+	response_model=UserImportResponse,
+	status_code=status.HTTP_202_ACCEPTED,
+)
+async def import_users(
+	payload: UserBulkCreate,
+	unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
+) -> UserImportResponse:
+	"""Queue a batch of users for the job worker to create, with the same per-row rules as a bulk import."""
+	job_id = await ImportUsersUseCase(unit_of_work).execute(
+		[CreateUserDTO(name=row.name, email=row.email) for row in payload.users]
+	)
+	return UserImportResponse(job_id=job_id)
+
+
+@router.post(
+	"/users/bulk/deactivate",
+	summary="Deactivate users in bulk",
+	response_model=UserBulkActionResponse,
+	dependencies=[Depends(require_admin)],
+)
+async def bulk_deactivate_users(
+	payload: UserBulkSelection,
+	unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
+) -> UserBulkActionResponse:
+	"""Deactivate the selected users with a single statement."""
+	selection: list[int] | UserFilter = payload.ids if payload.ids is not None else payload.to_filter()
+	user_ids = await DeactivateUsersUseCase(unit_of_work).execute(selection)
+	return UserBulkActionResponse(ids=user_ids, count=len(user_ids))
+
+
+@router.post(
+	"/users/bulk/delete",
+	summary="Delete users in bulk",
+	response_model=UserBulkActionResponse,
+	dependencies=[Depends(require_admin)],
+)
+async def bulk_delete_users(
+	payload: UserBulkSelection,
+	unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
+) -> UserBulkActionResponse:
+	"""Delete the selected users with a single statement."""
+	selection: list[int] | UserFilter = payload.ids if payload.ids is not None else payload.to_filter()
+	user_ids = await DeleteUsersUseCase(unit_of_work).execute(selection)
+	return UserBulkActionResponse(ids=user_ids, count=len(user_ids))
+
+
+@router.get("/users/{user_id}", summary="Get user by ID", response_model=UserResponse)
+async def get_user(
+	user_id: int,
+	repository: Annotated[UserRepository, Depends(get_user_repository)],
+	conditional: Annotated[ConditionalRequest, Depends()],
+) -> Response:
+	"""Get user by ID.
+
+	Revalidations are answered with ``304 Not Modified`` from the user's
+	timestamps, without loading the user, when the client's copy is current.
+	"""
+	if not conditional.has_validators:
+		user = await repository.get_by_id(user_id)
+		if user is None:
+			raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(UserNotFoundError(user_id)))
+		last_modified = user.updated_at or user.created_at
+		conditional.evaluate(last_modified.isoformat(), last_modified=last_modified)  # type: ignore
+		return json_response(USER_ADAPTER, UserResponse.from_entity(user), conditional.response)
+
+	last_modified = await repository.get_last_modified(user_id)
+	if last_modified is not None:
+		not_modified = conditional.evaluate(last_modified.isoformat(), last_modified=last_modified)
+		if not_modified is not None:
+			return not_modified
+		user = await repository.get_by_id(user_id)
+		if user is not None:
+			return json_response(USER_ADAPTER, UserResponse.from_entity(user), conditional.response)
+	raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(UserNotFoundError(user_id)))
+
+
+@router.patch("/users/{user_id}", summary="Update user", response_model=UserResponse)
+async def update_user(
+	user_id: int,
+	payload: UserUpdate,
+	unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
+) -> UserResponse:
+	"""Update only the fields present in the request, in a single round trip."""
+	data = UpdateUserDTO(**payload.model_dump(exclude_unset=True, exclude_none=True))
+	try:
+		user = await UpdateUserUseCase(unit_of_work).execute(user_id, data)
+	except UserNotFoundError as e:
+		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+	except EmailAlreadyExistsError as e:
+		raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
+	except ValueError as e:
+		raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+	return UserResponse.model_validate(user)
@@ -0,0 +1,260 @@
+"""Admission control and per-client rate limiting middleware."""
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import Callable, Collection
+from dataclasses import dataclass
+from ipaddress import IPv4Network, IPv6Network, ip_address, ip_network
+
+from prometheus_client import Counter, Gauge, Histogram
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.infrastructure.cache import LRUCache
+
+ADMISSION_IN_FLIGHT = Gauge(
+	"http_admission_in_flight",
+	"Admitted requests currently being handled",
+)
+ADMISSION_QUEUE_DEPTH = Gauge(
+	"http_admission_queue_depth",
+	"Requests waiting for admission",
+)
+ADMISSION_WAIT = Histogram(
+	"http_admission_wait_seconds",
+	"Time requests waited for admission",
+	buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+ADMISSION_REJECTIONS = Counter(
+	"http_admission_rejections_total",
+	"Requests turned away before reaching a handler",
+	["reason"],
+)
+
+
+class ConcurrencyLimiter:
+	"""Caps concurrent requests, with a bounded FIFO queue whose waiters give up after a deadline.
+
+	Not thread-safe; meant to be shared between coroutines of one event loop.
+	"""
+
+	def __init__(self, limit: int, max_queue: int, queue_timeout: float) -> None:
+		"""Initialize limiter.
+
+		Args:
+		        limit: Requests handled at the same time
+		        max_queue: Requests allowed to wait for a free slot
+		        queue_timeout: Seconds a request waits before it is rejected
+		"""
+		self.limit = limit
+		self.max_queue = max_queue
+		self.queue_timeout = queue_timeout
+		self.active = 0
+		self._waiters: deque[asyncio.Future[None]] = deque()
+
+	async def acquire(self) -> str | None:
+		"""Take a free slot, waiting in line for one if needed.
+
+		Returns:
+		        None once admitted, else why the request was rejected
+		"""
+		if self.active < self.limit and not self._waiters:
+			self.active += 1
+			ADMISSION_IN_FLIGHT.inc()
+			return None
+		if len(self._waiters) >= self.max_queue:
+			return "queue_full"
+
+		waiter = asyncio.get_running_loop().create_future()
+		self._waiters.append(waiter)
+		ADMISSION_QUEUE_DEPTH.set(len(self._waiters))
+		started = time.perf_counter()
+		try:
+			async with asyncio.timeout(self.queue_timeout):
+				await waiter
+		except TimeoutError:
+			self._pass_on(waiter)
+			return "queue_timeout"
+		except asyncio.CancelledError:
+			self._pass_on(waiter)
+			raise
+		finally:
+			if waiter in self._waiters:
+				self._waiters.remove(waiter)
+			ADMISSION_QUEUE_DEPTH.set(len(self._waiters))
+			ADMISSION_WAIT.observe(time.perf_counter() - started)
+		return None
+
+	def release(self) -> None:
+		"""Hand the slot of a finished request to the next waiter, or free it."""
+		ADMISSION_IN_FLIGHT.dec()
+		while self._waiters:
+			waiter = self._waiters.popleft()
+			if not waiter.done():
+				waiter.set_result(None)
+				ADMISSION_IN_FLIGHT.inc()
+				return
+		self.active -= 1
+
+	def _pass_on(self, waiter: asyncio.Future[None]) -> None:
+		"""Release a slot handed to a waiter that gave up at the same moment."""
+		if waiter.done() and not waiter.cancelled():
+			self.release()
+
+
+@dataclass(slots=True)
+class _Bucket:
+	"""Tokens left in a client's bucket when it was last used."""
+
+	tokens: float
+	updated_at: float
+
+
+class TokenBucketLimiter:
+	"""Per-client token buckets refilled at a steady rate.
+
+	Buckets of clients idle long enough to be full again are indistinguishable
+	from new ones, so they are kept in an LRU cache that forgets them then.
+	"""
+
+	def __init__(
+		self,
+		rate: float,
+		burst: int,
+		max_clients: int = 10_000,
+		clock: Callable[[], float] = time.monotonic,
+	) -> None:
+		"""Initialize limiter.
+
+		Args:
+		        rate: Requests per second each client may sustain
+		        burst: Requests a client may make at once after being idle
+		        max_clients: Clients tracked at once
+		        clock: Monotonic time source in seconds
+		"""
+		self.rate = rate
+		self.burst = burst
+		self._clock = clock
+		self._buckets: LRUCache[str, _Bucket] = LRUCache(max_size=max_clients, ttl=burst / rate, clock=clock)
+
+	def acquire(self, client: str) -> float:
+		"""Take a token from a client's bucket.
+
+		Args:
+		        client: Client identity
+
+		Returns:
+		        0 when a token was taken, else seconds until one is available
+		"""
+		now = self._clock()
+		bucket = self._buckets.get(client, None)
+		tokens = float(self.burst)
+		if bucket is not None:
+			tokens = min(tokens, bucket.tokens + (now - bucket.updated_at) * self.rate)
+		if tokens < 1:
+			self._buckets.set(client, _Bucket(tokens, now))
+			return (1 - tokens) / self.rate
+		self._buckets.set(client, _Bucket(tokens - 1, now))
+		return 0.0
+
+
+class AdmissionControlMiddleware:
+	"""ASGI middleware shedding load before it queues on the database pool.
+
+	Requests over a client's rate limit get ``429``. The rest are admitted up
+	to the concurrency limit, sized to the connection pool; beyond it a bounded
+	number wait for a slot until the queue timeout, and others get ``503``
+	right away. Both carry ``Retry-After``.
+
+	Clients are told apart by address. Behind proxies listed in
+	``trusted_proxies``, that is the nearest address in ``X-Forwarded-For``
+	not added by one of them, so clients can't pick a bucket by sending the
+	header themselves.
+	"""
+
+	def __init__(
+		self,
+		app: ASGIApp,
+		limiter: ConcurrencyLimiter,
+		rate_limiter: TokenBucketLimiter | None = None,
+		exempt_paths: Collection[str] = (),
+		trusted_proxies: Collection[str] = (),
+	) -> None:
+		"""Initialize middleware.
+
+		Args:
+		        app: Wrapped ASGI application
+		        limiter: Concurrency limit shared by admitted requests
+		        rate_limiter: Optional per-client rate limit
+		        exempt_paths: Paths never limited, such as probes
+		        trusted_proxies: Addresses or networks of proxies whose X-Forwarded-For is believed
+		"""
+		self.app = app
+		self.limiter = limiter
+		self.rate_limiter = rate_limiter
+		self.exempt_paths = frozenset(exempt_paths)
+		self.trusted_proxies: list[IPv4Network | IPv6Network] = [ip_network(proxy, strict=False) for proxy in trusted_proxies]
+
+	async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+		"""Admit, queue or reject a request."""
+		if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+			await self.app(scope, receive, send)
+			return
+
+		if self.rate_limiter is not None:
+			retry_after = self.rate_limiter.acquire(self._client_address(scope))
+			if retry_after:
+				ADMISSION_REJECTIONS.labels("rate_limited").inc()
+				await self._reject(429, "Too many requests", retry_after, scope, receive, send)
+				return
+
+		rejected = await self.limiter.acquire()
+		if rejected is not None:
+			ADMISSION_REJECTIONS.labels(rejected).inc()
+			await self._reject(503, "Server busy, retry later", 1.0, scope, receive, send)
+			return
+		try:
+			await self.app(scope, receive, send)
+		finally:
+			self.limiter.release()
+
+	def _client_address(self, scope: Scope) -> str:
+		"""Address of the client behind any trusted proxies."""
+		client = scope.get("client")
+		peer: str = client[0] if client else ""
+		if not self.trusted_proxies:
+			return peer
+		forwarded: list[str] = [
+			hop.strip()
+			for name, value in scope["headers"]
+			if name == b"x-forwarded-for"
+			for hop in value.decode("latin-1").split(",")
+		]
+		hops = [*forwarded, peer]
+		# Each proxy appends the address it got the request from, so walk back from the nearest
+		for hop in reversed(hops):
+			if not self._is_trusted(hop):
+				return hop
+		return hops[0]
+
+	def _is_trusted(self, address: str) -> bool:
+		"""Whether an address belongs to a trusted proxy."""
+		try:
+			parsed = ip_address(address)
+		except ValueError:
+			return False
+		return any(parsed in network for network in self.trusted_proxies)
+
+	@staticmethod
+	async def _reject(
+		status_code: int, detail: str, retry_after: float, scope: Scope, receive: Receive, send: Send
+	) -> None:
+		"""Answer without reaching the application."""
+		response = JSONResponse(
+			{"detail": detail},
+			status_code=status_code,
+			headers={"Retry-After": str(math.ceil(retry_after))},
+		)
+		await response(scope, receive, send)
@@ -0,0 +1,103 @@
+"""Conditional GET support with ETag and Last-Modified validators."""
+
+import hashlib
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response, status
+
+
+class ConditionalRequest:
+	"""Dependency answering conditional GETs before the full response is built.
+
+	Routes derive validators from a cheap version query, call ``evaluate`` and
+	return its 304 response if there is one, skipping the data query and
+	serialization entirely.
+	"""
+
+	def __init__(self, request: Request, response: Response) -> None:
+		"""Initialize with the current request and its response.
+
+		Args:
+		        request: Incoming request carrying the client's validators
+		        response: Response the validators are set on
+		"""
+		self.request = request
+		self.response = response
+
+	@property
+	def has_validators(self) -> bool:
+		"""Whether the client sent validators of a cached copy to check."""
+		headers = self.request.headers
+		return "if-none-match" in headers or "if-modified-since" in headers
+
+	def etag(self, *parts: object) -> str:
+		"""Build a strong entity tag for this URL from the versions its representation depends on.
+
+		Args:
+		        *parts: Values that change whenever the representation does
+
+		Returns:
+		        Quoted entity tag
+		"""
+		raw = "\x1f".join(str(part) for part in (self.request.url.path, self.request.url.query, *parts))
+		return f'"{hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()}"'
+
+	def evaluate(self, *parts: object, last_modified: datetime | None = None) -> Response | None:
+		"""Set validators on the response and check the request's preconditions.
+
+		Args:
+		        *parts: Values that change whenever the representation does
+		        last_modified: Time of the latest change, if it alone identifies the representation
+
+		Returns:
+		        A 304 response when the client's copy is current, None otherwise
+		"""
+		etag = self.etag(*parts)
+		headers = {"ETag": etag, "Cache-Control": "no-cache"}
+		if last_modified is not None:
+			headers["Last-Modified"] = format_datetime(last_modified.astimezone(UTC), usegmt=True)
+		self.response.headers.update(headers)
+
+		if self._is_fresh(etag, last_modified):
+			return self.not_modified()
+		return None
+
+	def matches(self, *parts: object) -> bool:
+		"""Whether the client's entity tag is the one built from ``parts``.
+
+		Lets routes accept tags handed out from other validators than ``evaluate`` was called with.
+
+		Args:
+		        *parts: Values that change whenever the representation does
+		"""
+		return self._is_fresh(self.etag(*parts), None)
+
+	def not_modified(self) -> Response:
+		"""Build a 304 response carrying the validators set on the response."""
+		headers = {
+			name: value
+			for name in ("ETag", "Last-Modified", "Cache-Control")
+			if (value := self.response.headers.get(name)) is not None
+		}
+		return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+	def _is_fresh(self, etag: str, last_modified: datetime | None) -> bool:
+		"""Whether the client's cached copy matches the current representation."""
+		if_none_match = self.request.headers.get("if-none-match")
+		if if_none_match is not None:
+			# Entity tags take precedence over dates when both are sent
+			tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+			return "*" in tags or etag in tags
+
+		if_modified_since = self.request.headers.get("if-modified-since")
+		if if_modified_since is None or last_modified is None:
+			return False
+		try:
+			since = parsedate_to_datetime(if_modified_since)
+		except (TypeError, ValueError):
+			return False
+		if since.tzinfo is None:
+			return False
+		# HTTP dates have whole-second precision
+		return last_modified.replace(microsecond=0) <= since
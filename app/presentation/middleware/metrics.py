@@ -0,0 +1,89 @@
+"""Prometheus request metrics middleware."""
+
+import time
+
+from prometheus_client import Gauge, Histogram
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.query_stats import track_queries
+
+HTTP_REQUEST_DURATION = Histogram(
+	"http_request_duration_seconds",
+	"Time to handle a request, including streaming the response",
+	["method", "route", "status"],
+	buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+	"http_requests_in_flight",
+	"Requests currently being handled",
+)
+HTTP_RESPONSE_SIZE = Histogram(
+	"http_response_size_bytes",
+	"Size of response bodies",
+	["method", "route"],
+	buckets=(100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000),
+)
+HTTP_REQUEST_DB_QUERIES = Histogram(
+	"http_request_db_queries",
+	"SQL statements executed per request",
+	["route"],
+	buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+HTTP_REQUEST_DB_TIME = Histogram(
+	"http_request_db_seconds",
+	"Time spent executing SQL statements per request",
+	["route"],
+	buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+# Route label for requests no route matched, so unknown paths can't grow label cardinality
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+	"""ASGI middleware recording latency, concurrency, response size and SQL usage per route.
+
+	Routes are labelled by their path template, which FastAPI stores in the
+	request scope once a route matches.
+	"""
+
+	def __init__(self, app: ASGIApp) -> None:
+		"""Initialize middleware.
+
+		Args:
+		        app: Wrapped ASGI application
+		"""
+		self.app = app
+
+	async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+		"""Handle a request, recording its metrics."""
+		if scope["type"] != "http":
+			await self.app(scope, receive, send)
+			return
+
+		status_code = 500
+		response_size = 0
+
+		async def send_with_metrics(message: Message) -> None:
+			nonlocal status_code, response_size
+			if message["type"] == "http.response.start":
+				status_code = message["status"]
+			elif message["type"] == "http.response.body":
+				response_size += len(message.get("body", b""))
+			await send(message)
+
+		HTTP_REQUESTS_IN_FLIGHT.inc()
+		started = time.perf_counter()
+		try:
+			with track_queries() as queries:
+				await self.app(scope, receive, send_with_metrics)
+		finally:
+			elapsed = time.perf_counter() - started
+			HTTP_REQUESTS_IN_FLIGHT.dec()
+			route = scope.get("route")
+			path = getattr(route, "path", UNMATCHED_ROUTE)
+			method = scope["method"]
+			HTTP_REQUEST_DURATION.labels(method, path, str(status_code)).observe(elapsed)
+			HTTP_RESPONSE_SIZE.labels(method, path).observe(response_size)
+			HTTP_REQUEST_DB_QUERIES.labels(path).observe(queries.count)
+			HTTP_REQUEST_DB_TIME.labels(path).observe(queries.seconds)
@@ -0,0 +1,26 @@
+"""Fast JSON responses for API routes."""
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+def json_response[T](adapter: TypeAdapter[T], content: T, response: Response | None = None) -> Response:
+	"""Serialize already valid content straight to JSON bytes.
+
+	Returning a ``Response`` skips FastAPI's response model validation and
+	``jsonable_encoder`` pass; pydantic-core writes the bytes in one step.
+
+	Args:
+	        adapter: Type adapter for the content's type, built once per type
+	        content: Response content
+	        response: The route's injected response, whose headers are carried over
+
+	Returns:
+	        JSON response
+	"""
+	rendered = Response(adapter.dump_json(content), media_type="application/json")
+	if response is not None:
+		# Appended one by one, as a dict would keep only the last of repeated headers such as Set-Cookie
+		for name, value in response.headers.items():
+			rendered.headers.append(name, value)
+	return rendered
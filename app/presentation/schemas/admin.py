@@ -0,0 +1,33 @@
+"""Pydantic schemas for admin API responses."""
+
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from app.infrastructure.slow_queries import SlowQuery
+
+
+class SlowQueryResponse(BaseModel):
+	"""Schema for a recorded slow SQL statement."""
+
+	statement: str
+	parameters: list[str] | dict[str, str] = Field(..., description="Types of the bound parameters, not their values")
+	duration_ms: float
+	engine: str = Field(..., description="Engine the statement ran on, primary or a replica")
+	route: str | None = Field(..., description="Route template of the request that ran it")
+	recorded_at: datetime
+	plan: Any = Field(None, description="EXPLAIN (ANALYZE, BUFFERS) output, when the statement was sampled")
+
+	@classmethod
+	def from_entry(cls, entry: SlowQuery) -> "SlowQueryResponse":
+		"""Create response from a slow query log entry."""
+		return cls(
+			statement=entry.statement,
+			parameters=entry.parameters,
+			duration_ms=entry.duration_seconds * 1000,
+			engine=entry.engine,
+			route=entry.route,
+			recorded_at=entry.recorded_at,
+			plan=entry.plan,
+		)
@@ -1,10 +1,13 @@
 """Pydantic schemas for User API requests and responses."""
 
 from datetime import datetime
+from typing import Self
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, model_validator
 
+from app.application.dtos.user_dto import BulkCreateStatus
 from app.domain.entities.user import User
+from app.domain.repositories.user_repository import UserFilter
 
 
 class UserBase(BaseModel):
@@ -18,6 +21,22 @@ class UserCreate(UserBase):
 	"""Schema for creating a new user."""
 
 
+class UserBulkCreateItem(BaseModel):
+	"""Schema for one row of a bulk user import.
+
+	Fields are validated per row by the import, so one bad row does not reject the batch.
+	"""
+
+	name: str = Field(..., description="User's full name")
+	email: str = Field(..., description="User's email address")
+
+
+class UserBulkCreate(BaseModel):
+	"""Schema for a bulk user import."""
+
+	users: list[UserBulkCreateItem] = Field(..., min_length=1, max_length=10_000, description="Users to create")
+
+
 class UserUpdate(BaseModel):
 	"""Schema for updating an existing user."""
 
@@ -40,18 +59,20 @@ class UserResponse(UserBase):
 	def from_entity(cls, user: User) -> "UserResponse":
 		"""Create UserResponse from domain entity.
 
+		Entities are valid by construction, so validation is skipped.
+
 		Args:
 		        user: User domain entity
 
 		Returns:
 		        UserResponse instance
 		"""
-		return cls(
-			id=user.id,  # type: ignore
+		return cls.model_construct(
+			id=user.id,
 			name=user.name,
 			email=user.email.value,
 			is_active=user.is_active,
-			created_at=user.created_at,  # type: ignore
+			created_at=user.created_at,
 			updated_at=user.updated_at,
 		)
 
@@ -60,6 +81,66 @@ class UserListResponse(BaseModel):
 	"""Schema for paginated user list response."""
 
 	users: list[UserResponse] = Field(..., description="List of users")
-	total: int = Field(..., description="Total number of users")
+	total: int = Field(..., description="Total number of users, approximate unless counted exactly")
 	skip: int = Field(..., description="Number of skipped records")
 	limit: int = Field(..., description="Maximum number of records returned")
+	next_cursor: str | None = Field(None, description="Opaque cursor for the next page, null on the last page")
+
+
+class UserSearchResponse(BaseModel):
+	"""Schema for a page of user search results."""
+
+	users: list[UserResponse] = Field(..., description="Matching users, best matches first")
+	next_cursor: str | None = Field(None, description="Opaque cursor for the next page, null on the last page")
+
+
+class UserBulkCreateResult(BaseModel):
+	"""Schema for the outcome of one row of a bulk user import."""
+
+	index: int = Field(..., description="Position of the row in the request")
+	email: str = Field(..., description="Email address of the row")
+	status: BulkCreateStatus = Field(..., description="Whether the row was created, a duplicate or invalid")
+	user: UserResponse | None = Field(None, description="Created user")
+	error: str | None = Field(None, description="Reason the row was not created")
+
+
+class UserBulkCreateResponse(BaseModel):
+	"""Schema for bulk user import response."""
+
+	results: list[UserBulkCreateResult] = Field(..., description="Per-row results in request order")
+	created: int = Field(..., description="Number of users created")
+	duplicates: int = Field(..., description="Number of rows skipped as duplicates")
+	invalid: int = Field(..., description="Number of rows that failed validation")
+
+
+class UserImportResponse(BaseModel):
+	"""Schema for a queued bulk user import."""
+
+	job_id: int = Field(..., description="Identifier of the background job running the import")
+
+
+class UserBulkSelection(BaseModel):
+	"""Schema selecting users for a bulk operation, either by ID or by filter."""
+
+	ids: list[int] | None = Field(None, min_length=1, max_length=10_000, description="User identifiers")
+	is_active: bool | None = Field(None, description="Only users with this active status")
+	created_before: datetime | None = Field(None, description="Only users created before this time")
+	changed_before: datetime | None = Field(None, description="Only users not created or updated since this time")
+
+	@model_validator(mode="after")
+	def check_selection(self) -> Self:
+		"""Require either IDs or at least one filter condition, but not both."""
+		if (self.ids is None) == self.to_filter().is_empty:
+			raise ValueError("Provide either ids or at least one filter condition")
+		return self
+
+	def to_filter(self) -> UserFilter:
+		"""Build the domain filter from the filter conditions."""
+		return UserFilter(is_active=self.is_active, created_before=self.created_before, changed_before=self.changed_before)
+
+
+class UserBulkActionResponse(BaseModel):
+	"""Schema for the result of a bulk deactivate or delete."""
+
+	ids: list[int] = Field(..., description="Identifiers of the affected users")
+	count: int = Field(..., description="Number of affected users")
@@ -0,0 +1,82 @@
+"""Background job worker process.
+
+Runs jobs enqueued through ``UnitOfWork.jobs``, apart from the API so each can
+be scaled on its own::
+
+    python -m app.worker
+
+Any number of worker processes may run against the same database. SIGTERM or
+SIGINT stops claiming jobs and exits once the running ones finished.
+"""
+
+import asyncio
+import logging
+import signal
+from typing import Any
+
+from prometheus_client import start_http_server
+
+from app.application.dtos.user_dto import BulkCreateStatus, CreateUserDTO
+from app.application.use_cases.bulk_create_users import BulkCreateUsersUseCase
+from app.application.use_cases.import_users import IMPORT_USERS_JOB
+from app.config import settings
+from app.infrastructure.database import AsyncSessionLocal, close_db
+from app.infrastructure.jobs import JobHandler, JobStore, JobWorker
+from app.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+logger = logging.getLogger(__name__)
+
+
+async def import_users(payload: dict[str, Any]) -> None:
+	"""Create the users of an import queued by ImportUsersUseCase."""
+	rows = [CreateUserDTO(**row) for row in payload["users"]]
+	async with AsyncSessionLocal() as session:
+		results = await BulkCreateUsersUseCase(SqlAlchemyUnitOfWork(session)).execute(rows)
+	statuses = [result.status for result in results]
+	logger.info(
+		"Imported users: %d created, %d duplicates, %d invalid",
+		statuses.count(BulkCreateStatus.CREATED),
+		statuses.count(BulkCreateStatus.DUPLICATE),
+		statuses.count(BulkCreateStatus.INVALID),
+	)
+
+
+HANDLERS: dict[str, JobHandler] = {
+	IMPORT_USERS_JOB: import_users,
+}
+
+
+async def run() -> None:
+	"""Run jobs until the process is asked to stop."""
+	stop = asyncio.Event()
+	loop = asyncio.get_running_loop()
+	for signum in (signal.SIGINT, signal.SIGTERM):
+		loop.add_signal_handler(signum, stop.set)
+
+	worker = JobWorker(
+		JobStore(AsyncSessionLocal),
+		HANDLERS,
+		concurrency=settings.job_worker_concurrency,
+		visibility_timeout=settings.job_visibility_timeout_seconds,
+		poll_interval=settings.job_poll_interval_seconds,
+		retry_base_delay=settings.job_retry_base_seconds,
+		retry_max_delay=settings.job_retry_max_seconds,
+	)
+	logger.info("Job worker started, running up to %d jobs at once", worker.concurrency)
+	try:
+		await worker.run(stop)
+	finally:
+		await close_db()
+	logger.info("Job worker stopped")
+
+
+def main() -> None:
+	"""Entry point of the worker process."""
+	logging.basicConfig(level=settings.log_level, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+	if settings.metrics_enabled:
+		start_http_server(settings.job_worker_metrics_port)
+	asyncio.run(run())
+
+
+if __name__ == "__main__":
+	main()
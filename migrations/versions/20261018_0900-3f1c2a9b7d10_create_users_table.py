@@ -0,0 +1,43 @@
+"""Create users table
+
+Revision ID: 3f1c2a9b7d10
+Revises:
+Create Date: 2026-10-18 09:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1c2a9b7d10"
+down_revision: str | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+	"""Upgrade schema."""
+	op.create_table(
+		"users",
+		sa.Column("id", sa.Integer(), nullable=False),
+		sa.Column("name", sa.String(length=255), nullable=False),
+		sa.Column("email", sa.String(length=255), nullable=False),
+		sa.Column("is_active", sa.Boolean(), nullable=False),
+		sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+		sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+		sa.PrimaryKeyConstraint("id"),
+	)
+	op.create_index("ix_users_id", "users", ["id"])
+	op.create_index("ix_users_email", "users", ["email"], unique=True)
+	op.create_index("ix_users_created_at_id", "users", ["created_at", "id"])
+
+
+def downgrade() -> None:
+	"""Downgrade schema."""
+	op.drop_index("ix_users_created_at_id", table_name="users")
+	op.drop_index("ix_users_email", table_name="users")
+	op.drop_index("ix_users_id", table_name="users")
+	op.drop_table("users")
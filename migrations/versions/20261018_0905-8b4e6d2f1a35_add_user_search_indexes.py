@@ -0,0 +1,51 @@
+"""Add user search indexes
+
+Trigram GIN indexes serve partial name and email matches, and a generated
+tsvector column with its own GIN index serves whole-word matches.
+
+Revision ID: 8b4e6d2f1a35
+Revises: 3f1c2a9b7d10
+Create Date: 2026-10-18 09:05:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+# revision identifiers, used by Alembic.
+revision: str = "8b4e6d2f1a35"
+down_revision: str | None = "3f1c2a9b7d10"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+	"""Upgrade schema."""
+	op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+	op.add_column(
+		"users",
+		sa.Column(
+			"search_vector",
+			TSVECTOR(),
+			sa.Computed("to_tsvector('simple', name || ' ' || email)", persisted=True),
+			nullable=True,
+		),
+	)
+	op.create_index("ix_users_search_vector", "users", ["search_vector"], postgresql_using="gin")
+	op.create_index(
+		"ix_users_name_trgm", "users", ["name"], postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}
+	)
+	op.create_index(
+		"ix_users_email_trgm", "users", ["email"], postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"}
+	)
+
+
+def downgrade() -> None:
+	"""Downgrade schema."""
+	op.drop_index("ix_users_email_trgm", table_name="users")
+	op.drop_index("ix_users_name_trgm", table_name="users")
+	op.drop_index("ix_users_search_vector", table_name="users")
+	op.drop_column("users", "search_vector")
@@ -0,0 +1,29 @@
+"""Add users updated_at index
+
+Lets conditional GETs on user lists find the latest change without a scan.
+
+Revision ID: c7d9e1f3a2b4
+Revises: 8b4e6d2f1a35
+Create Date: 2026-10-18 09:10:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c7d9e1f3a2b4"
+down_revision: str | None = "8b4e6d2f1a35"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+	"""Upgrade schema."""
+	op.create_index("ix_users_updated_at", "users", ["updated_at"])
+
+
+def downgrade() -> None:
+	"""Downgrade schema."""
+	op.drop_index("ix_users_updated_at", table_name="users")
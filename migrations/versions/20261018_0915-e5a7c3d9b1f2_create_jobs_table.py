@@ -0,0 +1,50 @@
+"""Create jobs table
+
+Durable background job queue claimed by workers with FOR UPDATE SKIP LOCKED.
+
+Revision ID: e5a7c3d9b1f2
+Revises: c7d9e1f3a2b4
+Create Date: 2026-10-18 09:15:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a7c3d9b1f2"
+down_revision: str | None = "c7d9e1f3a2b4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+	"""Upgrade schema."""
+	op.create_table(
+		"jobs",
+		sa.Column("id", sa.BigInteger(), nullable=False),
+		sa.Column("kind", sa.String(length=100), nullable=False),
+		sa.Column("payload", postgresql.JSONB(), nullable=False),
+		sa.Column("status", sa.String(length=20), nullable=False),
+		sa.Column("attempts", sa.Integer(), nullable=False),
+		sa.Column("max_attempts", sa.Integer(), nullable=False),
+		sa.Column("run_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+		sa.Column("last_error", sa.Text(), nullable=True),
+		sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+		sa.PrimaryKeyConstraint("id"),
+	)
+	op.create_index(
+		"ix_jobs_claimable_run_at",
+		"jobs",
+		["run_at"],
+		postgresql_where=sa.text("status IN ('queued', 'running')"),
+	)
+
+
+def downgrade() -> None:
+	"""Downgrade schema."""
+	op.drop_index("ix_jobs_claimable_run_at", table_name="jobs")
+	op.drop_table("jobs")
@@ -0,0 +1,69 @@
+"""Compare two benchmark result files and fail on regressions.
+
+Usage::
+
+	python -m tests.benchmarks.compare baseline.json current.json [--threshold 0.1]
+
+Exits with status 1 when any benchmark regressed beyond the threshold.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from tests.benchmarks.results import DEFAULT_THRESHOLD, compare, read_results
+
+# Metadata that must match for numbers to be comparable
+COMPARABLE_METADATA = ("dialect", "users")
+
+
+def main(argv: list[str] | None = None) -> int:
+	"""Run the comparison.
+
+	Args:
+	        argv: Command line arguments, defaults to sys.argv
+
+	Returns:
+	        Exit status
+	"""
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("baseline", type=Path, help="Results of the reference run")
+	parser.add_argument("current", type=Path, help="Results of the run under test")
+	parser.add_argument(
+		"--threshold",
+		type=float,
+		default=DEFAULT_THRESHOLD,
+		help=f"Tolerated relative change (default: {DEFAULT_THRESHOLD})",
+	)
+	args = parser.parse_args(argv)
+
+	baseline_metadata, baseline = read_results(args.baseline)
+	current_metadata, current = read_results(args.current)
+	out = sys.stdout
+	for key in COMPARABLE_METADATA:
+		if baseline_metadata.get(key) != current_metadata.get(key):
+			out.write(
+				f"warning: runs differ in {key} ({baseline_metadata.get(key)} vs {current_metadata.get(key)}), "
+				"results may not be comparable\n"
+			)
+
+	comparisons = compare(baseline, current, args.threshold)
+	width = max((len(comparison.name) for comparison in comparisons), default=0)
+	for comparison in comparisons:
+		flag = "REGRESSED" if comparison.regressed else "ok"
+		out.write(
+			f"{comparison.name:<{width}}  {comparison.metric:<14} {comparison.baseline:>12,.2f} -> "
+			f"{comparison.current:>12,.2f}  {comparison.change:+7.1%}  {flag}\n"
+		)
+	for name in sorted(baseline.keys() ^ current.keys()):
+		out.write(f"{name}: only in {'baseline' if name in baseline else 'current'} run\n")
+
+	regressions = [comparison for comparison in comparisons if comparison.regressed]
+	if regressions:
+		out.write(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}\n")
+		return 1
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,143 @@
+"""Benchmark fixtures.
+
+Benchmarks run against the database in ``BENCHMARK_DATABASE_URL`` and are skipped
+when it is not set. PostgreSQL is the reference; a SQLite file
+(``sqlite+aiosqlite:///bench.db``) stands in for benchmarks that don't need
+PostgreSQL features. The database is wiped before every benchmark module or
+benchmark.
+
+``BENCHMARK_USERS`` sets the number of users seeded for the suite (default
+10000), and ``BENCHMARK_RESULTS`` a path to write measured results to as JSON,
+for ``python -m tests.benchmarks.compare``.
+"""
+
+import os
+import platform
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+import sqlalchemy
+from _pytest.terminal import TerminalReporter
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from app.infrastructure.database import Base
+from app.infrastructure.models.user import UserModel  # noqa: F401 - registers the users table
+from tests.benchmarks.results import BenchmarkResult, write_results
+
+BENCHMARK_DATABASE_URL = os.environ.get("BENCHMARK_DATABASE_URL")
+BENCHMARK_USERS = int(os.environ.get("BENCHMARK_USERS", "10000"))
+BENCHMARK_RESULTS = os.environ.get("BENCHMARK_RESULTS")
+
+# Portable across PostgreSQL and SQLite, unlike generate_series
+SEED_USERS = text(
+	"WITH RECURSIVE seq(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM seq WHERE i < :rows) "
+	"INSERT INTO users (name, email, is_active) "
+	"SELECT 'Member ' || i, 'member' || i || '@example.com', true FROM seq"
+)
+
+_results: list[str] = []
+_measured: list[BenchmarkResult] = []
+_dialect: list[str] = []
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+	"""Skip benchmarks unless a benchmark database was given, in-memory ones too.
+
+	Their timing comparisons depend on the machine and its load, so they only
+	run when benchmarks are asked for.
+	"""
+	if BENCHMARK_DATABASE_URL:
+		return
+	skip = pytest.mark.skip(reason="BENCHMARK_DATABASE_URL is not set")
+	for item in items:
+		if item.get_closest_marker("benchmark") is not None:
+			item.add_marker(skip)
+
+
+async def fresh_engine() -> AsyncEngine:
+	"""Engine on the benchmark database with an empty schema."""
+	if not BENCHMARK_DATABASE_URL:
+		pytest.skip("BENCHMARK_DATABASE_URL is not set")
+
+	engine = create_async_engine(BENCHMARK_DATABASE_URL)
+	async with engine.begin() as conn:
+		await conn.run_sync(Base.metadata.drop_all)
+		await conn.run_sync(Base.metadata.create_all)
+	_dialect[:] = [engine.dialect.name]
+	return engine
+
+
+@pytest.fixture
+async def bench_sessionmaker() -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+	"""Session factory bound to a freshly created benchmark schema."""
+	engine = await fresh_engine()
+
+	yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+	await engine.dispose()
+
+
+@pytest.fixture
+def pg_sessionmaker(bench_sessionmaker: async_sessionmaker[AsyncSession]) -> async_sessionmaker[AsyncSession]:
+	"""Benchmark session factory, for benchmarks that need PostgreSQL."""
+	if bench_sessionmaker.kw["bind"].dialect.name != "postgresql":
+		pytest.skip("needs PostgreSQL")
+	return bench_sessionmaker
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def seeded_sessionmaker() -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+	"""Session factory bound to a schema seeded with BENCHMARK_USERS users, shared by a module."""
+	engine = await fresh_engine()
+	async with engine.begin() as conn:
+		await conn.execute(SEED_USERS, {"rows": BENCHMARK_USERS})
+		if engine.dialect.name == "postgresql":
+			await conn.execute(text("ANALYZE users"))
+
+	yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+	await engine.dispose()
+
+
+@pytest.fixture
+def report() -> Callable[[str], None]:
+	"""Record a benchmark result line for the terminal summary."""
+	return _results.append
+
+
+@pytest.fixture
+def record() -> Callable[[BenchmarkResult], None]:
+	"""Record a measured result for the terminal summary and the JSON results."""
+
+	def record_result(result: BenchmarkResult) -> None:
+		_measured.append(result)
+		_results.append(
+			f"{result.name}: {result.ops_per_second:,.0f} ops/s, p50 {result.p50_ms:.2f} ms, "
+			f"p95 {result.p95_ms:.2f} ms, p99 {result.p99_ms:.2f} ms (concurrency {result.concurrency})"
+		)
+
+	return record_result
+
+
+def pytest_sessionfinish() -> None:
+	"""Write measured results to BENCHMARK_RESULTS."""
+	if BENCHMARK_RESULTS and _measured:
+		metadata = {
+			"dialect": _dialect[0] if _dialect else None,
+			"users": BENCHMARK_USERS,
+			"python": platform.python_version(),
+			"sqlalchemy": sqlalchemy.__version__,
+			"machine": platform.machine(),
+		}
+		write_results(Path(BENCHMARK_RESULTS), _measured, metadata)
+
+
+def pytest_terminal_summary(terminalreporter: TerminalReporter) -> None:
+	"""Print collected benchmark results."""
+	if _results:
+		terminalreporter.section("benchmarks")
+		for line in _results:
+			terminalreporter.write_line(line)
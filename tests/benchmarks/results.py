@@ -0,0 +1,151 @@
+"""Benchmark measurement, JSON results and regression comparison."""
+
+import asyncio
+import json
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+# Regressions smaller than this fraction are treated as noise
+DEFAULT_THRESHOLD = 0.20
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+	"""Throughput and latency percentiles of one benchmarked operation."""
+
+	name: str
+	iterations: int
+	concurrency: int
+	ops_per_second: float
+	p50_ms: float
+	p95_ms: float
+	p99_ms: float
+
+
+@dataclass(frozen=True, slots=True)
+class Comparison:
+	"""Change of one metric of a benchmark between two runs."""
+
+	name: str
+	metric: str
+	baseline: float
+	current: float
+	regressed: bool
+
+	@property
+	def change(self) -> float:
+		"""Relative change from baseline, positive when the value grew."""
+		return (self.current - self.baseline) / self.baseline if self.baseline else 0.0
+
+
+async def measure(
+	name: str,
+	operation: Callable[[int], Awaitable[object]],
+	iterations: int,
+	concurrency: int = 1,
+	warmup: int = 0,
+) -> BenchmarkResult:
+	"""Run an operation repeatedly across concurrent workers and time each call.
+
+	Every call gets a distinct index, so operations can pick deterministic
+	inputs or unique values. Warmup calls use the first indexes and are not
+	timed.
+
+	Args:
+	        name: Benchmark name, stable across runs for comparison
+	        operation: Coroutine function taking the call index
+	        iterations: Timed calls
+	        concurrency: Workers issuing calls at the same time
+	        warmup: Untimed calls before measuring
+
+	Returns:
+	        Measured result
+	"""
+	for index in range(warmup):
+		await operation(index)
+
+	indexes = iter(range(warmup, warmup + iterations))
+	latencies: list[float] = []
+
+	async def worker() -> None:
+		for index in indexes:
+			started = time.perf_counter()
+			await operation(index)
+			latencies.append(time.perf_counter() - started)
+
+	started = time.perf_counter()
+	await asyncio.gather(*(worker() for _ in range(concurrency)))
+	elapsed = time.perf_counter() - started
+
+	percentiles = statistics.quantiles(latencies, n=100, method="inclusive") if len(latencies) > 1 else latencies * 99
+	return BenchmarkResult(
+		name=name,
+		iterations=iterations,
+		concurrency=concurrency,
+		ops_per_second=iterations / elapsed,
+		p50_ms=percentiles[49] * 1000,
+		p95_ms=percentiles[94] * 1000,
+		p99_ms=percentiles[98] * 1000,
+	)
+
+
+def write_results(path: Path, results: list[BenchmarkResult], metadata: dict[str, Any]) -> None:
+	"""Write results and the environment they were measured in as JSON."""
+	document = {"metadata": metadata, "results": [asdict(result) for result in results]}
+	path.write_text(json.dumps(document, indent=2) + "\n")
+
+
+def read_results(path: Path) -> tuple[dict[str, Any], dict[str, BenchmarkResult]]:
+	"""Read results written by write_results, keyed by benchmark name."""
+	document = json.loads(path.read_text())
+	results = {entry["name"]: BenchmarkResult(**entry) for entry in document["results"]}
+	return document["metadata"], results
+
+
+def compare(
+	baseline: dict[str, BenchmarkResult],
+	current: dict[str, BenchmarkResult],
+	threshold: float = DEFAULT_THRESHOLD,
+) -> list[Comparison]:
+	"""Compare throughput and median latency of benchmarks present in both runs.
+
+	A benchmark regressed when its throughput dropped, or its median latency
+	grew, by more than the threshold. Tail latencies are recorded but not
+	compared, as they vary too much between runs on shared machines.
+
+	Args:
+	        baseline: Results of the reference run
+	        current: Results of the run under test
+	        threshold: Tolerated relative change
+
+	Returns:
+	        Comparisons in baseline order
+	"""
+	comparisons: list[Comparison] = []
+	for name, before in baseline.items():
+		after = current.get(name)
+		if after is None:
+			continue
+		comparisons.append(
+			Comparison(
+				name,
+				"ops_per_second",
+				before.ops_per_second,
+				after.ops_per_second,
+				regressed=after.ops_per_second < before.ops_per_second * (1 - threshold),
+			)
+		)
+		comparisons.append(
+			Comparison(
+				name,
+				"p50_ms",
+				before.p50_ms,
+				after.p50_ms,
+				regressed=after.p50_ms > before.p50_ms * (1 + threshold),
+			)
+		)
+	return comparisons
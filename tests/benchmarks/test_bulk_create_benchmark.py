@@ -0,0 +1,45 @@
+"""Benchmark bulk user import against the per-row create path."""
+
+import time
+from collections.abc import Callable
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.application.dtos.user_dto import BulkCreateStatus, CreateUserDTO
+from app.application.use_cases.bulk_create_users import BulkCreateUsersUseCase
+from app.application.use_cases.create_user import CreateUserUseCase
+from app.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+ROWS = 2_000
+
+
+def make_rows(prefix: str) -> list[CreateUserDTO]:
+	"""Build import rows with unique emails."""
+	return [CreateUserDTO(name=f"Member {i}", email=f"{prefix}{i}@example.com") for i in range(ROWS)]
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_bulk_create_outperforms_per_row_create(
+	bench_sessionmaker: async_sessionmaker[AsyncSession], report: Callable[[str], None]
+) -> None:
+	"""Bulk import should write the same rows many times faster than per-row creates."""
+	async with bench_sessionmaker() as session:
+		use_case = CreateUserUseCase(SqlAlchemyUnitOfWork(session))
+		started = time.perf_counter()
+		for row in make_rows("single"):
+			await use_case.execute(row)
+		per_row = time.perf_counter() - started
+
+	async with bench_sessionmaker() as session:
+		bulk_use_case = BulkCreateUsersUseCase(SqlAlchemyUnitOfWork(session))
+		started = time.perf_counter()
+		results = await bulk_use_case.execute(make_rows("bulk"))
+		bulk = time.perf_counter() - started
+
+	assert all(result.status is BulkCreateStatus.CREATED for result in results)
+	report(
+		f"create {ROWS} users: per-row {ROWS / per_row:,.0f} rows/s, bulk {ROWS / bulk:,.0f} rows/s ({per_row / bulk:.1f}x)"
+	)
+	assert bulk < per_row
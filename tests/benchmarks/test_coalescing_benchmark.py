@@ -0,0 +1,52 @@
+"""Benchmark concurrent lookups of one hot user, with and without read coalescing."""
+
+import asyncio
+from collections.abc import Callable
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.infrastructure.query_stats import instrument_queries, track_queries
+from app.infrastructure.repositories.coalescing_user_repository import CoalescingUserRepository, ReadCoalescer
+from app.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+from tests.benchmarks.conftest import BENCHMARK_USERS
+from tests.benchmarks.results import BenchmarkResult, measure
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.asyncio(loop_scope="module")]
+
+ITERATIONS = 500
+WARMUP = 20
+CONCURRENCY = 16
+HOT_USER_ID = BENCHMARK_USERS // 2
+
+
+async def test_concurrent_hot_lookups_share_one_query(
+	seeded_sessionmaker: async_sessionmaker[AsyncSession],
+	report: Callable[[str], None],
+	record: Callable[[BenchmarkResult], None],
+) -> None:
+	"""A burst of identical lookups should run one query, and coalescing shouldn't cost throughput."""
+	coalescer = ReadCoalescer()
+
+	async def plain(_index: int) -> None:
+		async with seeded_sessionmaker() as session:
+			await UserRepositoryImpl(session).get_by_id(HOT_USER_ID)
+
+	async def coalesced(_index: int) -> None:
+		async with seeded_sessionmaker() as session:
+			await CoalescingUserRepository(UserRepositoryImpl(session), coalescer).get_by_id(HOT_USER_ID)
+
+	instrument_queries([seeded_sessionmaker.kw["bind"]])
+	counts = {}
+	for name, lookup in (("plain", plain), ("coalesced", coalesced)):
+		with track_queries() as stats:
+			await asyncio.gather(*(lookup(index) for index in range(CONCURRENCY)))
+		counts[name] = stats.count
+	report(f"{CONCURRENCY} concurrent lookups of one user: {counts['plain']} queries, {counts['coalesced']} coalesced")
+	assert counts == {"plain": CONCURRENCY, "coalesced": 1}
+
+	plain_result = await measure("repository.get_by_id.hot", plain, ITERATIONS, CONCURRENCY, WARMUP)
+	coalesced_result = await measure("repository.get_by_id.hot.coalesced", coalesced, ITERATIONS, CONCURRENCY, WARMUP)
+	record(plain_result)
+	record(coalesced_result)
+	assert coalesced_result.ops_per_second > plain_result.ops_per_second
@@ -0,0 +1,100 @@
+"""Benchmark hydrating users from rows, before and after the trusted read path."""
+
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domain.entities.user import User
+from app.domain.value_objects.email import Email
+from app.infrastructure.models.user import UserModel
+from app.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+
+ROWS = 100_000
+
+
+def hydrate_validated(rows: list[tuple[int, str, str, bool, datetime, None]]) -> list[User]:
+	"""Previous hydration: full constructors re-validating every field."""
+	return [
+		User(
+			id=user_id,
+			name=name,
+			email=Email(email),
+			is_active=is_active,
+			created_at=created_at,
+			updated_at=updated_at,
+		)
+		for user_id, name, email, is_active, created_at, updated_at in rows
+	]
+
+
+def hydrate_trusted(rows: list[tuple[int, str, str, bool, datetime, None]]) -> list[User]:
+	"""Current hydration: trusted constructors for persisted data."""
+	return [
+		User.restore(user_id, name, Email.trusted(email), is_active, created_at, updated_at)
+		for user_id, name, email, is_active, created_at, updated_at in rows
+	]
+
+
+@pytest.mark.benchmark
+def test_trusted_constructors_hydrate_faster(report: Callable[[str], None]) -> None:
+	"""Trusted constructors should beat validating ones on in-memory rows."""
+	created_at = datetime(2024, 1, 1, tzinfo=UTC)
+	rows = [(i, f"Member {i}", f"member{i}@example.com", True, created_at, None) for i in range(ROWS)]
+
+	started = time.perf_counter()
+	hydrate_validated(rows)
+	validated = time.perf_counter() - started
+
+	started = time.perf_counter()
+	hydrate_trusted(rows)
+	trusted = time.perf_counter() - started
+
+	report(
+		f"hydrate {ROWS} tuples: validated {ROWS / validated:,.0f} rows/s, trusted {ROWS / trusted:,.0f} rows/s "
+		f"({validated / trusted:.1f}x)"
+	)
+	assert trusted < validated
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_core_row_read_path_outperforms_orm(
+	pg_sessionmaker: async_sessionmaker[AsyncSession], report: Callable[[str], None]
+) -> None:
+	"""Reading through Core rows should beat ORM models plus validating constructors."""
+	async with pg_sessionmaker() as session:
+		await session.execute(
+			text(
+				"INSERT INTO users (name, email, is_active) "
+				"SELECT 'Member ' || i, 'member' || i || '@example.com', true FROM generate_series(1, :rows) AS i"
+			),
+			{"rows": ROWS},
+		)
+		await session.commit()
+
+	async with pg_sessionmaker() as session:
+		started = time.perf_counter()
+		result = await session.execute(select(UserModel).order_by(UserModel.created_at, UserModel.id).limit(ROWS))
+		before = hydrate_validated(
+			[
+				(model.id, model.name, model.email, model.is_active, model.created_at, model.updated_at)  # type: ignore
+				for model in result.scalars()
+			]
+		)
+		orm = time.perf_counter() - started
+
+	async with pg_sessionmaker() as session:
+		started = time.perf_counter()
+		after = await UserRepositoryImpl(session).list_all(limit=ROWS)
+		core = time.perf_counter() - started
+
+	assert len(before) == len(after) == ROWS
+	report(
+		f"read {ROWS} users: ORM+validation {ROWS / orm:,.0f} rows/s, Core+trusted {ROWS / core:,.0f} rows/s "
+		f"({orm / core:.1f}x)"
+	)
+	assert core < orm
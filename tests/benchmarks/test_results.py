@@ -0,0 +1,62 @@
+"""Tests for benchmark results and their comparison."""
+
+from pathlib import Path
+
+import pytest
+
+from tests.benchmarks.compare import main
+from tests.benchmarks.results import BenchmarkResult, compare, measure, read_results, write_results
+
+
+def result(name: str, ops_per_second: float, p50_ms: float) -> BenchmarkResult:
+	"""Build a result with the compared metrics."""
+	return BenchmarkResult(
+		name=name,
+		iterations=100,
+		concurrency=1,
+		ops_per_second=ops_per_second,
+		p50_ms=p50_ms,
+		p95_ms=p50_ms * 2,
+		p99_ms=p50_ms * 3,
+	)
+
+
+@pytest.mark.asyncio
+async def test_measure_calls_every_index_once() -> None:
+	"""Should pass each warmup and timed call a distinct index."""
+	seen: list[int] = []
+
+	async def operation(index: int) -> None:
+		seen.append(index)
+
+	measured = await measure("noop", operation, iterations=20, concurrency=4, warmup=3)
+
+	assert sorted(seen) == list(range(23))
+	assert measured.iterations == 20
+	assert measured.concurrency == 4
+	assert measured.p50_ms <= measured.p95_ms <= measured.p99_ms
+
+
+def test_compare_flags_changes_beyond_threshold() -> None:
+	"""Should flag throughput drops and latency growth beyond the threshold only."""
+	baseline = {"fast": result("fast", 1000, 1.0), "slow": result("slow", 100, 10.0)}
+	current = {"fast": result("fast", 950, 1.05), "slow": result("slow", 70, 14.0), "new": result("new", 1, 1)}
+
+	regressed = {(c.name, c.metric) for c in compare(baseline, current, threshold=0.2) if c.regressed}
+
+	assert regressed == {("slow", "ops_per_second"), ("slow", "p50_ms")}
+
+
+def test_compare_command_exit_status(tmp_path: Path) -> None:
+	"""Should exit non-zero only when a benchmark regressed."""
+	metadata = {"dialect": "postgresql", "users": 10_000}
+	baseline = tmp_path / "baseline.json"
+	current = tmp_path / "current.json"
+	write_results(baseline, [result("get", 1000, 1.0)], metadata)
+	write_results(current, [result("get", 990, 1.01)], metadata)
+
+	assert read_results(current) == (metadata, {"get": result("get", 990, 1.01)})
+	assert main([str(baseline), str(current)]) == 0
+
+	write_results(current, [result("get", 500, 2.0)], metadata)
+	assert main([str(baseline), str(current)]) == 1
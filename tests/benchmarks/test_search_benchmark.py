@@ -0,0 +1,64 @@
+"""Benchmark user search plans and latency as the table grows."""
+
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.infrastructure.repositories.user_repository_impl import UserRepositoryImpl, search_query
+
+SIZES = (10_000, 100_000)
+LOOKUPS = 50
+
+
+def plan_nodes(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+	"""Walk an EXPLAIN (FORMAT JSON) plan tree."""
+	yield plan
+	for child in plan.get("Plans", []):
+		yield from plan_nodes(child)
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_search_stays_on_indexes_as_table_grows(
+	pg_sessionmaker: async_sessionmaker[AsyncSession], report: Callable[[str], None]
+) -> None:
+	"""Partial name and email lookups should be planned as index scans at every table size."""
+	loaded = 0
+	for size in SIZES:
+		async with pg_sessionmaker() as session:
+			await session.execute(
+				text(
+					"INSERT INTO users (name, email, is_active) "
+					"SELECT 'Member ' || i, 'member' || i || '@example.com', true "
+					"FROM generate_series(CAST(:start AS integer), CAST(:stop AS integer)) AS i"
+				),
+				{"start": loaded + 1, "stop": size},
+			)
+			await session.execute(text("ANALYZE users"))
+			await session.commit()
+		loaded = size
+
+		query = f"member{size // 2}"
+		async with pg_sessionmaker() as session:
+			connection = await session.connection()
+			compiled = search_query(query).limit(20).compile(dialect=connection.dialect)
+			result = await connection.exec_driver_sql(
+				f"EXPLAIN (FORMAT JSON) {compiled}", tuple(compiled.params[name] for name in compiled.positiontup or ())
+			)
+			node_types = {node["Node Type"] for node in plan_nodes(result.scalar_one()[0]["Plan"])}
+
+			repository = UserRepositoryImpl(session)
+			started = time.perf_counter()
+			for _ in range(LOOKUPS):
+				page = await repository.search(query)
+			elapsed = time.perf_counter() - started
+
+		assert page.users
+		assert page.users[0].email.value == f"{query}@example.com"
+		report(f"search {size} users: {elapsed / LOOKUPS * 1000:.2f} ms/lookup, plan {', '.join(sorted(node_types))}")
+		assert "Seq Scan" not in node_types
+		assert "Bitmap Index Scan" in node_types
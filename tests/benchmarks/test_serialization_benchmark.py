@@ -0,0 +1,84 @@
+"""Benchmark serializing user lists, before and after the fast JSON path."""
+
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from app.domain.entities.user import User
+from app.domain.value_objects.email import Email
+from app.presentation.api.v1.users import USER_LIST_ADAPTER
+from app.presentation.responses import json_response
+from app.presentation.schemas.user import UserListResponse, UserResponse
+
+# Serialized users per measurement, so every size does comparable work
+USERS_PER_RUN = 2_000
+
+
+def make_users(count: int) -> list[User]:
+	"""Build persisted user entities."""
+	created_at = datetime(2024, 1, 1, tzinfo=UTC)
+	return [
+		User.restore(i, f"Member {i}", Email.trusted(f"member{i}@example.com"), True, created_at, None)
+		for i in range(1, count + 1)
+	]
+
+
+def list_body(users: list[UserResponse]) -> UserListResponse:
+	"""Wrap serialized users in a list response."""
+	return UserListResponse(users=users, total=len(users), skip=0, limit=len(users), next_cursor=None)
+
+
+def serialize_validated(users: list[User], response_class: type[JSONResponse]) -> bytes:
+	"""Previous path: validating constructors, ``jsonable_encoder`` and a response class render."""
+	body = list_body(
+		[
+			UserResponse(
+				id=user.id,  # type: ignore
+				name=user.name,
+				email=user.email.value,
+				is_active=user.is_active,
+				created_at=user.created_at,  # type: ignore
+				updated_at=user.updated_at,
+			)
+			for user in users
+		]
+	)
+	return response_class(jsonable_encoder(body)).body
+
+
+def serialize_fast(users: list[User]) -> bytes:
+	"""Current path: constructed models dumped to bytes by pydantic-core."""
+	return json_response(USER_LIST_ADAPTER, list_body([UserResponse.from_entity(user) for user in users])).body
+
+
+def rate(serialize: Callable[[], bytes], runs: int) -> float:
+	"""Serialize ``runs`` times and return the elapsed seconds."""
+	started = time.perf_counter()
+	for _ in range(runs):
+		serialize()
+	return time.perf_counter() - started
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("size", [1, 100, 10_000])
+def test_fast_json_path_serializes_faster(size: int, report: Callable[[str], None]) -> None:
+	"""Pre-rendered JSON should beat validate, encode and dump at every page size."""
+	users = make_users(size)
+	runs = max(1, USERS_PER_RUN // size)
+	assert serialize_fast(users) == serialize_validated(users, JSONResponse)
+
+	before = rate(lambda: serialize_validated(users, JSONResponse), runs)
+	orjson = rate(lambda: serialize_validated(users, ORJSONResponse), runs)
+	fast = rate(lambda: serialize_fast(users), runs)
+
+	serialized = size * runs
+	report(
+		f"serialize pages of {size} users: validated+JSONResponse {serialized / before:,.0f} users/s, "
+		f"validated+ORJSONResponse {serialized / orjson:,.0f} users/s, "
+		f"constructed+dump_json {serialized / fast:,.0f} users/s ({before / fast:.1f}x)"
+	)
+	assert fast < before
@@ -0,0 +1,136 @@
+"""Baseline benchmarks of the repository, use cases and HTTP endpoints.
+
+Every operation runs against the same seeded schema with deterministic inputs,
+so runs with equal ``BENCHMARK_USERS`` can be compared with
+``python -m tests.benchmarks.compare``.
+"""
+
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.application.dtos.user_dto import CreateUserDTO
+from app.application.use_cases.create_user import CreateUserUseCase
+from app.dependencies import get_db, get_read_db
+from app.domain.repositories.user_repository import CountMode
+from app.domain.value_objects.page_cursor import PageCursor
+from app.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+from app.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+from app.main import app
+from tests.benchmarks.conftest import BENCHMARK_USERS
+from tests.benchmarks.results import BenchmarkResult, measure
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.asyncio(loop_scope="module")]
+
+ITERATIONS = 500
+WARMUP = 20
+CONCURRENCY = 16
+
+
+def user_id(index: int) -> int:
+	"""Spread call indexes deterministically over the seeded users."""
+	return index * 7919 % BENCHMARK_USERS + 1
+
+
+def is_postgres(sessionmaker: async_sessionmaker[AsyncSession]) -> bool:
+	"""Whether the benchmark database is PostgreSQL rather than the SQLite stand-in."""
+	return bool(sessionmaker.kw["bind"].dialect.name == "postgresql")
+
+
+async def test_repository_operations(
+	seeded_sessionmaker: async_sessionmaker[AsyncSession], record: Callable[[BenchmarkResult], None]
+) -> None:
+	"""Time repository reads, each on its own session like a request."""
+	async with seeded_sessionmaker() as session:
+		middle = await UserRepositoryImpl(session).get_by_id(BENCHMARK_USERS // 2)
+	assert middle is not None
+	middle_cursor = PageCursor(created_at=middle.created_at, id=middle.id)  # type: ignore[arg-type]
+
+	def run(operation: Callable[[UserRepositoryImpl, int], Any]) -> Callable[[int], Any]:
+		async def call(index: int) -> None:
+			async with seeded_sessionmaker() as session:
+				await operation(UserRepositoryImpl(session), index)
+
+		return call
+
+	operations: dict[str, Callable[[UserRepositoryImpl, int], Any]] = {
+		"repository.get_by_id": lambda repository, index: repository.get_by_id(user_id(index)),
+		"repository.get_by_email": lambda repository, index: repository.get_by_email(f"member{user_id(index)}@example.com"),
+		"repository.list_page.first": lambda repository, _index: repository.list_page(limit=100),
+		"repository.list_page.middle": lambda repository, _index: repository.list_page(limit=100, cursor=middle_cursor),
+		"repository.count.exact": lambda repository, _index: repository.count(CountMode.EXACT),
+		"repository.get_watermark": lambda repository, _index: repository.get_watermark(),
+	}
+	if is_postgres(seeded_sessionmaker):
+		operations["repository.count.estimated"] = lambda repository, _index: repository.count(CountMode.ESTIMATED)
+		operations["repository.search"] = lambda repository, index: repository.search(f"member{user_id(index)}")
+
+	for name, operation in operations.items():
+		record(await measure(name, run(operation), ITERATIONS, warmup=WARMUP))
+
+
+async def test_create_user_use_case(
+	seeded_sessionmaker: async_sessionmaker[AsyncSession], record: Callable[[BenchmarkResult], None]
+) -> None:
+	"""Time user creation through the use case, one unit of work per user."""
+
+	async def create(index: int) -> None:
+		async with seeded_sessionmaker() as session:
+			use_case = CreateUserUseCase(SqlAlchemyUnitOfWork(session))
+			await use_case.execute(CreateUserDTO(name=f"New member {index}", email=f"new{index}@example.com"))
+
+	# SQLite serializes writers, so concurrent creates would only measure lock waits
+	concurrency = CONCURRENCY if is_postgres(seeded_sessionmaker) else 1
+	record(await measure("use_case.create_user", create, ITERATIONS, concurrency=concurrency, warmup=WARMUP))
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def http_client(seeded_sessionmaker: async_sessionmaker[AsyncSession]) -> AsyncIterator[AsyncClient]:
+	"""In-process client for the application, reading and writing the seeded schema."""
+
+	async def seeded_db() -> AsyncIterator[AsyncSession]:
+		async with seeded_sessionmaker() as session:
+			yield session
+
+	async def no_replica() -> AsyncIterator[None]:
+		yield None
+
+	app.dependency_overrides[get_db] = seeded_db
+	app.dependency_overrides[get_read_db] = no_replica
+	async with AsyncClient(app=app, base_url="http://bench") as client:
+		yield client
+	app.dependency_overrides.clear()
+
+
+async def test_http_endpoints(
+	http_client: AsyncClient,
+	seeded_sessionmaker: async_sessionmaker[AsyncSession],
+	record: Callable[[BenchmarkResult], None],
+) -> None:
+	"""Time the user endpoints under concurrent clients, through the full middleware stack."""
+
+	def request(method: str, url: Callable[[int], str], json: Callable[[int], Any] | None = None) -> Any:
+		async def call(index: int) -> None:
+			response = await http_client.request(method, url(index), json=json(index) if json else None)
+			response.raise_for_status()
+
+		return call
+
+	endpoints = {
+		"http.get_user": request("GET", lambda index: f"/api/v1/users/{user_id(index)}"),
+		"http.list_users": request("GET", lambda _index: "/api/v1/users?limit=20"),
+	}
+	if is_postgres(seeded_sessionmaker):
+		endpoints["http.search_users"] = request("GET", lambda index: f"/api/v1/users/search?q=member{user_id(index)}")
+		endpoints["http.update_user"] = request(
+			"PATCH",
+			lambda index: f"/api/v1/users/{user_id(index)}",
+			json=lambda index: {"name": f"Renamed member {index}"},
+		)
+
+	for name, call in endpoints.items():
+		record(await measure(name, call, ITERATIONS, concurrency=CONCURRENCY, warmup=WARMUP))
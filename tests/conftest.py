@@ -1,8 +1,20 @@
 """Pytest configuration and fixtures."""
 
+import difflib
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
 
+from app.dependencies import get_access_token
+from app.infrastructure.auth import AccessToken
+from app.infrastructure.database import engine, replica_engines
 from app.main import app
 
 
@@ -11,3 +23,96 @@ async def client() -> AsyncClient:
 	"""HTTP client for testing."""
 	async with AsyncClient(app=app, base_url="http://test") as ac:
 		yield ac
+
+
+@pytest.fixture
+def authenticate_as() -> Iterator[Callable[[set[str], dict[str, Any]], None]]:
+	"""Accept requests with a token of the given scopes and claims."""
+
+	def authenticate(scopes: set[str], claims: dict[str, Any]) -> None:
+		app.dependency_overrides[get_access_token] = lambda: AccessToken(
+			subject="someone", scopes=frozenset(scopes), expires_at=None, claims=claims
+		)
+
+	yield authenticate
+	app.dependency_overrides.pop(get_access_token, None)
+
+
+@pytest.fixture
+def authenticated(authenticate_as: Callable[[set[str], dict[str, Any]], None]) -> None:
+	"""Accept requests as an authenticated admin."""
+	authenticate_as({"openid", "admin"}, {})
+
+
+class QueryBudget:
+	"""Records SQL statements executed on watched engines and enforces a maximum count.
+
+	Use as ``with query_budget(max_queries=2): await client.get(...)``. Exceeding
+	the budget fails the test with a diff of the statements that ran against
+	the ones the budget allowed, and names statements that ran repeatedly, the
+	usual sign of an N+1 query.
+	"""
+
+	def __init__(self, engines: Iterable[AsyncEngine]) -> None:
+		"""Initialize budget.
+
+		Args:
+		        engines: Engines to watch
+		"""
+		self.statements: list[str] = []
+		self._engines: list[AsyncEngine] = []
+		for watched in engines:
+			self.watch(watched)
+
+	def watch(self, watched: AsyncEngine) -> None:
+		"""Record statements of another engine, e.g. one created by the test."""
+		event.listen(watched.sync_engine, "before_cursor_execute", self._record)
+		self._engines.append(watched)
+
+	def close(self) -> None:
+		"""Stop watching engines."""
+		for watched in self._engines:
+			event.remove(watched.sync_engine, "before_cursor_execute", self._record)
+		self._engines.clear()
+
+	@contextmanager
+	def __call__(self, max_queries: int) -> Iterator[list[str]]:
+		"""Fail unless at most max_queries statements run in the block.
+
+		Args:
+		        max_queries: Statements allowed
+
+		Yields:
+		        Statements run in the block, filled in when it exits
+		"""
+		start = len(self.statements)
+		ran: list[str] = []
+		yield ran
+		ran.extend(self.statements[start:])
+		if len(ran) > max_queries:
+			pytest.fail(self._report(ran, max_queries), pytrace=False)
+
+	def _record(self, _conn: Connection, _cursor: Any, statement: str, *_args: Any) -> None:
+		self.statements.append(" ".join(statement.split()))
+
+	@staticmethod
+	def _report(ran: list[str], max_queries: int) -> str:
+		"""Describe a blown budget."""
+		lines = [f"Expected at most {max_queries} queries, {len(ran)} ran:"]
+		lines.extend(
+			line.rstrip("\n")
+			for line in difflib.unified_diff(ran[:max_queries], ran, "budget", "ran", n=max_queries, lineterm="")
+		)
+		repeated = [(count, statement) for statement, count in Counter(ran).items() if count > 1]
+		if repeated:
+			lines.append("Repeated statements (possible N+1):")
+			lines.extend(f"  {count}x {statement}" for count, statement in repeated)
+		return "\n".join(lines)
+
+
+@pytest.fixture
+def query_budget() -> Iterator[QueryBudget]:
+	"""Statement budget over the application's engines."""
+	budget = QueryBudget([engine, *replica_engines.values()])
+	yield budget
+	budget.close()
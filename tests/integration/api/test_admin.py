@@ -0,0 +1,75 @@
+"""Tests for admin endpoints."""
+
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+
+from app.infrastructure.database import slow_query_log
+from app.infrastructure.slow_queries import SlowQuery
+
+
+@pytest.fixture
+def recorded() -> Iterator[SlowQuery]:
+	"""Record a slow query in the application's log."""
+	entry = SlowQuery(
+		statement="SELECT * FROM users WHERE id = $1",
+		parameters=["int"],
+		duration_seconds=0.25,
+		engine="primary",
+		route="/api/v1/users/{user_id}",
+		plan=[{"Plan": {"Node Type": "Index Scan"}}],
+	)
+	slow_query_log._entries.append(entry)
+	yield entry
+	slow_query_log.clear()
+
+
+@pytest.mark.asyncio
+async def test_list_slow_queries(client: AsyncClient, authenticated: None, recorded: SlowQuery) -> None:
+	"""Should list recorded slow queries with their plans."""
+	response = await client.get("/api/v1/admin/slow-queries")
+
+	assert response.status_code == 200
+	[entry] = response.json()
+	assert entry["statement"] == recorded.statement
+	assert entry["parameters"] == ["int"]
+	assert entry["duration_ms"] == 250
+	assert entry["route"] == "/api/v1/users/{user_id}"
+	assert entry["plan"] == recorded.plan
+
+
+@pytest.mark.asyncio
+async def test_admin_endpoints_require_token(client: AsyncClient) -> None:
+	"""Should reject requests without a bearer token."""
+	response = await client.get("/api/v1/admin/slow-queries")
+
+	assert response.status_code == 401
+	assert response.headers["www-authenticate"] == "Bearer"
+
+
+@pytest.mark.asyncio
+async def test_admin_group_grants_access(
+	client: AsyncClient, authenticate_as: Callable[[set[str], dict[str, Any]], None]
+) -> None:
+	"""Should accept members of the admin group without the admin scope."""
+	authenticate_as({"openid"}, {"groups": ["members", "admins"]})
+
+	response = await client.get("/api/v1/admin/slow-queries")
+
+	assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("claims", [{}, {"groups": ["members"]}, {"groups": "admins"}])
+async def test_admin_endpoints_reject_other_users(
+	client: AsyncClient, authenticate_as: Callable[[set[str], dict[str, Any]], None], claims: dict[str, Any]
+) -> None:
+	"""Should forbid authenticated users with neither the admin scope nor the admin group."""
+	authenticate_as({"openid", "profile"}, claims)
+
+	response = await client.get("/api/v1/admin/slow-queries")
+
+	assert response.status_code == 403
+	assert 'error="insufficient_scope"' in response.headers["www-authenticate"]
@@ -0,0 +1,122 @@
+"""Tests for export endpoints."""
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from httpx import AsyncClient
+
+from app.dependencies import get_user_repository_scope
+from app.domain.entities.user import User
+from app.domain.value_objects.email import Email
+from app.main import app
+from app.presentation.api.v1.exports import CHUNK_ROWS
+
+
+def make_users(count: int) -> list[User]:
+	"""Build persisted user entities for tests."""
+	return [
+		User(
+			id=user_id,
+			name=f"User {user_id}",
+			email=Email(f"user{user_id}@example.com"),
+			created_at=datetime(2024, 1, 1, tzinfo=UTC),
+		)
+		for user_id in range(1, count + 1)
+	]
+
+
+@pytest.fixture
+def repository() -> Iterator[MagicMock]:
+	"""Mock user repository injected into the export endpoint."""
+	mock_repository = MagicMock()
+
+	@asynccontextmanager
+	async def scope() -> AsyncIterator[MagicMock]:
+		yield mock_repository
+
+	app.dependency_overrides[get_user_repository_scope] = lambda: scope
+	yield mock_repository
+	app.dependency_overrides.clear()
+
+
+def stream_of(users: list[User]) -> MagicMock:
+	"""Build a stream_all replacement yielding the given users."""
+
+	async def stream_all(batch_size: int = 1000) -> AsyncIterator[User]:
+		for user in users:
+			yield user
+
+	return MagicMock(side_effect=stream_all)
+
+
+@pytest.mark.asyncio
+async def test_export_users_as_ndjson(client: AsyncClient, authenticated: None, repository: MagicMock) -> None:
+	"""Should stream one JSON object per line."""
+	repository.stream_all = stream_of(make_users(CHUNK_ROWS + 3))
+
+	response = await client.get("/api/v1/exports/users")
+
+	assert response.status_code == 200
+	assert response.headers["content-type"] == "application/x-ndjson"
+	lines = response.text.splitlines()
+	assert len(lines) == CHUNK_ROWS + 3
+	assert json.loads(lines[0]) == {
+		"id": 1,
+		"name": "User 1",
+		"email": "user1@example.com",
+		"is_active": True,
+		"created_at": "2024-01-01T00:00:00+00:00",
+		"updated_at": None,
+	}
+
+
+@pytest.mark.asyncio
+async def test_export_users_as_csv(client: AsyncClient, authenticated: None, repository: MagicMock) -> None:
+	"""Should stream a header followed by one row per user."""
+	repository.stream_all = stream_of(make_users(2))
+
+	response = await client.get("/api/v1/exports/users", params={"format": "csv"})
+
+	assert response.status_code == 200
+	assert response.headers["content-type"].startswith("text/csv")
+	assert 'filename="users.csv"' in response.headers["content-disposition"]
+	rows = list(csv.reader(io.StringIO(response.text)))
+	assert rows[0] == ["id", "name", "email", "is_active", "created_at", "updated_at"]
+	assert rows[2][:4] == ["2", "User 2", "user2@example.com", "True"]
+	assert len(rows) == 3
+
+
+@pytest.mark.asyncio
+async def test_export_users_with_unknown_format_returns_422(
+	client: AsyncClient, authenticated: None, repository: MagicMock
+) -> None:
+	"""Should reject unsupported formats."""
+	response = await client.get("/api/v1/exports/users", params={"format": "xml"})
+
+	assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("scopes", "status_code"), [(None, 401), ({"openid"}, 403)])
+async def test_export_users_requires_admin(
+	client: AsyncClient,
+	authenticate_as: Callable[[set[str], dict[str, Any]], None],
+	repository: MagicMock,
+	scopes: set[str] | None,
+	status_code: int,
+) -> None:
+	"""Should refuse the roster to anonymous callers and to users without admin rights."""
+	if scopes is not None:
+		authenticate_as(scopes, {})
+
+	response = await client.get("/api/v1/exports/users")
+
+	assert response.status_code == status_code
+	repository.stream_all.assert_not_called()
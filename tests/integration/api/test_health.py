@@ -3,6 +3,8 @@
 import pytest
 from httpx import AsyncClient
 
+from app.infrastructure.database import database_check
+
 
 @pytest.mark.asyncio
 async def test_health_check_returns_200(client: AsyncClient) -> None:
@@ -14,3 +16,47 @@ async def test_health_check_returns_200(client: AsyncClient) -> None:
 	assert data["status"] == "healthy"
 	assert "version" in data
 	assert "environment" in data
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("healthy", "status_code", "status"), [(True, 200, "ready"), (False, 503, "unavailable")])
+async def test_ready_reflects_database_check(
+	client: AsyncClient, monkeypatch: pytest.MonkeyPatch, healthy: bool, status_code: int, status: str
+) -> None:
+	"""Should answer 503 while the database check fails."""
+
+	async def is_healthy() -> bool:
+		return healthy
+
+	monkeypatch.setattr(database_check, "is_healthy", is_healthy)
+
+	response = await client.get("/ready")
+
+	assert response.status_code == status_code
+	assert response.json() == {"status": status}
+
+
+@pytest.mark.asyncio
+async def test_metrics_exposes_pool_metrics(client: AsyncClient) -> None:
+	"""Should expose connection pool metrics in Prometheus text format."""
+	response = await client.get("/metrics")
+
+	assert response.status_code == 200
+	assert response.headers["content-type"].startswith("text/plain")
+	assert "db_pool_checked_out" in response.text
+	assert "db_pool_checkout_wait_seconds_bucket" in response.text
+
+
+@pytest.mark.asyncio
+async def test_metrics_exposes_request_metrics(client: AsyncClient) -> None:
+	"""Should record requests labelled by route template."""
+	await client.get("/health")
+	await client.get("/does-not-exist")
+
+	response = await client.get("/metrics")
+
+	assert 'http_request_duration_seconds_count{method="GET",route="/health",status="200"}' in response.text
+	assert 'http_request_duration_seconds_count{method="GET",route="unmatched",status="404"}' in response.text
+	assert 'http_response_size_bytes_count{method="GET",route="/health"}' in response.text
+	assert 'http_request_db_queries_count{route="/health"}' in response.text
+	assert "http_requests_in_flight" in response.text
@@ -0,0 +1,157 @@
+"""Query budgets of the user endpoints, run against a real SQLite database."""
+
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import Select, literal, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.dependencies import get_db, get_read_db, get_user_repository_scope, user_count_cache
+from app.domain.entities.user import User
+from app.domain.repositories.user_repository import UserRepository
+from app.domain.value_objects.email import Email
+from app.domain.value_objects.page_cursor import SearchCursor
+from app.infrastructure.database import Base
+from app.infrastructure.repositories import user_repository_impl
+from app.infrastructure.repositories.user_repository_impl import USER_COLUMNS, UserRepositoryImpl, users_table
+from app.main import app
+from app.presentation.api.v1.exports import CHUNK_ROWS
+from tests.conftest import QueryBudget
+
+# Enough users for an export of several chunks
+SEEDED_USERS = CHUNK_ROWS * 2 + 1
+
+
+@pytest.fixture
+async def sessionmaker(tmp_path: Path, query_budget: QueryBudget) -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+	"""Session factory for a seeded database the application uses, watched by the budget."""
+	engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
+	async with engine.begin() as conn:
+		await conn.run_sync(Base.metadata.create_all)
+	sessionmaker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+	async with sessionmaker() as session:
+		await UserRepositoryImpl(session).save_many(
+			[User(name=f"Member {i}", email=Email(f"member{i}@example.com")) for i in range(1, SEEDED_USERS + 1)]
+		)
+		await session.commit()
+	query_budget.watch(engine)
+	user_count_cache.clear()
+	yield sessionmaker
+	await engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def database(sessionmaker: async_sessionmaker[AsyncSession]) -> Iterator[None]:
+	"""Point the application's sessions at the test database."""
+
+	async def get_test_db() -> AsyncIterator[AsyncSession]:
+		async with sessionmaker() as session:
+			yield session
+
+	async def no_replica() -> None:
+		return None
+
+	@asynccontextmanager
+	async def repository_scope() -> AsyncIterator[UserRepository]:
+		async with sessionmaker() as session:
+			yield UserRepositoryImpl(session)
+
+	app.dependency_overrides[get_db] = get_test_db
+	app.dependency_overrides[get_read_db] = no_replica
+	app.dependency_overrides[get_user_repository_scope] = lambda: repository_scope
+	yield
+	app.dependency_overrides.clear()
+	user_count_cache.clear()
+
+
+def portable_search_query(query: str, cursor: SearchCursor | None = None) -> Select[Any]:
+	"""Stand-in for the PostgreSQL search statement, one statement like it."""
+	pattern = user_repository_impl.contains_pattern(query)
+	statement = select(*USER_COLUMNS, literal(1.0)).where(
+		or_(users_table.c.name.ilike(pattern, escape="\\"), users_table.c.email.ilike(pattern, escape="\\"))
+	)
+	if cursor is not None:
+		statement = statement.where(users_table.c.id > cursor.id)
+	return statement.order_by(users_table.c.id)
+
+
+@pytest.mark.asyncio
+async def test_list_users_budget(client: AsyncClient, query_budget: QueryBudget) -> None:
+	"""Should list a page with the page query and a count, and revalidate with the watermark alone."""
+	with query_budget(max_queries=2):
+		response = await client.get("/api/v1/users", params={"limit": 50})
+	assert response.status_code == 200
+	assert len(response.json()["users"]) == 50
+
+	with query_budget(max_queries=1):
+		response = await client.get("/api/v1/users", params={"limit": 50, "cursor": response.json()["next_cursor"]})
+	assert response.status_code == 200
+
+	with query_budget(max_queries=3):
+		response = await client.get("/api/v1/users", params={"limit": 50}, headers={"If-None-Match": '"stale"'})
+	assert response.status_code == 200
+
+	with query_budget(max_queries=1):
+		response = await client.get(
+			"/api/v1/users", params={"limit": 50}, headers={"If-None-Match": response.headers["etag"]}
+		)
+	assert response.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_get_user_budget(client: AsyncClient, query_budget: QueryBudget) -> None:
+	"""Should get a user with one query, and revalidate it with one timestamp query."""
+	with query_budget(max_queries=1):
+		response = await client.get("/api/v1/users/1")
+	assert response.status_code == 200
+
+	with query_budget(max_queries=1):
+		response = await client.get("/api/v1/users/1", headers={"If-None-Match": response.headers["etag"]})
+	assert response.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_search_users_budget(
+	client: AsyncClient, query_budget: QueryBudget, monkeypatch: pytest.MonkeyPatch
+) -> None:
+	"""Should search with one query per page."""
+	monkeypatch.setattr(user_repository_impl, "search_query", portable_search_query)
+
+	with query_budget(max_queries=1):
+		response = await client.get("/api/v1/users/search", params={"q": "member1", "limit": 5})
+	assert response.status_code == 200
+	assert len(response.json()["users"]) == 5
+
+	with query_budget(max_queries=1):
+		response = await client.get(
+			"/api/v1/users/search", params={"q": "member1", "limit": 5, "cursor": response.json()["next_cursor"]}
+		)
+	assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_bulk_endpoints_budget(client: AsyncClient, authenticated: None, query_budget: QueryBudget) -> None:
+	"""Should import and change users in bulk with one statement, whatever the number of rows."""
+	rows = [{"name": f"New {i}", "email": f"new{i}@example.com"} for i in range(200)]
+	with query_budget(max_queries=1):
+		response = await client.post("/api/v1/users/bulk", json={"users": [*rows, rows[0], {"name": "", "email": "x"}]})
+	assert response.status_code == 200
+	assert response.json()["created"] == 200
+
+	with query_budget(max_queries=1):
+		response = await client.post("/api/v1/users/bulk/deactivate", json={"is_active": True})
+	assert response.status_code == 200
+	assert response.json()["count"] == SEEDED_USERS + 200
+
+
+@pytest.mark.asyncio
+async def test_export_users_budget(client: AsyncClient, authenticated: None, query_budget: QueryBudget) -> None:
+	"""Should stream every chunk of an export from one query."""
+	with query_budget(max_queries=1):
+		response = await client.get("/api/v1/exports/users")
+	assert response.status_code == 200
+	assert len(response.text.splitlines()) == SEEDED_USERS
@@ -0,0 +1,444 @@
+"""Tests for user endpoints."""
+
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from httpx import AsyncClient
+
+from app.dependencies import get_unit_of_work
+from app.domain.entities.user import User
+from app.domain.exceptions import EmailAlreadyExistsError
+from app.domain.repositories.user_repository import (
+	CountMode,
+	UserFilter,
+	UserPage,
+	UserSearchPage,
+	UserWatermark,
+)
+from app.domain.value_objects.email import Email
+from app.domain.value_objects.page_cursor import PageCursor, SearchCursor
+from app.main import app
+
+
+def make_user(user_id: int) -> User:
+	"""Build a persisted user entity for tests."""
+	return User(
+		id=user_id,
+		name=f"User {user_id}",
+		email=Email(f"user{user_id}@example.com"),
+		created_at=datetime(2024, 1, 1, tzinfo=UTC),
+	)
+
+
+@pytest.fixture
+def unit_of_work() -> Iterator[AsyncMock]:
+	"""Mock unit of work injected into the API."""
+	mock_unit_of_work = AsyncMock()
+	app.dependency_overrides[get_unit_of_work] = lambda: mock_unit_of_work
+	yield mock_unit_of_work
+	app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def repository(unit_of_work: AsyncMock) -> AsyncMock:
+	"""Mock user repository of the injected unit of work."""
+	repository: AsyncMock = unit_of_work.users
+	repository.get_watermark.return_value = UserWatermark(last_id=None, last_updated_at=None)
+	return repository
+
+
+@pytest.mark.asyncio
+async def test_list_users_returns_first_page_with_cursor(client: AsyncClient, repository: AsyncMock) -> None:
+	"""Should return the first page and an opaque cursor for the next one."""
+	next_cursor = PageCursor(created_at=datetime(2024, 1, 1, tzinfo=UTC), id=2)
+	repository.list_page.return_value = UserPage(users=[make_user(1), make_user(2)], next_cursor=next_cursor)
+	repository.count.return_value = 5
+
+	response = await client.get("/api/v1/users", params={"limit": 2})
+
+	assert response.status_code == 200
+	data = response.json()
+	assert [user["id"] for user in data["users"]] == [1, 2]
+	assert data["total"] == 5
+	assert data["limit"] == 2
+	assert data["next_cursor"] == next_cursor.encode()
+	assert response.headers["etag"].startswith('"')
+	repository.list_page.assert_called_once_with(limit=2, cursor=None)
+	repository.count.assert_called_once_with(CountMode.CACHED)
+	repository.get_watermark.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_list_users_follows_cursor(client: AsyncClient, repository: AsyncMock) -> None:
+	"""Should decode the cursor and return null next_cursor on the last page."""
+	cursor = PageCursor(created_at=datetime(2024, 1, 1, tzinfo=UTC), id=2)
+	repository.list_page.return_value = UserPage(users=[make_user(3)])
+	repository.count.return_value = 3
+
+	response = await client.get("/api/v1/users", params={"limit": 2, "cursor": cursor.encode()})
+
+	assert response.status_code == 200
+	assert response.json()["next_cursor"] is None
+	repository.list_page.assert_called_once_with(limit=2, cursor=cursor)
+
+
+@pytest.mark.asyncio
+async def test_list_users_with_invalid_cursor_returns_400(client: AsyncClient, repository: AsyncMock) -> None:
+	"""Should reject malformed cursors."""
+	response = await client.get("/api/v1/users", params={"cursor": "garbage"})
+
+	assert response.status_code == 400
+	repository.list_page.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", [CountMode.ESTIMATED, CountMode.CACHED])
+async def test_list_users_counts_with_requested_mode(
+	client: AsyncClient, repository: AsyncMock, mode: CountMode
+) -> None:
+	"""Should compute total with the counting strategy the client asked for."""
+	repository.list_page.return_value = UserPage(users=[])
+	repository.count.return_value = 1000
+
+	response = await client.get("/api/v1/users", params={"count": mode.value})
+
+	assert response.status_code == 200
+	assert response.json()["total"] == 1000
+	repository.count.assert_called_once_with(mode)
+
+
+@pytest.mark.asyncio
+async def test_list_users_revalidates_with_requested_count_mode(client: AsyncClient, repository: AsyncMock) -> None:
+	"""Should count with the requested mode on revalidation too, and tag copies per mode and total."""
+	repository.list_page.return_value = UserPage(users=[])
+	repository.count.return_value = 7
+	cached = (await client.get("/api/v1/users")).headers["etag"]
+	exact = (await client.get("/api/v1/users", params={"count": "exact"})).headers["etag"]
+
+	first = await client.get("/api/v1/users", headers={"If-None-Match": cached})
+	repository.count.return_value = 8
+	after_total_changed = await client.get("/api/v1/users", headers={"If-None-Match": first.headers["etag"]})
+
+	assert cached != exact
+	assert first.status_code == 304
+	assert after_total_changed.status_code == 200
+	assert after_total_changed.json()["total"] == 8
+	repository.count.assert_called_with(CountMode.CACHED)
+
+
+@pytest.mark.asyncio
+async def test_list_users_with_skip_uses_offset_pagination(client: AsyncClient, repository: AsyncMock) -> None:
+	"""Should keep supporting skip and hand out a cursor to switch to keyset pagination."""
+	repository.list_all.return_value = [make_user(3), make_user(4)]
+	repository.count.return_value = 10
+
+	response = await client.get("/api/v1/users", params={"skip": 2, "limit": 2})
+
+	assert response.status_code == 200
+	data = response.json()
+	assert data["skip"] == 2
+	assert PageCursor.decode(data["next_cursor"]).id == 4
+	repository.list_all.assert_called_once_with(skip=2, limit=2)
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_users_returns_per_row_results(
+	client: AsyncClient, unit_of_work: AsyncMock, repository: AsyncMock
+) -> None:
+	"""Should create valid rows and report the others."""
+
+	async def save_many(users: list[User]) -> list[User]:
+		for user_id, user in enumerate(users, start=1):
+			user.id = user_id
+			user.created_at = datetime(2024, 1, 1, tzinfo=UTC)
+		return users
+
+	repository.save_many.side_effect = save_many
+
+	response = await client.post(
+		"/api/v1/users/bulk",
+		json={
+			"users": [
+				{"name": "John", "email": "john@example.com"},
+				{"name": "John", "email": "john@example.com"},
+				{"name": "Jane", "email": "not-an-email"},
+			]
+		},
+	)
+
+	assert response.status_code == 200
+	data = response.json()
+	assert [result["status"] for result in data["results"]] == ["created", "duplicate", "invalid"]
+	assert data["results"][0]["user"]["email"] == "john@example.com"
+	assert (data["created"], data["duplicates"], data["invalid"]) == (1, 1, 1)
+	unit_of_work.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_users_with_empty_batch_returns_422(client: AsyncClient, repository: AsyncMock) -> None:
+	"""Should reject empty batches."""
+	response = await client.post("/api/v1/users/bulk", json={"users": []})
+
+	assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_import_users_queues_a_job(client: AsyncClient, unit_of_work: AsyncMock, repository: AsyncMock) -> None:
+	"""Should accept the batch for the job worker without creating users in the request."""
+	unit_of_work.jobs.enqueue.return_value = 42
+
+	response = await client.post("/api/v1/users/imports", json={"users": [{"name": "John", "email": "john@example.com"}]})
+
+	assert response.status_code == 202
+	assert response.json() == {"job_id": 42}
+	repository.save_many.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_user_patches_given_fields(
+	client: AsyncClient, unit_of_work: AsyncMock, repository: AsyncMock
+) -> None:
+	"""Should update only the fields sent in the request."""
+	updated = make_user(1)
+	updated.is_active = False
+	repository.update_fields.return_value = updated
+
+	response = await client.patch("/api/v1/users/1", json={"is_active": False})
+
+	assert response.status_code == 200
+	assert response.json()["is_active"] is False
+	repository.update_fields.assert_called_once_with(1, is_active=False)
+	unit_of_work.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_update_missing_user_returns_404(client: AsyncClient, repository: AsyncMock) -> None:
+	"""Should return 404 for unknown users."""
+	repository.update_fields.return_value = None
+
+	response = await client.patch("/api/v1/users/42", json={"name": "Jane"})
+
+	assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_update_user_with_taken_email_returns_409(client: AsyncClient, repository: AsyncMock) -> None:
+	"""Should return 409 when the new email belongs to another user."""
+	repository.update_fields.side_effect = EmailAlreadyExistsError("user2@example.com")
+
+	response = await client.patch("/api/v1/users/1", json={"email": "user2@example.com"})
+
+	assert response.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_bulk_deactivate_users_by_id(
+	client: AsyncClient, authenticated: None, unit_of_work: AsyncMock, repository: AsyncMock
+) -> None:
+	"""Should deactivate the listed users in one statement."""
+	repository.deactivate_many.return_value = [1, 2]
+
+	response = await client.post("/api/v1/users/bulk/deactivate", json={"ids": [1, 2, 3]})
+
+	assert response.status_code == 200
+	assert response.json() == {"ids": [1, 2], "count": 2}
+	repository.deactivate_many.assert_called_once_with([1, 2, 3])
+	unit_of_work.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_users_by_filter(client: AsyncClient, authenticated: None, repository: AsyncMock) -> None:
+	"""Should delete users matching the filter conditions."""
+	repository.delete_where.return_value = [4]
+
+	response = await client.post(
+		"/api/v1/users/bulk/delete", json={"is_active": False, "changed_before": "2024-06-01T00:00:00Z"}
+	)
+
+	assert response.status_code == 200
+	assert response.json() == {"ids": [4], "count": 1}
+	repository.delete_where.assert_called_once_with(
+		UserFilter(is_active=False, changed_before=datetime(2024, 6, 1, tzinfo=UTC))
+	)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("payload", [{}, {"ids": [1], "is_active": False}, {"ids": []}])
+async def test_bulk_delete_users_requires_one_selection(
+	client: AsyncClient, authenticated: None, repository: AsyncMock, payload: dict[str, object]
+) -> None:
+	"""Should reject requests selecting nothing, everything, or both by ID and filter."""
+	response = await client.post("/api/v1/users/bulk/delete", json=payload)
+
+	assert response.status_code == 422
+	repository.delete_many.assert_not_called()
+	repository.delete_where.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("action", ["deactivate", "delete"])
+@pytest.mark.parametrize(("scopes", "status_code"), [(None, 401), ({"openid"}, 403)])
+async def test_bulk_actions_require_admin(
+	client: AsyncClient,
+	authenticate_as: Callable[[set[str], dict[str, Any]], None],
+	repository: AsyncMock,
+	action: str,
+	scopes: set[str] | None,
+	status_code: int,
+) -> None:
+	"""Should refuse bulk actions to anonymous callers and to users without admin rights."""
+	if scopes is not None:
+		authenticate_as(scopes, {})
+
+	response = await client.post(f"/api/v1/users/bulk/{action}", json={"is_active": True})
+
+	assert response.status_code == status_code
+	repository.deactivate_where.assert_not_called()
+	repository.delete_where.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_search_users_returns_ranked_page(client: AsyncClient, repository: AsyncMock) -> None:
+	"""Should return matches with a cursor for the next page."""
+	next_cursor = SearchCursor(score=0.4, id=2)
+	repository.search.return_value = UserSearchPage(users=[make_user(1), make_user(2)], next_cursor=next_cursor)
+
+	response = await client.get("/api/v1/users/search", params={"q": "user", "limit": 2})
+
+	assert response.status_code == 200
+	data = response.json()
+	assert [user["id"] for user in data["users"]] == [1, 2]
+	assert data["next_cursor"] == next_cursor.encode()
+	repository.search.assert_called_once_with("user", limit=2, cursor=None)
+
+
+@pytest.mark.asyncio
+async def test_search_users_follows_cursor(client: AsyncClient, repository: AsyncMock) -> None:
+	"""Should decode the cursor and return null next_cursor on the last page."""
+	cursor = SearchCursor(score=0.4, id=2)
+	repository.search.return_value = UserSearchPage(users=[make_user(3)])
+
+	response = await client.get("/api/v1/users/search", params={"q": "user", "cursor": cursor.encode()})
+
+	assert response.status_code == 200
+	assert response.json()["next_cursor"] is None
+	repository.search.assert_called_once_with("user", limit=20, cursor=cursor)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("params", "status_code"), [({"q": "us"}, 422), ({"q": "user", "cursor": "garbage"}, 400)])
+async def test_search_users_rejects_bad_input(
+	client: AsyncClient, repository: AsyncMock, params: dict[str, str], status_code: int
+) -> None:
+	"""Should reject queries too short for trigram indexes and malformed cursors."""
+	response = await client.get("/api/v1/users/search", params=params)
+
+	assert response.status_code == status_code
+	repository.search.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_user_returns_user_with_validators(client: AsyncClient, repository: AsyncMock) -> None:
+	"""Should load the user once and derive its ETag and Last-Modified from it."""
+	repository.get_by_id.return_value = make_user(1)
+
+	response = await client.get("/api/v1/users/1")
+
+	assert response.status_code == 200
+	assert response.json()["id"] == 1
+	assert response.headers["etag"].startswith('"')
+	assert response.headers["last-modified"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+	repository.get_last_modified.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+	"headers",
+	[
+		{"If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"},
+		{"If-Modified-Since": "Tue, 02 Jan 2024 00:00:00 GMT"},
+	],
+)
+async def test_get_user_not_modified_since(client: AsyncClient, repository: AsyncMock, headers: dict[str, str]) -> None:
+	"""Should answer 304 from the timestamp query without loading the user."""
+	repository.get_last_modified.return_value = datetime(2024, 1, 1, 0, 0, 0, 500, tzinfo=UTC)
+
+	response = await client.get("/api/v1/users/1", headers=headers)
+
+	assert response.status_code == 304
+	assert response.content == b""
+	repository.get_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_user_with_matching_etag_returns_304(client: AsyncClient, repository: AsyncMock) -> None:
+	"""Should answer 304 when the client's entity tag is current, and 200 once the user changes."""
+	repository.get_last_modified.return_value = datetime(2024, 1, 1, tzinfo=UTC)
+	repository.get_by_id.return_value = make_user(1)
+	etag = (await client.get("/api/v1/users/1")).headers["etag"]
+	repository.get_by_id.reset_mock()
+
+	response = await client.get("/api/v1/users/1", headers={"If-None-Match": etag})
+
+	assert response.status_code == 304
+	assert response.headers["etag"] == etag
+	repository.get_by_id.assert_not_called()
+
+	repository.get_last_modified.return_value = datetime(2024, 1, 2, tzinfo=UTC)
+	response = await client.get("/api/v1/users/1", headers={"If-None-Match": etag})
+
+	assert response.status_code == 200
+	assert response.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_get_missing_user_returns_404(client: AsyncClient, repository: AsyncMock) -> None:
+	"""Should return 404 for unknown users, revalidated or not."""
+	repository.get_by_id.return_value = None
+	repository.get_last_modified.return_value = None
+
+	response = await client.get("/api/v1/users/42")
+	revalidated = await client.get("/api/v1/users/42", headers={"If-None-Match": '"stale"'})
+
+	assert response.status_code == 404
+	assert revalidated.status_code == 404
+	repository.get_by_id.assert_called_once_with(42)
+
+
+@pytest.mark.asyncio
+async def test_list_users_not_modified_skips_queries(client: AsyncClient, repository: AsyncMock) -> None:
+	"""Should accept the page's tag once, then answer 304 from the watermark alone while the table is unchanged."""
+	repository.get_watermark.return_value = UserWatermark(last_id=2, last_updated_at=datetime(2024, 1, 1, tzinfo=UTC))
+	repository.list_page.return_value = UserPage(users=[make_user(1), make_user(2)])
+	repository.count.return_value = 2
+	page_etag = (await client.get("/api/v1/users", params={"limit": 2})).headers["etag"]
+
+	first = await client.get("/api/v1/users", params={"limit": 2}, headers={"If-None-Match": page_etag})
+	assert first.status_code == 304
+	assert first.headers["etag"] != page_etag
+	repository.list_page.reset_mock()
+
+	response = await client.get("/api/v1/users", params={"limit": 2}, headers={"If-None-Match": first.headers["etag"]})
+
+	assert response.status_code == 304
+	repository.list_page.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_list_users_etag_depends_on_query_and_count(client: AsyncClient, repository: AsyncMock) -> None:
+	"""Should change the entity tag per page and after deletes."""
+	repository.get_watermark.return_value = UserWatermark(last_id=2, last_updated_at=datetime(2024, 1, 1, tzinfo=UTC))
+	repository.list_page.return_value = UserPage(users=[])
+	repository.count.return_value = 2
+
+	first = (await client.get("/api/v1/users", params={"limit": 2})).headers["etag"]
+	other_page = (await client.get("/api/v1/users", params={"limit": 3})).headers["etag"]
+	repository.count.return_value = 1
+	after_delete = await client.get("/api/v1/users", params={"limit": 2}, headers={"If-None-Match": first})
+
+	assert len({first, other_page, after_delete.headers["etag"]}) == 3
+	assert after_delete.status_code == 200
+	assert "last-modified" not in after_delete.headers
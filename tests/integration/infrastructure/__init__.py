@@ -0,0 +1 @@
+"""Infrastructure integration tests."""
@@ -0,0 +1,131 @@
+"""Tests for connection pool prewarming and the readiness check.
+
+A local SQLite database stands in for the primary.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.infrastructure.database import Base, build_probe_engine, prewarm_pool
+from app.infrastructure.health import DatabaseCheck
+from app.infrastructure.models.user import UserModel  # noqa: F401 - registers the users table
+from app.infrastructure.repositories.user_repository_impl import warm_statement_cache
+
+
+class FakeClock:
+	"""Manually advanced monotonic clock."""
+
+	def __init__(self) -> None:
+		self.now = 0.0
+
+	def __call__(self) -> float:
+		return self.now
+
+
+@pytest.fixture
+async def engine(tmp_path: Path) -> AsyncIterator[AsyncEngine]:
+	"""Stand-in primary database with the schema created."""
+	engine = create_async_engine(
+		f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}", poolclass=AsyncAdaptedQueuePool, pool_size=5
+	)
+	async with engine.begin() as conn:
+		await conn.run_sync(Base.metadata.create_all)
+	await engine.dispose()
+	yield engine
+	await engine.dispose()
+
+
+def count_statements(engine: AsyncEngine) -> list[str]:
+	"""Collect statements executed on an engine."""
+	statements: list[str] = []
+	event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+	return statements
+
+
+@pytest.mark.asyncio
+async def test_prewarm_fills_pool_with_warmed_connections(engine: AsyncEngine) -> None:
+	"""Should leave the requested number of distinct connections idle in the pool."""
+	warmed: list[object] = []
+
+	async def warm_up(session: AsyncSession) -> None:
+		await warm_statement_cache(session)
+		warmed.append((await session.connection()).sync_connection.connection.dbapi_connection)  # type: ignore[union-attr]
+
+	await prewarm_pool(engine, 3, warm_up)
+
+	assert engine.pool.checkedin() == 3  # type: ignore[attr-defined]
+	assert len(set(map(id, warmed))) == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("failing", ["connect", "warm_up"])
+async def test_prewarm_returns_connections_when_one_fails(engine: AsyncEngine, failing: str) -> None:
+	"""Should give every opened connection back to the pool and raise the failure."""
+	attempts = 0
+
+	def connect_or_fail(*_args: object) -> None:
+		nonlocal attempts
+		attempts += 1
+		if failing == "connect" and attempts == 2:
+			raise ConnectionError("connection refused")
+
+	async def warm_up(session: AsyncSession) -> None:
+		if failing == "warm_up" and attempts == 3:
+			raise ConnectionError("connection reset")
+		await warm_statement_cache(session)
+
+	event.listen(engine.sync_engine, "do_connect", connect_or_fail)
+
+	with pytest.raises(ConnectionError):
+		await prewarm_pool(engine, 3, warm_up)
+
+	assert engine.pool.checkedout() == 0  # type: ignore[attr-defined]
+	assert engine.pool.checkedin() == (2 if failing == "connect" else 3)  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_database_check_reuses_outcome_within_ttl(engine: AsyncEngine) -> None:
+	"""Should share one query between concurrent probes and reuse it until the TTL passes."""
+	clock = FakeClock()
+	check = DatabaseCheck(engine, ttl=2.0, clock=clock)
+	statements = count_statements(engine)
+
+	assert await asyncio.gather(*(check.is_healthy() for _ in range(5))) == [True] * 5
+	clock.now = 1.9
+	assert await check.is_healthy() is True
+	assert len(statements) == 1
+
+	clock.now = 2.0
+	assert await check.is_healthy() is True
+	assert len(statements) == 2
+
+
+@pytest.mark.asyncio
+async def test_database_check_fails_when_unreachable(tmp_path: Path) -> None:
+	"""Should report an unreachable database as not ready."""
+	engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'db.sqlite'}")
+	try:
+		assert await DatabaseCheck(engine).is_healthy() is False
+	finally:
+		await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_database_check_on_probe_engine_ignores_busy_pool(tmp_path: Path) -> None:
+	"""Should report the database ready while every pooled connection of the application is in use."""
+	url = f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}"
+	busy = create_async_engine(url, poolclass=AsyncAdaptedQueuePool, pool_size=1, max_overflow=0, pool_timeout=0.1)
+	probe = build_probe_engine(url)
+	try:
+		async with busy.connect():
+			assert await DatabaseCheck(busy, timeout=0.5).is_healthy() is False
+			assert await DatabaseCheck(probe, timeout=0.5).is_healthy() is True
+	finally:
+		await busy.dispose()
+		await probe.dispose()
@@ -0,0 +1,162 @@
+"""Tests for read replica routing.
+
+Two local SQLite databases stand in for the primary and a replica. They hold
+different data under the same ID, so each read shows which one served it.
+"""
+
+import shutil
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack, asynccontextmanager
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from starlette.requests import Request
+
+from app import dependencies
+from app.config import settings
+from app.dependencies import get_read_db, get_unit_of_work
+from app.domain.value_objects.email import Email
+from app.infrastructure.database import Base
+from app.infrastructure.models.user import UserModel
+from app.infrastructure.replicas import ReplicaRouter
+from app.infrastructure.repositories.cached_user_repository import CachedUserRepository
+from app.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+
+
+async def create_database(path: Path, email: str) -> AsyncEngine:
+	"""Create a SQLite database holding one user with the given email."""
+	path.parent.mkdir(exist_ok=True)
+	engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+	async with engine.begin() as conn:
+		await conn.run_sync(Base.metadata.create_all)
+		await conn.execute(insert(UserModel).values(id=1, name="Member", email=email))
+	return engine
+
+
+@pytest.fixture
+async def primary(tmp_path: Path) -> AsyncIterator[AsyncEngine]:
+	"""Stand-in primary database."""
+	engine = await create_database(tmp_path / "primary" / "db.sqlite", "primary@example.com")
+	yield engine
+	await engine.dispose()
+
+
+@pytest.fixture
+async def router(tmp_path: Path) -> AsyncIterator[ReplicaRouter]:
+	"""Router over one stand-in replica database."""
+	engine = await create_database(tmp_path / "replica" / "db.sqlite", "replica@example.com")
+	replica_router = ReplicaRouter({"replica-0": engine})
+	yield replica_router
+	await replica_router.dispose()
+
+
+@asynccontextmanager
+async def repository_for(primary: AsyncEngine, router: ReplicaRouter) -> AsyncIterator[UserRepositoryImpl]:
+	"""Open a repository reading from whatever the router picks."""
+	sessionmaker = await router.pick()
+	async with AsyncExitStack() as stack:
+		db = await stack.enter_async_context(async_sessionmaker(primary, class_=AsyncSession)())
+		read_db = await stack.enter_async_context(sessionmaker()) if sessionmaker else None
+		yield UserRepositoryImpl(db, read_db=read_db)
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_healthy_replica(primary: AsyncEngine, router: ReplicaRouter) -> None:
+	"""Should serve reads from the replica."""
+	async with repository_for(primary, router) as repository:
+		user = await repository.get_by_id(1)
+
+		assert user is not None
+		assert user.email.value == "replica@example.com"
+		assert await repository.exists_by_email("replica@example.com") is True
+		assert [user.email.value for user in await repository.list_all()] == ["replica@example.com"]
+
+
+@pytest.mark.asyncio
+async def test_reads_after_write_go_to_primary(primary: AsyncEngine, router: ReplicaRouter) -> None:
+	"""Should read from the primary once the repository has written."""
+	async with repository_for(primary, router) as repository:
+		user = await repository.get_by_id(1)
+		assert user is not None
+
+		user.change_email(Email("changed@example.com"))
+		await repository.save(user)
+
+		reread = await repository.get_by_id(1)
+		assert reread is not None
+		assert reread.email.value == "changed@example.com"
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_replica_fails_over_to_primary(
+	primary: AsyncEngine, router: ReplicaRouter, tmp_path: Path
+) -> None:
+	"""Should read from the primary when the replica fails its health check."""
+	assert await router.pick() is not None
+
+	# Make the replica unreachable
+	await router.replicas[0].engine.dispose()
+	shutil.rmtree(tmp_path / "replica")
+	await router.check()
+
+	async with repository_for(primary, router) as repository:
+		user = await repository.get_by_id(1)
+
+	assert router.replicas[0].healthy is False
+	assert user is not None
+	assert user.email.value == "primary@example.com"
+
+
+def make_request(method: str, headers: dict[str, str] | None = None) -> Request:
+	"""Build a bare request for dependency tests."""
+	raw_headers = [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()]
+	return Request({"type": "http", "method": method, "headers": raw_headers})
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+	("method", "headers", "uses_replica"),
+	[
+		("GET", None, True),
+		("POST", None, False),
+		("PATCH", None, False),
+		("GET", {"X-Consistency": "strong"}, False),
+	],
+)
+async def test_get_read_db_routes_by_request(
+	monkeypatch: pytest.MonkeyPatch, method: str, headers: dict[str, str] | None, uses_replica: bool
+) -> None:
+	"""Should only hand out replica sessions to safe requests without strong consistency."""
+	router = MagicMock()
+	router.pick = AsyncMock(return_value=MagicMock())
+	monkeypatch.setattr(dependencies, "replica_router", router)
+
+	read_db = await anext(get_read_db(make_request(method, headers)))
+
+	assert (read_db is not None) is uses_replica
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+	("headers", "from_replica", "serve", "fill"),
+	[
+		(None, False, True, True),
+		(None, True, True, False),
+		({"X-Consistency": "strong"}, False, False, True),
+	],
+)
+async def test_unit_of_work_caches_only_primary_reads(
+	monkeypatch: pytest.MonkeyPatch, headers: dict[str, str] | None, from_replica: bool, serve: bool, fill: bool
+) -> None:
+	"""Should not cache replica reads, and read around the cache for strong consistency."""
+	monkeypatch.setattr(settings, "user_cache_enabled", True)
+	session = AsyncMock(spec=AsyncSession)
+	read_session = AsyncMock(spec=AsyncSession) if from_replica else None
+
+	unit_of_work = await get_unit_of_work(make_request("GET", headers), session, read_session)
+
+	assert isinstance(unit_of_work.users, CachedUserRepository)
+	assert (unit_of_work.users.serve, unit_of_work.users.fill) == (serve, fill)
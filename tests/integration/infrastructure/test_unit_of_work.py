@@ -0,0 +1,108 @@
+"""Tests for SqlAlchemyUnitOfWork against a local SQLite database."""
+
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.domain.entities.user import User
+from app.domain.value_objects.email import Email
+from app.infrastructure.database import Base
+from app.infrastructure.models.user import UserModel  # noqa: F401 - registers the users table
+from app.infrastructure.repositories.cached_user_repository import UserCache
+from app.infrastructure.unit_of_work import SqlAlchemyUnitOfWork
+
+
+@pytest.fixture
+async def sessionmaker(tmp_path: Path) -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+	"""Session factory for an empty database."""
+	engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
+	async with engine.begin() as conn:
+		await conn.run_sync(Base.metadata.create_all)
+	yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+	await engine.dispose()
+
+
+async def count_users(sessionmaker: async_sessionmaker[AsyncSession]) -> int:
+	"""Count users visible to a fresh session."""
+	async with sessionmaker() as session:
+		return await SqlAlchemyUnitOfWork(session).users.count()
+
+
+@pytest.mark.asyncio
+async def test_commit_persists_all_staged_writes(sessionmaker: async_sessionmaker[AsyncSession]) -> None:
+	"""Should persist several writes with one commit."""
+	async with sessionmaker() as session, SqlAlchemyUnitOfWork(session) as unit_of_work:
+		first = await unit_of_work.users.save(User(name="John", email=Email("john@example.com")))
+		await unit_of_work.users.save(User(name="Jane", email=Email("jane@example.com")))
+
+		assert first.id is not None
+		assert first.created_at is not None
+		assert await count_users(sessionmaker) == 0
+
+		await unit_of_work.commit()
+
+	assert await count_users(sessionmaker) == 2
+
+
+@pytest.mark.asyncio
+async def test_uncommitted_writes_are_discarded(sessionmaker: async_sessionmaker[AsyncSession]) -> None:
+	"""Should not persist writes that were never committed."""
+	async with sessionmaker() as session, SqlAlchemyUnitOfWork(session) as unit_of_work:
+		await unit_of_work.users.save(User(name="John", email=Email("john@example.com")))
+
+	assert await count_users(sessionmaker) == 0
+
+
+@pytest.mark.asyncio
+async def test_error_rolls_back_staged_writes(sessionmaker: async_sessionmaker[AsyncSession]) -> None:
+	"""Should roll back every staged write when the block raises."""
+
+	async def stage_and_fail(unit_of_work: SqlAlchemyUnitOfWork) -> None:
+		async with unit_of_work:
+			await unit_of_work.users.save(User(name="John", email=Email("john@example.com")))
+			raise ValueError("boom")
+
+	async with sessionmaker() as session:
+		unit_of_work = SqlAlchemyUnitOfWork(session)
+		with pytest.raises(ValueError, match="boom"):
+			await stage_and_fail(unit_of_work)
+
+		await unit_of_work.commit()
+
+	assert await count_users(sessionmaker) == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("committed", [True, False])
+async def test_cache_is_invalidated_only_after_commit(
+	sessionmaker: async_sessionmaker[AsyncSession], committed: bool
+) -> None:
+	"""Should serve committed rows to reads landing between a write and its commit, and cache no uncommitted row."""
+	cache = UserCache(max_size=100, ttl=60, negative_ttl=5)
+	async with sessionmaker() as session, SqlAlchemyUnitOfWork(session, user_cache=cache) as unit_of_work:
+		user = await unit_of_work.users.save(User(name="John", email=Email("john@example.com")))
+		await unit_of_work.commit()
+
+	async with sessionmaker() as session, SqlAlchemyUnitOfWork(session, user_cache=cache) as unit_of_work:
+		await unit_of_work.users.update_fields(user.id, name="Johnny")  # type: ignore
+		own = await unit_of_work.users.get_by_id(user.id)  # type: ignore
+
+		async with sessionmaker() as other_session:
+			other = await SqlAlchemyUnitOfWork(other_session, user_cache=cache).users.get_by_id(user.id)  # type: ignore
+
+		if committed:
+			await unit_of_work.commit()
+		else:
+			await unit_of_work.rollback()
+
+	async with sessionmaker() as session:
+		after = await SqlAlchemyUnitOfWork(session, user_cache=cache).users.get_by_id(user.id)  # type: ignore
+
+	assert own is not None
+	assert own.name == "Johnny"
+	assert other is not None
+	assert other.name == "John"
+	assert after is not None
+	assert after.name == ("Johnny" if committed else "John")
@@ -0,0 +1,43 @@
+"""Tests for the query budget fixture."""
+
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from tests.conftest import QueryBudget
+
+
+@pytest.fixture
+async def connection(query_budget: QueryBudget) -> AsyncIterator[AsyncConnection]:
+	"""Connection to an in-memory database watched by the budget."""
+	engine = create_async_engine("sqlite+aiosqlite://")
+	query_budget.watch(engine)
+	async with engine.connect() as conn:
+		yield conn
+	await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_passes_within_budget(query_budget: QueryBudget, connection: AsyncConnection) -> None:
+	"""Should record the statements of a block that stays within budget."""
+	with query_budget(max_queries=2) as ran:
+		await connection.execute(text("SELECT 1"))
+		await connection.execute(text("SELECT 2"))
+
+	assert ran == ["SELECT 1", "SELECT 2"]
+
+
+@pytest.mark.asyncio
+async def test_fails_with_diff_when_over_budget(query_budget: QueryBudget, connection: AsyncConnection) -> None:
+	"""Should fail listing the statements beyond the budget and repeated ones."""
+	# The budget is checked when its block exits, inside pytest.raises
+	with pytest.raises(pytest.fail.Exception) as failure, query_budget(max_queries=1):  # noqa: PT012
+		for user_id in range(3):
+			await connection.execute(text("SELECT :id"), {"id": user_id})
+
+	message = str(failure.value)
+	assert "Expected at most 1 queries, 3 ran:" in message
+	assert "+SELECT ?" in message
+	assert "3x SELECT ?" in message
@@ -0,0 +1,146 @@
+"""Unit tests for BulkCreateUsers use case."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.application.dtos.user_dto import BulkCreateStatus, CreateUserDTO
+from app.application.use_cases.bulk_create_users import BulkCreateUsersUseCase
+from app.domain.entities.user import User
+
+
+async def assign_ids(users: list[User]) -> list[User]:
+	"""Pretend to persist users by assigning IDs."""
+	for user_id, user in enumerate(users, start=1):
+		user.id = user_id
+	return users
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_users_success() -> None:
+	"""Should create every valid row with a single repository call."""
+	# Arrange
+	mock_unit_of_work = AsyncMock()
+	mock_repository = mock_unit_of_work.users
+	mock_repository.save_many.side_effect = assign_ids
+	use_case = BulkCreateUsersUseCase(mock_unit_of_work)
+	dtos = [CreateUserDTO(name=f"User {i}", email=f"user{i}@example.com") for i in range(3)]
+
+	# Act
+	results = await use_case.execute(dtos)
+
+	# Assert
+	assert [result.status for result in results] == [BulkCreateStatus.CREATED] * 3
+	assert [result.user.id for result in results] == [1, 2, 3]  # type: ignore
+	mock_repository.save_many.assert_called_once()
+	mock_repository.exists_by_email.assert_not_called()
+	mock_repository.save.assert_not_called()
+	mock_unit_of_work.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_users_reports_invalid_rows() -> None:
+	"""Should report rows failing validation without writing them."""
+	# Arrange
+	mock_unit_of_work = AsyncMock()
+	mock_repository = mock_unit_of_work.users
+	mock_repository.save_many.side_effect = assign_ids
+	use_case = BulkCreateUsersUseCase(mock_unit_of_work)
+	dtos = [
+		CreateUserDTO(name="John Doe", email="invalid-email"),
+		CreateUserDTO(name="", email="jane@example.com"),
+		CreateUserDTO(name="Max", email="max@example.com"),
+	]
+
+	# Act
+	results = await use_case.execute(dtos)
+
+	# Assert
+	assert [result.status for result in results] == [
+		BulkCreateStatus.INVALID,
+		BulkCreateStatus.INVALID,
+		BulkCreateStatus.CREATED,
+	]
+	assert "Invalid email format" in results[0].error  # type: ignore
+	assert results[1].error == "Name cannot be empty"
+	saved = mock_repository.save_many.call_args.args[0]
+	assert [user.email.value for user in saved] == ["max@example.com"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_users_reports_overlong_rows_as_invalid() -> None:
+	"""Should report names and emails too long to store per row instead of failing the batch insert."""
+	# Arrange
+	mock_unit_of_work = AsyncMock()
+	mock_repository = mock_unit_of_work.users
+	mock_repository.save_many.side_effect = assign_ids
+	use_case = BulkCreateUsersUseCase(mock_unit_of_work)
+	dtos = [
+		CreateUserDTO(name="J" * 256, email="john@example.com"),
+		CreateUserDTO(name="Jane", email=f"{'j' * 244}@example.com"),
+		CreateUserDTO(name="M" * 255, email="max@example.com"),
+	]
+
+	# Act
+	results = await use_case.execute(dtos)
+
+	# Assert
+	assert [result.status for result in results] == [
+		BulkCreateStatus.INVALID,
+		BulkCreateStatus.INVALID,
+		BulkCreateStatus.CREATED,
+	]
+	assert "longer than 255" in results[0].error  # type: ignore
+	assert "longer than 255" in results[1].error  # type: ignore
+	saved = mock_repository.save_many.call_args.args[0]
+	assert [user.email.value for user in saved] == ["max@example.com"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_users_reports_duplicates() -> None:
+	"""Should report duplicates within the batch and against existing users."""
+	# Arrange
+	mock_unit_of_work = AsyncMock()
+	mock_repository = mock_unit_of_work.users
+
+	async def save_all_but_existing(users: list[User]) -> list[User]:
+		created = [user for user in users if user.email.value != "existing@example.com"]
+		return await assign_ids(created)
+
+	mock_repository.save_many.side_effect = save_all_but_existing
+	use_case = BulkCreateUsersUseCase(mock_unit_of_work)
+	dtos = [
+		CreateUserDTO(name="John", email="john@example.com"),
+		CreateUserDTO(name="John Again", email="john@example.com"),
+		CreateUserDTO(name="Existing", email="existing@example.com"),
+	]
+
+	# Act
+	results = await use_case.execute(dtos)
+
+	# Assert
+	assert [result.status for result in results] == [
+		BulkCreateStatus.CREATED,
+		BulkCreateStatus.DUPLICATE,
+		BulkCreateStatus.DUPLICATE,
+	]
+	assert results[1].error == "Duplicate of row 0"
+	assert results[2].error == "User with email existing@example.com already exists"
+	assert len(mock_repository.save_many.call_args.args[0]) == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_users_with_no_valid_rows_skips_repository() -> None:
+	"""Should not touch the repository when nothing is left to write."""
+	# Arrange
+	mock_unit_of_work = AsyncMock()
+	mock_repository = mock_unit_of_work.users
+	use_case = BulkCreateUsersUseCase(mock_unit_of_work)
+
+	# Act
+	results = await use_case.execute([CreateUserDTO(name="John", email="invalid-email")])
+
+	# Assert
+	assert results[0].status == BulkCreateStatus.INVALID
+	mock_repository.save_many.assert_not_called()
+	mock_unit_of_work.commit.assert_not_called()
@@ -0,0 +1,59 @@
+"""Unit tests for DeactivateUsers use case."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.application.use_cases.deactivate_users import DeactivateUsersUseCase
+from app.domain.repositories.user_repository import UserFilter
+
+
+@pytest.mark.asyncio
+async def test_deactivate_users_by_id() -> None:
+	"""Should deactivate the given users in one repository call."""
+	# Arrange
+	mock_unit_of_work = AsyncMock()
+	mock_unit_of_work.users.deactivate_many.return_value = [1, 3]
+	use_case = DeactivateUsersUseCase(mock_unit_of_work)
+
+	# Act
+	result = await use_case.execute([1, 2, 3])
+
+	# Assert
+	assert result == [1, 3]
+	mock_unit_of_work.users.deactivate_many.assert_called_once_with([1, 2, 3])
+	mock_unit_of_work.users.deactivate_where.assert_not_called()
+	mock_unit_of_work.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_deactivate_users_by_filter() -> None:
+	"""Should deactivate the users matching a filter."""
+	# Arrange
+	mock_unit_of_work = AsyncMock()
+	mock_unit_of_work.users.deactivate_where.return_value = [2]
+	use_case = DeactivateUsersUseCase(mock_unit_of_work)
+	user_filter = UserFilter(created_before=datetime(2024, 1, 1, tzinfo=UTC))
+
+	# Act
+	result = await use_case.execute(user_filter)
+
+	# Assert
+	assert result == [2]
+	mock_unit_of_work.users.deactivate_where.assert_called_once_with(user_filter)
+	mock_unit_of_work.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_deactivate_users_with_empty_filter_raises_error() -> None:
+	"""Should refuse a filter that would select every user."""
+	# Arrange
+	mock_unit_of_work = AsyncMock()
+	use_case = DeactivateUsersUseCase(mock_unit_of_work)
+
+	# Act & Assert
+	with pytest.raises(ValueError, match="at least one condition"):
+		await use_case.execute(UserFilter())
+
+	mock_unit_of_work.users.deactivate_where.assert_not_called()
@@ -0,0 +1,60 @@
+"""Unit tests for DeleteUsers use case."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.application.use_cases.delete_users import DeleteUsersUseCase
+from app.domain.repositories.user_repository import UserFilter
+
+
+@pytest.mark.asyncio
+async def test_delete_users_by_id() -> None:
+	"""Should delete the given users in one repository call."""
+	# Arrange
+	mock_unit_of_work = AsyncMock()
+	mock_unit_of_work.users.delete_many.return_value = [1]
+	use_case = DeleteUsersUseCase(mock_unit_of_work)
+
+	# Act
+	result = await use_case.execute([1, 2])
+
+	# Assert
+	assert result == [1]
+	mock_unit_of_work.users.delete_many.assert_called_once_with([1, 2])
+	mock_unit_of_work.users.delete.assert_not_called()
+	mock_unit_of_work.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_delete_inactive_users_since_date() -> None:
+	"""Should delete users that have been inactive since a given date."""
+	# Arrange
+	mock_unit_of_work = AsyncMock()
+	mock_unit_of_work.users.delete_where.return_value = [4, 5]
+	use_case = DeleteUsersUseCase(mock_unit_of_work)
+	user_filter = UserFilter(is_active=False, changed_before=datetime(2024, 6, 1, tzinfo=UTC))
+
+	# Act
+	result = await use_case.execute(user_filter)
+
+	# Assert
+	assert result == [4, 5]
+	mock_unit_of_work.users.delete_where.assert_called_once_with(user_filter)
+	mock_unit_of_work.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_delete_users_with_empty_filter_raises_error() -> None:
+	"""Should refuse a filter that would select every user."""
+	# Arrange
+	mock_unit_of_work = AsyncMock()
+	use_case = DeleteUsersUseCase(mock_unit_of_work)
+
+	# Act & Assert
+	with pytest.raises(ValueError, match="at least one condition"):
+		await use_case.execute(UserFilter())
+
+	mock_unit_of_work.users.delete_where.assert_not_called()
+	mock_unit_of_work.commit.assert_not_called()
@@ -0,0 +1,27 @@
+"""Unit tests for ImportUsers use case."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.application.dtos.user_dto import CreateUserDTO
+from app.application.use_cases.import_users import IMPORT_USERS_JOB, ImportUsersUseCase
+
+
+@pytest.mark.asyncio
+async def test_import_users_queues_one_job() -> None:
+	"""Should enqueue the rows as one job and commit it."""
+	mock_unit_of_work = AsyncMock()
+	mock_unit_of_work.jobs.enqueue.return_value = 7
+
+	job_id = await ImportUsersUseCase(mock_unit_of_work).execute(
+		[CreateUserDTO(name="John", email="john@example.com"), CreateUserDTO(name="Jane", email="jane@example.com")]
+	)
+
+	assert job_id == 7
+	mock_unit_of_work.jobs.enqueue.assert_called_once_with(
+		IMPORT_USERS_JOB,
+		{"users": [{"name": "John", "email": "john@example.com"}, {"name": "Jane", "email": "jane@example.com"}]},
+	)
+	mock_unit_of_work.users.save_many.assert_not_called()
+	mock_unit_of_work.commit.assert_called_once()
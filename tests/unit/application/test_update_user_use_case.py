@@ -0,0 +1,99 @@
+"""Unit tests for UpdateUser use case."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.application.dtos.user_dto import UpdateUserDTO
+from app.application.use_cases.update_user import UpdateUserUseCase
+from app.domain.entities.user import User
+from app.domain.exceptions import EmailAlreadyExistsError, UserNotFoundError
+from app.domain.value_objects.email import Email
+
+
+@pytest.mark.asyncio
+async def test_update_user_writes_only_given_fields() -> None:
+	"""Should send only the changed fields in one repository call."""
+	# Arrange
+	mock_unit_of_work = AsyncMock()
+	mock_repository = mock_unit_of_work.users
+	mock_repository.update_fields.return_value = User(id=1, name="Jane Doe", email=Email("john@example.com"))
+	use_case = UpdateUserUseCase(mock_unit_of_work)
+
+	# Act
+	result = await use_case.execute(1, UpdateUserDTO(name="Jane Doe"))
+
+	# Assert
+	assert result.name == "Jane Doe"
+	mock_repository.update_fields.assert_called_once_with(1, name="Jane Doe")
+	mock_repository.get_by_id.assert_not_called()
+	mock_repository.save.assert_not_called()
+	mock_unit_of_work.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_update_user_without_changes_returns_current_user() -> None:
+	"""Should not write anything when no field is set."""
+	# Arrange
+	mock_unit_of_work = AsyncMock()
+	mock_repository = mock_unit_of_work.users
+	mock_repository.get_by_id.return_value = User(id=1, name="John Doe", email=Email("john@example.com"))
+	use_case = UpdateUserUseCase(mock_unit_of_work)
+
+	# Act
+	result = await use_case.execute(1, UpdateUserDTO())
+
+	# Assert
+	assert result.id == 1
+	mock_repository.update_fields.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_missing_user_raises_error() -> None:
+	"""Should raise UserNotFoundError when nothing was updated."""
+	# Arrange
+	mock_unit_of_work = AsyncMock()
+	mock_unit_of_work.users.update_fields.return_value = None
+	use_case = UpdateUserUseCase(mock_unit_of_work)
+
+	# Act & Assert
+	with pytest.raises(UserNotFoundError, match="User with id 42 not found"):
+		await use_case.execute(42, UpdateUserDTO(is_active=False))
+
+	mock_unit_of_work.commit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_user_with_taken_email_raises_error() -> None:
+	"""Should propagate duplicate email errors from the repository."""
+	# Arrange
+	mock_unit_of_work = AsyncMock()
+	mock_unit_of_work.users.update_fields.side_effect = EmailAlreadyExistsError("jane@example.com")
+	use_case = UpdateUserUseCase(mock_unit_of_work)
+
+	# Act & Assert
+	with pytest.raises(EmailAlreadyExistsError, match=r"User with email jane@example\.com already exists"):
+		await use_case.execute(1, UpdateUserDTO(email="jane@example.com"))
+
+	mock_unit_of_work.commit.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+	("data", "message"),
+	[
+		(UpdateUserDTO(name="   "), "Name cannot be empty"),
+		(UpdateUserDTO(email="invalid-email"), "Invalid email format"),
+	],
+)
+async def test_update_user_with_invalid_data_raises_error(data: UpdateUserDTO, message: str) -> None:
+	"""Should validate changes before touching the repository."""
+	# Arrange
+	mock_unit_of_work = AsyncMock()
+	use_case = UpdateUserUseCase(mock_unit_of_work)
+
+	# Act & Assert
+	with pytest.raises(ValueError, match=message):
+		await use_case.execute(1, data)
+
+	mock_unit_of_work.users.update_fields.assert_not_called()
@@ -31,6 +31,12 @@ def test_create_email_without_at_symbol_raises_error() -> None:
 		Email("userexample.com")
 
 
+def test_create_email_longer_than_column_raises_error() -> None:
+	"""Should raise ValueError for addresses the users table cannot store."""
+	with pytest.raises(ValueError, match="longer than 255"):
+		Email(f"{'a' * 244}@example.com")
+
+
 def test_email_is_immutable() -> None:
 	"""Should be immutable (frozen dataclass)."""
 	email = Email("user@example.com")
@@ -45,3 +51,19 @@ def test_emails_with_same_value_are_equal() -> None:
 	email2 = Email("user@example.com")
 
 	assert email1 == email2
+
+
+def test_trusted_email_skips_validation() -> None:
+	"""Should build Email from stored data without checking the format."""
+	email = Email.trusted("stored@example.com")
+
+	assert email == Email("stored@example.com")
+	assert Email.trusted("not-checked").value == "not-checked"
+
+
+def test_trusted_email_is_immutable() -> None:
+	"""Should stay immutable when built through the trusted constructor."""
+	email = Email.trusted("user@example.com")
+
+	with pytest.raises((AttributeError, Exception), match=r"can't set attribute|has no setter|cannot assign to field"):
+		email.value = "changed@example.com"  # type: ignore
@@ -0,0 +1,46 @@
+"""Tests for PageCursor value object."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from app.domain.value_objects.page_cursor import PageCursor, SearchCursor
+
+
+def test_cursor_round_trips_through_token() -> None:
+	"""Should decode to the same cursor it was encoded from."""
+	cursor = PageCursor(created_at=datetime(2024, 1, 1, 12, 0, 0, 123456, tzinfo=UTC), id=42)
+
+	assert PageCursor.decode(cursor.encode()) == cursor
+
+
+def test_cursor_token_is_url_safe() -> None:
+	"""Should produce a token that needs no URL escaping."""
+	token = PageCursor(created_at=datetime(2024, 1, 1, tzinfo=UTC), id=1).encode()
+
+	assert "=" not in token
+	assert "+" not in token
+	assert "/" not in token
+
+
+@pytest.mark.parametrize("token", ["", "not-a-cursor", "WzEsMl0", "WyJ4IiwxXQ"])
+def test_decode_malformed_token_raises_error(token: str) -> None:
+	"""Should raise ValueError for malformed tokens."""
+	with pytest.raises(ValueError, match="Invalid cursor"):
+		PageCursor.decode(token)
+
+
+def test_search_cursor_round_trips_score_exactly() -> None:
+	"""Should decode to the same score, so keyset comparisons stay exact."""
+	cursor = SearchCursor(score=0.3333333432674408, id=7)
+
+	assert SearchCursor.decode(cursor.encode()) == cursor
+
+
+@pytest.mark.parametrize(
+	"token", ["", "not-a-cursor", "WyJ4IiwxXQ", PageCursor(created_at=datetime(2024, 1, 1, tzinfo=UTC), id=1).encode()]
+)
+def test_search_cursor_decode_malformed_token_raises_error(token: str) -> None:
+	"""Should raise ValueError for malformed tokens, including page cursors."""
+	with pytest.raises(ValueError, match="Invalid cursor"):
+		SearchCursor.decode(token)
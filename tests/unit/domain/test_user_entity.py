@@ -110,6 +110,12 @@ def test_user_update_name_with_whitespace_only_raises_error() -> None:
 		user.update_name("   ")
 
 
+def test_create_user_with_name_longer_than_column_raises_error() -> None:
+	"""Should raise ValueError for names the users table cannot store."""
+	with pytest.raises(ValueError, match="Name cannot be longer than 255 characters"):
+		User(name="J" * 256, email=Email("john@example.com"))
+
+
 def test_create_user_with_empty_name_raises_error() -> None:
 	"""Should raise ValueError when creating user with empty name."""
 	email = Email("john@example.com")
@@ -140,3 +146,25 @@ def test_user_str_representation_without_id() -> None:
 	user = User(name="John Doe", email=email)
 
 	assert str(user) == "User(id=None, name='John Doe', email='john@example.com')"
+
+
+def test_restore_user_from_persisted_data() -> None:
+	"""Should rebuild a persisted user equal to one built through validation."""
+	created_at = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
+
+	user = User.restore(1, "Jane Doe", Email("jane@example.com"), False, created_at, None)
+
+	assert user == User(
+		id=1,
+		name="Jane Doe",
+		email=Email("jane@example.com"),
+		is_active=False,
+		created_at=created_at,
+	)
+
+
+def test_user_has_no_instance_dict() -> None:
+	"""Should use slots instead of a per-instance dict."""
+	user = User(name="John Doe", email=Email("john@example.com"))
+
+	assert not hasattr(user, "__dict__")
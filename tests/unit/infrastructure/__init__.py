@@ -0,0 +1 @@
+"""Infrastructure layer unit tests."""
@@ -0,0 +1,327 @@
+"""Unit tests for CachedUserRepository."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from prometheus_client import CollectorRegistry
+
+from app.domain.entities.user import User
+from app.domain.value_objects.email import Email
+from app.infrastructure.repositories.cached_user_repository import (
+	CachedUserRepository,
+	UserCache,
+	register_user_cache_metrics,
+)
+
+
+@pytest.fixture
+def inner() -> AsyncMock:
+	"""Wrapped repository."""
+	mock_repository = AsyncMock()
+	mock_repository.get_by_id.return_value = User(id=1, name="John Doe", email=Email("john@example.com"))
+	mock_repository.get_by_email.return_value = User(id=1, name="John Doe", email=Email("john@example.com"))
+	return mock_repository
+
+
+@pytest.fixture
+def cache() -> UserCache:
+	"""Empty user cache."""
+	return UserCache(max_size=100, ttl=60, negative_ttl=5)
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_reads_through_once(inner: AsyncMock, cache: UserCache) -> None:
+	"""Should query the wrapped repository only on the first lookup."""
+	repository = CachedUserRepository(inner, cache)
+
+	first = await repository.get_by_id(1)
+	second = await repository.get_by_id(1)
+
+	assert first == second
+	inner.get_by_id.assert_called_once_with(1)
+	assert (cache.stats().hits, cache.stats().misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_get_by_email_is_served_from_id_lookup(inner: AsyncMock, cache: UserCache) -> None:
+	"""Should answer email lookups for users cached by ID."""
+	repository = CachedUserRepository(inner, cache)
+	await repository.get_by_id(1)
+
+	user = await repository.get_by_email("john@example.com")
+
+	assert user is not None
+	assert user.id == 1
+	inner.get_by_email.assert_not_called()
+	assert await repository.exists_by_email("john@example.com") is True
+	inner.exists_by_email.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_misses_are_cached(inner: AsyncMock, cache: UserCache) -> None:
+	"""Should cache lookups that found nothing."""
+	inner.get_by_email.return_value = None
+	repository = CachedUserRepository(inner, cache)
+
+	assert await repository.get_by_email("nobody@example.com") is None
+	assert await repository.get_by_email("nobody@example.com") is None
+	assert await repository.exists_by_email("nobody@example.com") is False
+
+	inner.get_by_email.assert_called_once()
+	inner.exists_by_email.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_drops_cached_miss(inner: AsyncMock, cache: UserCache) -> None:
+	"""Should forget a cached miss once a user with that email is created."""
+	inner.get_by_email.return_value = None
+	repository = CachedUserRepository(inner, cache)
+	await repository.get_by_email("new@example.com")
+
+	user = User(name="New", email=Email("new@example.com"))
+	inner.create.return_value = User(id=2, name="New", email=Email("new@example.com"))
+	await repository.create(user)
+	inner.get_by_email.return_value = inner.create.return_value
+
+	found = await repository.get_by_email("new@example.com")
+
+	assert found is not None
+	assert found.id == 2
+
+
+@pytest.mark.asyncio
+async def test_save_invalidates_old_and_new_email(inner: AsyncMock, cache: UserCache) -> None:
+	"""Should drop entries for the user under its previous and new email."""
+	repository = CachedUserRepository(inner, cache)
+	await repository.get_by_id(1)
+
+	changed = User(id=1, name="John Doe", email=Email("johnny@example.com"))
+	inner.save.return_value = changed
+	await repository.save(changed)
+	inner.get_by_email.return_value = None
+
+	assert await repository.get_by_email("john@example.com") is None
+	inner.get_by_email.assert_called_once_with("john@example.com")
+	inner.get_by_id.return_value = changed
+	assert await repository.get_by_id(1) == changed
+	assert inner.get_by_id.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_delete_invalidates_user(inner: AsyncMock, cache: UserCache) -> None:
+	"""Should re-query after a user is deleted."""
+	repository = CachedUserRepository(inner, cache)
+	await repository.get_by_id(1)
+
+	inner.delete.return_value = True
+	await repository.delete(1)
+	inner.get_by_id.return_value = None
+
+	assert await repository.get_by_id(1) is None
+	assert inner.get_by_id.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_entities_are_isolated_from_callers(inner: AsyncMock, cache: UserCache) -> None:
+	"""Should not let callers mutate the cached entity."""
+	repository = CachedUserRepository(inner, cache)
+	user = await repository.get_by_id(1)
+	user.deactivate()  # type: ignore
+
+	cached = await repository.get_by_id(1)
+
+	assert cached is not None
+	assert cached.is_active is True
+
+
+@pytest.mark.asyncio
+async def test_eviction_is_counted(inner: AsyncMock) -> None:
+	"""Should count entries evicted by the size bound."""
+	cache = UserCache(max_size=1, ttl=60, negative_ttl=5)
+	repository = CachedUserRepository(inner, cache)
+	inner.get_by_id.side_effect = lambda user_id: User(id=user_id, name="User", email=Email(f"user{user_id}@example.com"))
+
+	await repository.get_by_id(1)
+	await repository.get_by_id(2)
+
+	assert cache.stats().evictions == 2
+	assert cache.stats().size == 2
+
+
+@pytest.mark.asyncio
+async def test_update_fields_invalidates_user(inner: AsyncMock, cache: UserCache) -> None:
+	"""Should re-query a user after a partial update."""
+	repository = CachedUserRepository(inner, cache)
+	await repository.get_by_id(1)
+
+	inner.update_fields.return_value = User(id=1, name="Johnny", email=Email("john@example.com"))
+	await repository.update_fields(1, name="Johnny")
+	inner.get_by_id.return_value = inner.update_fields.return_value
+
+	user = await repository.get_by_id(1)
+
+	assert user is not None
+	assert user.name == "Johnny"
+	assert inner.get_by_id.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_writes_invalidate_affected_users(inner: AsyncMock, cache: UserCache) -> None:
+	"""Should drop cached entries for every user a set-based write touched, once committed."""
+	repository = CachedUserRepository(inner, cache)
+	await repository.get_by_id(1)
+
+	inner.deactivate_many.return_value = [1]
+	assert await repository.deactivate_many([1, 2]) == [1]
+	assert len(cache.by_id) == 1
+
+	repository.commit_invalidations()
+
+	assert len(cache.by_id) == 0
+	assert len(cache.by_email) == 0
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_writes_leave_cache_alone(inner: AsyncMock, cache: UserCache) -> None:
+	"""Should keep cached entries of users whose writes were rolled back, and cache reads again."""
+	repository = CachedUserRepository(inner, cache)
+	await repository.get_by_id(1)
+	inner.update_fields.return_value = User(id=1, name="Johnny", email=Email("john@example.com"))
+	await repository.update_fields(1, name="Johnny")
+
+	repository.discard_invalidations()
+	user = await repository.get_by_id(1)
+
+	assert user is not None
+	assert user.name == "John Doe"
+	inner.get_by_id.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_reads_after_a_write_are_not_cached(inner: AsyncMock, cache: UserCache) -> None:
+	"""Should read dirty users through and cache nothing until the write is committed."""
+	repository = CachedUserRepository(inner, cache)
+	await repository.get_by_id(1)
+	await repository.delete(1)
+	inner.get_by_id.return_value = None
+	inner.get_by_email.return_value = None
+
+	assert await repository.get_by_id(1) is None
+	assert await repository.get_by_email("john@example.com") is None
+	await repository.get_by_id(2)
+
+	assert cache.by_id.get(1, None) is not None
+	assert cache.by_id.get(2, "missing") == "missing"
+
+
+@pytest.mark.asyncio
+async def test_read_racing_a_commit_is_not_cached(inner: AsyncMock, cache: UserCache) -> None:
+	"""Should not cache a row read before a concurrent commit invalidated it."""
+	release = asyncio.Event()
+	stale = User(id=1, name="John Doe", email=Email("john@example.com"))
+
+	async def slow_get_by_id(_user_id: int) -> User:
+		await release.wait()
+		return stale
+
+	inner.get_by_id.side_effect = slow_get_by_id
+	lookup = asyncio.create_task(CachedUserRepository(inner, cache).get_by_id(1))
+	await asyncio.sleep(0)
+
+	writer = CachedUserRepository(inner, cache)
+	inner.update_fields.return_value = User(id=1, name="Johnny", email=Email("john@example.com"))
+	await writer.update_fields(1, name="Johnny")
+	writer.commit_invalidations()
+	release.set()
+
+	assert await lookup == stale
+	assert cache.by_id.get(1, "missing") == "missing"
+	assert cache.by_email.get("john@example.com", "missing") == "missing"
+
+
+def test_reads_older_than_forgotten_invalidations_are_not_cached() -> None:
+	"""Should refuse to cache a read once invalidations made during it were forgotten."""
+	cache = UserCache(max_size=1, ttl=60, negative_ttl=5)
+	generation = cache.generation
+	cache.invalidate_id(1)
+	cache.invalidate_id(2)
+
+	assert not cache.is_current(generation, 3)
+	assert cache.is_current(cache.generation, 1)
+
+
+@pytest.mark.asyncio
+async def test_replica_reads_are_served_but_not_cached(inner: AsyncMock, cache: UserCache) -> None:
+	"""Should answer from the cache without caching what a possibly lagging replica returns."""
+	await CachedUserRepository(inner, cache).get_by_id(1)
+	repository = CachedUserRepository(inner, cache, fill=False)
+
+	assert await repository.get_by_id(1) is not None
+	assert await repository.get_by_id(2) is not None
+	assert await repository.get_by_email("jane@example.com") is not None
+
+	inner.get_by_id.assert_has_calls([((1,),), ((2,),)])
+	assert cache.by_id.get(2, "missing") == "missing"
+	assert cache.by_email.get("jane@example.com", "missing") == "missing"
+
+
+@pytest.mark.asyncio
+async def test_consistent_reads_bypass_the_cache(inner: AsyncMock, cache: UserCache) -> None:
+	"""Should read cached users through when the caller must see every commit."""
+	await CachedUserRepository(inner, cache).get_by_id(1)
+	repository = CachedUserRepository(inner, cache, serve=False, fill=False)
+
+	assert await repository.get_by_id(1) is not None
+	assert await repository.get_by_email("john@example.com") is not None
+	assert await repository.get_many_by_ids([1]) is not None
+
+	assert inner.get_by_id.call_count == 2
+	inner.get_by_email.assert_awaited_once_with("john@example.com")
+	inner.get_many_by_ids.assert_awaited_once_with([1])
+
+
+@pytest.mark.asyncio
+async def test_get_last_modified_is_served_from_cached_user(inner: AsyncMock, cache: UserCache) -> None:
+	"""Should answer freshness checks for cached users without a query."""
+	repository = CachedUserRepository(inner, cache)
+	user = await repository.get_by_id(1)
+
+	assert user is not None
+	assert await repository.get_last_modified(1) == user.created_at
+	inner.get_last_modified.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_many_by_ids_queries_only_uncached(inner: AsyncMock, cache: UserCache) -> None:
+	"""Should serve cached users and misses, and query the rest in one batch."""
+	repository = CachedUserRepository(inner, cache)
+	await repository.get_by_id(1)
+	jane = User(id=2, name="Jane Doe", email=Email("jane@example.com"))
+	inner.get_many_by_ids.return_value = [jane]
+
+	users = await repository.get_many_by_ids([1, 2, 3])
+	again = await repository.get_many_by_ids([2, 3])
+
+	assert sorted(user.id for user in users) == [1, 2]  # type: ignore
+	assert [user.id for user in again] == [2]
+	inner.get_many_by_ids.assert_called_once_with([2, 3])
+
+
+@pytest.mark.asyncio
+async def test_cache_counters_are_exported(inner: AsyncMock) -> None:
+	"""Should export hits, misses, evictions and size as read at scrape time."""
+	registry = CollectorRegistry()
+	cache = UserCache(max_size=1, ttl=60, negative_ttl=5)
+	register_user_cache_metrics(cache, registry)
+	repository = CachedUserRepository(inner, cache)
+
+	await repository.get_by_id(1)
+	await repository.get_by_id(1)
+	inner.get_by_id.return_value = User(id=2, name="Jane Doe", email=Email("jane@example.com"))
+	await repository.get_by_id(2)
+
+	assert registry.get_sample_value("user_cache_hits_total") == 1
+	assert registry.get_sample_value("user_cache_misses_total") == 2
+	assert registry.get_sample_value("user_cache_evictions_total") == 2
+	assert registry.get_sample_value("user_cache_entries") == 2
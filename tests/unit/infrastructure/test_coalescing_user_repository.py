@@ -0,0 +1,173 @@
+"""Unit tests for CoalescingUserRepository."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.domain.entities.user import User
+from app.domain.value_objects.email import Email
+from app.infrastructure.repositories.cached_user_repository import CachedUserRepository, UserCache
+from app.infrastructure.repositories.coalescing_user_repository import CoalescingUserRepository, ReadCoalescer
+
+
+class SlowDatabase:
+	"""Hands out mock request repositories whose lookups block until released, recording which ones queried."""
+
+	def __init__(self) -> None:
+		self.release = asyncio.Event()
+		self.queried: list[AsyncMock] = []
+		self.fail = False
+
+	def repository(self) -> AsyncMock:
+		"""Repository of one request."""
+		repository = AsyncMock()
+
+		async def get_by_id(user_id: int) -> User | None:
+			self.queried.append(repository)
+			await self.release.wait()
+			if self.fail:
+				raise ConnectionError("database went away")
+			return User(id=user_id, name="John Doe", email=Email("john@example.com"))
+
+		repository.get_by_id.side_effect = get_by_id
+		return repository
+
+
+@pytest.fixture
+def database() -> SlowDatabase:
+	"""Database the requests read from."""
+	return SlowDatabase()
+
+
+@pytest.fixture
+def coalescer() -> ReadCoalescer:
+	"""Coalescer with no reads in flight."""
+	return ReadCoalescer()
+
+
+async def settle() -> None:
+	"""Let started tasks run up to their first blocking await."""
+	for _ in range(5):
+		await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_query(coalescer: ReadCoalescer, database: SlowDatabase) -> None:
+	"""Should run one query on the first caller's repository and give each caller its own entity."""
+	repositories = [database.repository() for _ in range(10)]
+	lookups = [asyncio.create_task(CoalescingUserRepository(r, coalescer).get_by_id(1)) for r in repositories]
+	await settle()
+	database.release.set()
+	users = await asyncio.gather(*lookups)
+
+	assert database.queried == [repositories[0]]
+	assert (coalescer.queries, coalescer.coalesced) == (1, 9)
+	assert {user.id for user in users if user is not None} == {1}
+	assert len({id(user) for user in users}) == 10
+
+
+@pytest.mark.asyncio
+async def test_different_keys_and_later_lookups_query_again(coalescer: ReadCoalescer, database: SlowDatabase) -> None:
+	"""Should share only lookups in flight at the same time for the same key."""
+	database.release.set()
+	repository = CoalescingUserRepository(database.repository(), coalescer)
+
+	await asyncio.gather(repository.get_by_id(1), repository.get_by_id(2))
+	await repository.get_by_id(1)
+
+	assert len(database.queried) == 3
+
+
+@pytest.mark.asyncio
+async def test_cancelled_joined_caller_does_not_cancel_shared_query(
+	coalescer: ReadCoalescer, database: SlowDatabase
+) -> None:
+	"""Should keep the query running for the caller that started it when one that joined disconnects."""
+	first = asyncio.create_task(CoalescingUserRepository(database.repository(), coalescer).get_by_id(1))
+	await settle()
+	second = asyncio.create_task(CoalescingUserRepository(database.repository(), coalescer).get_by_id(1))
+	await settle()
+
+	second.cancel()
+	await settle()
+	database.release.set()
+
+	assert await first is not None
+	assert second.cancelled()
+	assert len(database.queried) == 1
+
+
+@pytest.mark.asyncio
+async def test_joined_callers_read_again_when_the_first_leaves(
+	coalescer: ReadCoalescer, database: SlowDatabase
+) -> None:
+	"""Should stop using a disconnected caller's session, and let the others share a query on one of theirs."""
+	first = asyncio.create_task(CoalescingUserRepository(database.repository(), coalescer).get_by_id(1))
+	await settle()
+	repositories = [database.repository() for _ in range(2)]
+	others = [asyncio.create_task(CoalescingUserRepository(r, coalescer).get_by_id(1)) for r in repositories]
+	await settle()
+
+	first.cancel()
+	await settle()
+	database.release.set()
+	users = await asyncio.gather(*others)
+
+	assert first.cancelled()
+	assert all(user is not None for user in users)
+	assert database.queried[1:] == [repositories[0]]
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_caller_and_are_not_kept(coalescer: ReadCoalescer, database: SlowDatabase) -> None:
+	"""Should raise a failed query's error in every caller, and query again next time."""
+	database.fail = True
+	lookups = [
+		asyncio.create_task(CoalescingUserRepository(database.repository(), coalescer).get_by_id(1)) for _ in range(3)
+	]
+	await settle()
+	database.release.set()
+
+	results = await asyncio.gather(*lookups, return_exceptions=True)
+	assert all(isinstance(result, ConnectionError) for result in results)
+
+	database.fail = False
+	assert await CoalescingUserRepository(database.repository(), coalescer).get_by_id(1) is not None
+	assert len(database.queried) == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_miss_racing_a_commit_is_not_cached(coalescer: ReadCoalescer, database: SlowDatabase) -> None:
+	"""Should not cache a shared read that started before a commit, even for callers joining after it."""
+	cache = UserCache(max_size=100, ttl=60, negative_ttl=5)
+	first = asyncio.create_task(
+		CoalescingUserRepository(CachedUserRepository(database.repository(), cache), coalescer).get_by_id(1)
+	)
+	await settle()
+
+	writer = CachedUserRepository(AsyncMock(), cache)
+	await writer.delete(1)
+	writer.commit_invalidations()
+	second = asyncio.create_task(
+		CoalescingUserRepository(CachedUserRepository(database.repository(), cache), coalescer).get_by_id(1)
+	)
+	await settle()
+	database.release.set()
+	await asyncio.gather(first, second)
+
+	assert len(database.queried) == 1
+	assert cache.by_id.get(1, "missing") == "missing"
+
+
+@pytest.mark.asyncio
+async def test_other_methods_use_the_wrapped_repository(coalescer: ReadCoalescer) -> None:
+	"""Should pass writes and uncoalesced reads to the request's own repository."""
+	inner = AsyncMock()
+	repository = CoalescingUserRepository(inner, coalescer)
+
+	await repository.update_fields(1, name="Jane Doe")
+	await repository.exists_by_email("john@example.com")
+
+	inner.update_fields.assert_awaited_once_with(1, name="Jane Doe")
+	inner.exists_by_email.assert_awaited_once_with("john@example.com")
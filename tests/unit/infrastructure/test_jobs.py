@@ -0,0 +1,158 @@
+"""Unit tests for the background job worker."""
+
+import asyncio
+from typing import Any
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.infrastructure.jobs import JOBS_PROCESSED, Job, JobStore, JobWorker, retry_delay
+
+POSTGRESQL = postgresql.dialect()  # type: ignore[no-untyped-call]
+
+
+class FakeStore:
+	"""In-memory job store recording how jobs were settled."""
+
+	def __init__(self, jobs: list[Job] | None = None) -> None:
+		self.queued = list(jobs or [])
+		self.completed: list[int] = []
+		self.retried: list[tuple[int, float]] = []
+		self.failed: list[tuple[int, str]] = []
+
+	async def claim(self, limit: int, _visibility_timeout: float) -> list[Job]:
+		claimed, self.queued = self.queued[:limit], self.queued[limit:]
+		return claimed
+
+	async def complete(self, job: Job) -> None:
+		self.completed.append(job.id)
+
+	async def retry(self, job: Job, delay: float, _error: str) -> None:
+		self.retried.append((job.id, delay))
+
+	async def fail(self, job: Job, error: str) -> None:
+		self.failed.append((job.id, error))
+
+
+def make_job(job_id: int = 1, kind: str = "test", attempts: int = 1, max_attempts: int = 3) -> Job:
+	"""Build a claimed job."""
+	return Job(id=job_id, kind=kind, payload={"n": job_id}, attempts=attempts, max_attempts=max_attempts)
+
+
+def make_worker(store: FakeStore, handlers: dict[str, Any], **options: Any) -> JobWorker:
+	"""Worker over a fake store, polling quickly."""
+	options.setdefault("poll_interval", 0.01)
+	return JobWorker(store, handlers, retry_base_delay=5, retry_max_delay=60, **options)  # type: ignore[arg-type]
+
+
+async def succeed(_payload: dict[str, Any]) -> None:
+	"""Handler that does nothing."""
+
+
+async def explode(_payload: dict[str, Any]) -> None:
+	"""Handler that always fails."""
+	raise RuntimeError("boom")
+
+
+@pytest.mark.parametrize(("attempts", "delay"), [(1, 5), (2, 10), (3, 20), (10, 60)])
+def test_retry_delay_doubles_up_to_maximum(attempts: int, delay: float) -> None:
+	"""Should back off exponentially, capped at the maximum."""
+	assert retry_delay(attempts, base=5, maximum=60) == delay
+
+
+@pytest.mark.asyncio
+async def test_successful_job_is_completed() -> None:
+	"""Should run the job's handler with its payload and delete the job."""
+	payloads: list[dict[str, Any]] = []
+
+	async def record(payload: dict[str, Any]) -> None:
+		payloads.append(payload)
+
+	store = FakeStore()
+	succeeded = JOBS_PROCESSED.labels("test", "succeeded")
+	before = succeeded._value.get()
+
+	await make_worker(store, {"test": record}).process(make_job())
+
+	assert payloads == [{"n": 1}]
+	assert store.completed == [1]
+	assert succeeded._value.get() == before + 1
+
+
+@pytest.mark.asyncio
+async def test_failed_job_is_retried_with_backoff_until_attempts_run_out() -> None:
+	"""Should queue a failed job again, and give it up after its last attempt."""
+	store = FakeStore()
+	worker = make_worker(store, {"test": explode})
+
+	await worker.process(make_job(1, attempts=2))
+	await worker.process(make_job(2, attempts=3))
+
+	assert store.retried == [(1, 10)]
+	assert store.failed == [(2, "RuntimeError: boom")]
+	assert store.completed == []
+
+
+@pytest.mark.asyncio
+async def test_jobs_that_cannot_run_fail_without_retries() -> None:
+	"""Should give up jobs of unknown kinds and jobs claimed again after their last attempt."""
+	store = FakeStore()
+	ran: list[int] = []
+
+	async def record(payload: dict[str, Any]) -> None:
+		ran.append(payload["n"])
+
+	worker = make_worker(store, {"test": record})
+
+	await worker.process(make_job(1, kind="unknown"))
+	await worker.process(make_job(2, attempts=4, max_attempts=3))
+
+	assert [job_id for job_id, _error in store.failed] == [1, 2]
+	assert ran == []
+
+
+@pytest.mark.asyncio
+async def test_run_outlasting_visibility_timeout_is_retried() -> None:
+	"""Should cancel a handler running past the visibility timeout and retry the job."""
+
+	async def hang(_payload: dict[str, Any]) -> None:
+		await asyncio.sleep(10)
+
+	store = FakeStore()
+
+	await make_worker(store, {"test": hang}, visibility_timeout=0.01).process(make_job())
+
+	assert store.retried == [(1, 5)]
+
+
+@pytest.mark.asyncio
+async def test_worker_respects_concurrency_and_drains_on_stop() -> None:
+	"""Should run at most ``concurrency`` jobs at once and finish running jobs before returning."""
+	store = FakeStore([make_job(job_id) for job_id in range(1, 6)])
+	stop = asyncio.Event()
+	active = 0
+	peak = 0
+
+	async def track(payload: dict[str, Any]) -> None:
+		nonlocal active, peak
+		active += 1
+		peak = max(peak, active)
+		await asyncio.sleep(0.01)
+		active -= 1
+		if payload["n"] == 5:
+			stop.set()
+
+	await asyncio.wait_for(make_worker(store, {"test": track}, concurrency=2).run(stop), timeout=5)
+
+	assert peak == 2
+	assert sorted(store.completed) == [1, 2, 3, 4, 5]
+
+
+def test_claim_skips_jobs_locked_by_other_workers() -> None:
+	"""Should claim runnable jobs oldest first, skipping rows other workers hold."""
+	sql = str(JobStore.claim_statement(10, 300).compile(dialect=POSTGRESQL))
+
+	assert "FOR UPDATE SKIP LOCKED" in sql
+	assert "ORDER BY jobs.run_at" in sql
+	assert "UPDATE jobs SET status=" in sql
+	assert "attempts=(jobs.attempts +" in sql
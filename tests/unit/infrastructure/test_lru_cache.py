@@ -0,0 +1,60 @@
+"""Tests for LRUCache."""
+
+from app.infrastructure.cache import LRUCache
+
+
+class FakeClock:
+	"""Manually advanced clock."""
+
+	def __init__(self) -> None:
+		self.now = 0.0
+
+	def __call__(self) -> float:
+		return self.now
+
+
+def test_get_returns_default_for_missing_key() -> None:
+	"""Should return the default when the key is absent."""
+	cache: LRUCache[str, int] = LRUCache(max_size=2, ttl=10)
+
+	assert cache.get("a", None) is None
+
+
+def test_entries_expire_after_ttl() -> None:
+	"""Should drop entries once their TTL has passed."""
+	clock = FakeClock()
+	cache: LRUCache[str, int] = LRUCache(max_size=2, ttl=10, clock=clock)
+	cache.set("a", 1)
+	cache.set("b", 2, ttl=1)
+
+	clock.now = 5
+
+	assert cache.get("a", None) == 1
+	assert cache.get("b", None) is None
+	assert len(cache) == 1
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+	"""Should evict the least recently used entry when full."""
+	cache: LRUCache[str, int] = LRUCache(max_size=2, ttl=10)
+	cache.set("a", 1)
+	cache.set("b", 2)
+	cache.get("a", None)
+
+	cache.set("c", 3)
+
+	assert cache.get("a", None) == 1
+	assert cache.get("b", None) is None
+	assert cache.get("c", None) == 3
+	assert cache.evictions == 1
+
+
+def test_delete_removes_entry() -> None:
+	"""Should remove the entry and ignore unknown keys."""
+	cache: LRUCache[str, int] = LRUCache(max_size=2, ttl=10)
+	cache.set("a", 1)
+
+	cache.delete("a")
+	cache.delete("missing")
+
+	assert cache.get("a", None) is None
@@ -0,0 +1,64 @@
+"""Tests for per-scope SQL statement accounting."""
+
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.infrastructure.query_stats import instrument_queries, track_queries
+
+
+@pytest.mark.asyncio
+async def test_counts_statements_inside_scope_only() -> None:
+	"""Should count statements of the tracked scope and ignore the rest."""
+	engine = create_async_engine("sqlite+aiosqlite://")
+	instrument_queries([engine])
+	try:
+		async with engine.connect() as connection:
+			await connection.execute(text("SELECT 1"))
+			with track_queries() as stats:
+				await connection.execute(text("SELECT 1"))
+				await connection.execute(text("SELECT 2"))
+			await connection.execute(text("SELECT 3"))
+	finally:
+		await engine.dispose()
+
+	assert stats.count == 2
+	assert stats.seconds > 0
+
+
+@pytest.mark.asyncio
+async def test_nested_scopes_are_independent() -> None:
+	"""Should attribute statements to the innermost scope."""
+	engine = create_async_engine("sqlite+aiosqlite://")
+	instrument_queries([engine])
+	try:
+		async with engine.connect() as connection:
+			with track_queries() as outer:
+				await connection.execute(text("SELECT 1"))
+				with track_queries() as inner:
+					await connection.execute(text("SELECT 2"))
+	finally:
+		await engine.dispose()
+
+	assert outer.count == 1
+	assert inner.count == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_statements_leave_no_start_times_behind() -> None:
+	"""Should keep no state on the pooled connection for statements that raised."""
+	engine = create_async_engine("sqlite+aiosqlite://")
+	instrument_queries([engine])
+	try:
+		async with engine.connect() as connection:
+			with track_queries() as stats:
+				for _ in range(3):
+					with pytest.raises(exc.OperationalError):
+						await connection.execute(text("SELECT * FROM missing"))
+				await connection.execute(text("SELECT 1"))
+			info = dict(connection.sync_connection.info)  # type: ignore
+	finally:
+		await engine.dispose()
+
+	assert stats.count == 1
+	assert info == {}
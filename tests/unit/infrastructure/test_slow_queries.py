@@ -0,0 +1,120 @@
+"""Tests for the slow query log."""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.infrastructure.slow_queries import SlowQuery, SlowQueryLog, parameter_shapes, query_origin
+
+
+async def run(log: SlowQueryLog, *statements: str) -> None:
+	"""Execute statements on an in-memory engine instrumented by the log."""
+	engine = create_async_engine("sqlite+aiosqlite://")
+	log.attach("primary", engine)
+	try:
+		async with engine.connect() as connection:
+			for statement in statements:
+				await connection.execute(text(statement), {"limit": 3, "name": "Ada"})
+	finally:
+		await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_records_slow_statements_with_route_and_parameter_shapes() -> None:
+	"""Should record statement, parameter types and originating route."""
+	log = SlowQueryLog(threshold_seconds=0, explain_sample_rate=1.0)
+	token = query_origin.set("/api/v1/users")
+	try:
+		await run(log, "SELECT :name LIMIT :limit")
+	finally:
+		query_origin.reset(token)
+
+	[entry] = log.entries()
+	assert entry.statement == "SELECT ? LIMIT ?"
+	assert entry.parameters == ["str[3]", "int"]
+	assert entry.route == "/api/v1/users"
+	assert entry.engine == "primary"
+	assert entry.plan is None  # EXPLAIN is PostgreSQL only
+
+
+@pytest.mark.asyncio
+async def test_ignores_statements_below_threshold() -> None:
+	"""Should not record statements faster than the threshold."""
+	log = SlowQueryLog(threshold_seconds=60)
+
+	await run(log, "SELECT 1")
+
+	assert log.entries() == []
+
+
+@pytest.mark.asyncio
+async def test_failed_statements_leave_no_start_times_behind() -> None:
+	"""Should keep no state on the pooled connection for statements that raised."""
+	log = SlowQueryLog(threshold_seconds=0)
+	engine = create_async_engine("sqlite+aiosqlite://")
+	log.attach("primary", engine)
+	try:
+		async with engine.connect() as connection:
+			with pytest.raises(exc.OperationalError):
+				await connection.execute(text("SELECT * FROM missing"))
+			await connection.execute(text("SELECT 1"))
+			info = dict(connection.sync_connection.info)  # type: ignore
+	finally:
+		await engine.dispose()
+
+	assert [entry.statement for entry in log.entries()] == ["SELECT 1"]
+	assert info == {}
+
+
+@pytest.mark.asyncio
+async def test_keeps_most_recent_entries_first() -> None:
+	"""Should drop the oldest entries once full."""
+	log = SlowQueryLog(threshold_seconds=0, max_entries=2)
+
+	await run(log, "SELECT 1", "SELECT 2", "SELECT 3")
+
+	assert [entry.statement for entry in log.entries()] == ["SELECT 3", "SELECT 2"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+	("analyze", "explain"),
+	[
+		(False, "EXPLAIN (FORMAT JSON) SELECT $1"),
+		(True, "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) SELECT $1"),
+	],
+)
+async def test_explain_plans_reads_in_a_read_only_transaction_with_timeout(analyze: bool, explain: str) -> None:
+	"""Should only plan the statement unless ANALYZE is enabled, read-only and under the timeout."""
+	connection = AsyncMock()
+	connection.exec_driver_sql.return_value = MagicMock(**{"scalar_one.return_value": [{"Plan": {}}]})
+	engine = MagicMock()
+
+	@asynccontextmanager
+	async def connect() -> AsyncIterator[AsyncMock]:
+		yield connection
+
+	engine.connect = connect
+	log = SlowQueryLog(threshold_seconds=0, explain_analyze=analyze, explain_timeout_seconds=1.5)
+	entry = SlowQuery(statement="SELECT $1", parameters=["int"], duration_seconds=1, engine="primary", route=None)
+
+	await log._explain(engine, entry, "SELECT $1", (1,))
+
+	assert [call.args for call in connection.exec_driver_sql.await_args_list] == [
+		("SET TRANSACTION READ ONLY",),
+		("SET LOCAL statement_timeout = 1500",),
+		(explain, (1,)),
+	]
+	assert entry.plan == [{"Plan": {}}]
+	connection.rollback.assert_awaited_once()
+
+
+def test_parameter_shapes_hide_values() -> None:
+	"""Should describe named and positional parameters by type only."""
+	assert parameter_shapes({"ids": [1, 2], "email": "a@example.com"}) == {"ids": "list[2]", "email": "str[13]"}
+	assert parameter_shapes((1, None)) == ["int", "NoneType"]
+	assert parameter_shapes(None) == []
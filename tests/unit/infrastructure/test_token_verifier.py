@@ -0,0 +1,290 @@
+"""Tests for bearer token verification against a local stub provider."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+from app.infrastructure.auth import (
+	AuthProviderUnavailableError,
+	InvalidTokenError,
+	JWKSCache,
+	TokenVerifier,
+)
+
+ISSUER = "https://auth.example.com"
+AUDIENCE = "association-backend"
+
+
+class FakeClock:
+	"""Manually advanced clock, starting now."""
+
+	def __init__(self) -> None:
+		self.now = time.time()
+
+	def __call__(self) -> float:
+		return self.now
+
+
+class SigningKey:
+	"""RSA key pair signing test JWTs."""
+
+	def __init__(self, kid: str) -> None:
+		private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+		self.kid = kid
+		self.pem = private_key.private_bytes(
+			serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+		)
+		public_pem = private_key.public_key().public_bytes(
+			serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+		)
+		self.public_jwk = {**jwk.construct(public_pem, "RS256").to_dict(), "kid": kid, "use": "sig"}
+
+	def sign(self, kid: str | None = None, **claims: Any) -> str:
+		"""Sign a token valid for a minute unless claims say otherwise."""
+		payload = {"sub": "user-1", "iss": ISSUER, "aud": AUDIENCE, "exp": int(time.time()) + 60, **claims}
+		return jwt.encode(payload, self.pem.decode(), algorithm="RS256", headers={"kid": kid or self.kid})
+
+
+class StubProvider:
+	"""Serves the JWKS and introspection endpoints and counts calls to them."""
+
+	def __init__(self) -> None:
+		self.keys: list[dict[str, Any]] = []
+		self.tokens: dict[str, dict[str, Any]] = {}
+		self.down = False
+		# Answer with a JSON array instead of an object
+		self.malformed = False
+		self.jwks_calls = 0
+		self.introspections = 0
+
+	async def __call__(self, request: httpx.Request) -> httpx.Response:
+		if self.down:
+			raise httpx.ConnectError("connection refused", request=request)
+		# Yield, so concurrent callers pile up on the same request
+		await asyncio.sleep(0.01)
+		if request.url.path == "/jwks.json":
+			self.jwks_calls += 1
+			return httpx.Response(200, json=[] if self.malformed else {"keys": self.keys})
+		self.introspections += 1
+		if self.malformed:
+			return httpx.Response(200, json=[])
+		token = parse_qs(request.content.decode())["token"][0]
+		return httpx.Response(200, json=self.tokens.get(token, {"active": False}))
+
+
+@pytest.fixture
+def provider() -> StubProvider:
+	"""Stub provider holding one signing key."""
+	return StubProvider()
+
+
+@pytest.fixture
+def key(provider: StubProvider) -> SigningKey:
+	"""Signing key published by the provider."""
+	signing_key = SigningKey("key-1")
+	provider.keys.append(signing_key.public_jwk)
+	return signing_key
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+	"""Clock shared by the key cache and the verifier."""
+	return FakeClock()
+
+
+@pytest.fixture
+async def verifier(provider: StubProvider, clock: FakeClock) -> AsyncIterator[TokenVerifier]:
+	"""Verifier talking to the stub provider."""
+	async with httpx.AsyncClient(transport=httpx.MockTransport(provider), base_url=ISSUER) as client:
+		yield TokenVerifier(
+			client,
+			JWKSCache(client, f"{ISSUER}/jwks.json", ttl=3600, min_refresh_interval=30, clock=clock),
+			introspection_url=f"{ISSUER}/api/oidc/introspection",
+			client_id=AUDIENCE,
+			client_secret="secret",
+			issuer=ISSUER,
+			audience=AUDIENCE,
+			max_cache_seconds=300,
+			clock=clock,
+		)
+
+
+@pytest.mark.asyncio
+async def test_jwts_are_verified_locally_after_one_key_fetch(
+	verifier: TokenVerifier, provider: StubProvider, key: SigningKey
+) -> None:
+	"""Should fetch keys once and verify every JWT without calling the provider."""
+	for _ in range(3):
+		token = await verifier.verify(key.sign(scope="openid profile"))
+
+	assert token.subject == "user-1"
+	assert token.scopes == {"openid", "profile"}
+	assert provider.jwks_calls == 1
+	assert provider.introspections == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_cold_verifications_share_one_key_fetch(
+	verifier: TokenVerifier, provider: StubProvider, key: SigningKey
+) -> None:
+	"""Should fetch keys once for requests arriving before the first fetch finished."""
+	tokens = await asyncio.gather(*(verifier.verify(key.sign()) for _ in range(10)))
+
+	assert len(tokens) == 10
+	assert provider.jwks_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_rotated_keys_are_refetched_at_most_once_per_interval(
+	verifier: TokenVerifier, provider: StubProvider, key: SigningKey, clock: FakeClock
+) -> None:
+	"""Should refetch keys for an unknown key ID, but not more often than the minimum interval."""
+	await verifier.verify(key.sign())
+	rotated = SigningKey("key-2")
+	provider.keys = [rotated.public_jwk]
+
+	with pytest.raises(InvalidTokenError):
+		await verifier.verify(rotated.sign())
+	assert provider.jwks_calls == 1
+
+	clock.now += 30
+	assert (await verifier.verify(rotated.sign())).subject == "user-1"
+	with pytest.raises(InvalidTokenError):
+		await verifier.verify(rotated.sign(kid="forged"))
+	assert provider.jwks_calls == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+	"claims",
+	[
+		{"exp": int(time.time()) - 60},
+		{"aud": "someone-else"},
+		{"iss": "https://evil.example.com"},
+	],
+)
+async def test_jwts_with_wrong_claims_are_rejected(
+	verifier: TokenVerifier, key: SigningKey, claims: dict[str, Any]
+) -> None:
+	"""Should reject expired tokens and tokens issued by or for someone else."""
+	with pytest.raises(InvalidTokenError):
+		await verifier.verify(key.sign(**claims))
+
+
+@pytest.mark.asyncio
+async def test_jwts_with_forged_signature_are_rejected(verifier: TokenVerifier, key: SigningKey) -> None:
+	"""Should reject a token naming a known key but signed by another."""
+	with pytest.raises(InvalidTokenError):
+		await verifier.verify(SigningKey("other").sign(kid=key.kid))
+
+
+@pytest.mark.asyncio
+async def test_opaque_tokens_are_introspected_once_until_expiry(
+	verifier: TokenVerifier, provider: StubProvider, clock: FakeClock
+) -> None:
+	"""Should reuse an introspection result until the token expires."""
+	provider.tokens["opaque"] = {"active": True, "sub": "user-2", "scope": "openid", "exp": int(clock.now) + 60}
+
+	for _ in range(3):
+		token = await verifier.verify("opaque")
+	assert token.subject == "user-2"
+	assert provider.introspections == 1
+
+	clock.now += 61
+	await verifier.verify("opaque")
+	assert provider.introspections == 2
+
+
+@pytest.mark.asyncio
+async def test_opaque_token_cache_is_capped(verifier: TokenVerifier, provider: StubProvider, clock: FakeClock) -> None:
+	"""Should introspect long-lived tokens again after the maximum cache time, to see revocations."""
+	provider.tokens["opaque"] = {"active": True, "sub": "user-2", "exp": int(clock.now) + 86_400}
+	await verifier.verify("opaque")
+
+	provider.tokens["opaque"] = {"active": False}
+	clock.now += 300
+
+	with pytest.raises(InvalidTokenError):
+		await verifier.verify("opaque")
+	assert provider.introspections == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_introspection(
+	verifier: TokenVerifier, provider: StubProvider, clock: FakeClock
+) -> None:
+	"""Should introspect a token once for concurrent requests carrying it."""
+	provider.tokens["opaque"] = {"active": True, "sub": "user-2", "exp": int(clock.now) + 60}
+
+	tokens = await asyncio.gather(*(verifier.verify("opaque") for _ in range(10)))
+
+	assert {token.subject for token in tokens} == {"user-2"}
+	assert provider.introspections == 1
+
+
+@pytest.mark.asyncio
+async def test_inactive_opaque_tokens_are_rejected(verifier: TokenVerifier, provider: StubProvider) -> None:
+	"""Should reject tokens the provider reports as inactive, and remember that briefly."""
+	for _ in range(2):
+		with pytest.raises(InvalidTokenError):
+			await verifier.verify("revoked")
+
+	assert provider.introspections == 1
+
+
+@pytest.mark.asyncio
+async def test_unreachable_provider(verifier: TokenVerifier, provider: StubProvider, key: SigningKey) -> None:
+	"""Should report the provider as unavailable rather than the token as invalid."""
+	provider.down = True
+
+	with pytest.raises(AuthProviderUnavailableError):
+		await verifier.verify(key.sign())
+	with pytest.raises(AuthProviderUnavailableError):
+		await verifier.verify("opaque")
+
+
+@pytest.mark.asyncio
+async def test_failed_first_key_fetch_is_retried_once_per_interval(
+	verifier: TokenVerifier, provider: StubProvider, key: SigningKey, clock: FakeClock
+) -> None:
+	"""Should fail fast instead of refetching keys on every request while none could be fetched."""
+	provider.malformed = True
+	for _ in range(3):
+		with pytest.raises(AuthProviderUnavailableError):
+			await verifier.verify(key.sign())
+	assert provider.jwks_calls == 1
+
+	provider.malformed = False
+	clock.now += 30
+
+	assert (await verifier.verify(key.sign())).subject == "user-1"
+	assert provider.jwks_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_malformed_introspection_response(verifier: TokenVerifier, provider: StubProvider) -> None:
+	"""Should report the provider as unavailable when introspection doesn't answer with a JSON object."""
+	provider.malformed = True
+
+	with pytest.raises(AuthProviderUnavailableError):
+		await verifier.verify("opaque")
+
+
+@pytest.mark.asyncio
+async def test_failed_key_refresh_keeps_previous_keys(
+	verifier: TokenVerifier, provider: StubProvider, key: SigningKey, clock: FakeClock
+) -> None:
+	"""Should keep verifying with the cached keys while the provider is down."""
+	await verifier.verify(key.sign())
+	provider.down = True
+	clock.now += 3600
+
+	assert (await verifier.verify(key.sign())).subject == "user-1"
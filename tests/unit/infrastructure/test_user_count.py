@@ -0,0 +1,69 @@
+"""Unit tests for UserRepositoryImpl counting strategies."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.domain.repositories.user_repository import CountMode
+from app.infrastructure.cache import LRUCache
+from app.infrastructure.repositories.user_repository_impl import ESTIMATE_QUERY, UserRepositoryImpl
+
+
+def make_session(*values: int) -> AsyncMock:
+	"""Session whose successive queries return the given scalars."""
+	session = AsyncMock()
+	session.execute.side_effect = [MagicMock(scalar_one=MagicMock(return_value=value)) for value in values]
+	return session
+
+
+class FakeClock:
+	"""Manually advanced clock."""
+
+	def __init__(self) -> None:
+		self.now = 0.0
+
+	def __call__(self) -> float:
+		return self.now
+
+
+@pytest.mark.asyncio
+async def test_estimated_count_reads_planner_statistics() -> None:
+	"""Should answer from pg_class without counting rows."""
+	session = make_session(12_345)
+
+	assert await UserRepositoryImpl(session).count(CountMode.ESTIMATED) == 12_345
+	session.execute.assert_called_once_with(ESTIMATE_QUERY)
+
+
+@pytest.mark.asyncio
+async def test_estimated_count_falls_back_to_exact_before_analyze() -> None:
+	"""Should count exactly while the table has no statistics yet."""
+	session = make_session(-1, 42)
+
+	assert await UserRepositoryImpl(session).count(CountMode.ESTIMATED) == 42
+	assert session.execute.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_count_is_shared_until_ttl_expires() -> None:
+	"""Should reuse an exact count across repositories until it expires."""
+	clock = FakeClock()
+	count_cache: LRUCache[str, int] = LRUCache(max_size=1, ttl=30, clock=clock)
+	session = make_session(10, 11)
+
+	assert await UserRepositoryImpl(session, count_cache=count_cache).count(CountMode.CACHED) == 10
+	assert await UserRepositoryImpl(session, count_cache=count_cache).count(CountMode.CACHED) == 10
+	clock.now = 31
+	assert await UserRepositoryImpl(session, count_cache=count_cache).count(CountMode.CACHED) == 11
+	assert session.execute.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_count_without_cache_counts_exactly() -> None:
+	"""Should count exactly when no count cache is configured."""
+	session = make_session(5, 5)
+	repository = UserRepositoryImpl(session)
+
+	assert await repository.count(CountMode.CACHED) == 5
+	assert await repository.count(CountMode.CACHED) == 5
+	assert session.execute.call_count == 2
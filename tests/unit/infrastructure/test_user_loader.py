@@ -0,0 +1,105 @@
+"""Unit tests for UserLoader."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.domain.entities.user import User
+from app.domain.value_objects.email import Email
+from app.infrastructure.loaders import UserLoader
+
+USERS = {
+	user_id: User(id=user_id, name=f"Member {user_id}", email=Email(f"member{user_id}@example.com"))
+	for user_id in (1, 2, 3)
+}
+
+
+@pytest.fixture
+def repository() -> AsyncMock:
+	"""Repository answering batch lookups from USERS."""
+	mock_repository = AsyncMock()
+	mock_repository.get_many_by_ids.side_effect = lambda ids: [USERS[i] for i in ids if i in USERS]
+	mock_repository.get_many_by_emails.side_effect = lambda emails: [
+		user for user in USERS.values() if user.email.value in emails
+	]
+	return mock_repository
+
+
+@pytest.mark.asyncio
+async def test_load_many_runs_one_query(repository: AsyncMock) -> None:
+	"""Should resolve a list of IDs with one query, in order, with None for unknown IDs."""
+	loader = UserLoader(repository)
+
+	users = await loader.load_many([3, 1, 99, 1])
+
+	assert [user.id if user else None for user in users] == [3, 1, None, 1]
+	repository.get_many_by_ids.assert_awaited_once_with([3, 1, 99])
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_are_batched(repository: AsyncMock) -> None:
+	"""Should batch lookups requested in the same iteration, by ID and email alike."""
+	loader = UserLoader(repository)
+
+	by_id, by_email, other = await asyncio.gather(
+		loader.load(1), loader.load_by_email("member2@example.com"), loader.load(3)
+	)
+
+	assert (by_id, by_email, other) == (USERS[1], USERS[2], USERS[3])
+	repository.get_many_by_ids.assert_awaited_once_with([1, 3])
+	repository.get_many_by_emails.assert_awaited_once_with(["member2@example.com"])
+	assert loader.batches == 1
+
+
+@pytest.mark.asyncio
+async def test_results_are_memoized(repository: AsyncMock) -> None:
+	"""Should answer repeated lookups, misses and the other key of found users without querying."""
+	loader = UserLoader(repository)
+	await loader.load_many([1, 99])
+
+	assert await loader.load(1) is USERS[1]
+	assert await loader.load(99) is None
+	assert await loader.load_by_email("member1@example.com") is USERS[1]
+
+	repository.get_many_by_ids.assert_awaited_once()
+	repository.get_many_by_emails.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_primed_users_need_no_query(repository: AsyncMock) -> None:
+	"""Should answer lookups of users primed from another query."""
+	loader = UserLoader(repository)
+	loader.prime(USERS[2])
+
+	assert await loader.load(2) is USERS[2]
+	repository.get_many_by_ids.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_failures_reach_every_lookup_and_are_not_memoized(repository: AsyncMock) -> None:
+	"""Should raise a failed batch's error in each lookup, and query again next time."""
+	repository.get_many_by_ids.side_effect = ConnectionError("database went away")
+	loader = UserLoader(repository)
+
+	results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+	assert all(isinstance(result, ConnectionError) for result in results)
+
+	repository.get_many_by_ids.side_effect = lambda ids: [USERS[i] for i in ids]
+	assert await loader.load(1) is USERS[1]
+	assert repository.get_many_by_ids.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_lookup_does_not_cancel_batch(repository: AsyncMock) -> None:
+	"""Should resolve the other lookups of a batch when one caller goes away."""
+	loader = UserLoader(repository)
+	cancelled = asyncio.create_task(loader.load(1))
+	kept = asyncio.create_task(loader.load(2))
+	await asyncio.sleep(0)
+
+	cancelled.cancel()
+
+	assert await kept is USERS[2]
+	assert await loader.load(1) is USERS[1]
+	repository.get_many_by_ids.assert_awaited_once_with([1, 2])
@@ -0,0 +1,41 @@
+"""Unit tests for the user search query."""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.domain.value_objects.page_cursor import SearchCursor
+from app.infrastructure.repositories.user_repository_impl import contains_pattern, search_query
+
+POSTGRESQL = postgresql.dialect()  # type: ignore[no-untyped-call]
+
+
+@pytest.mark.parametrize(
+	("value", "pattern"),
+	[
+		("doe", "%doe%"),
+		("100%", "%100\\%%"),
+		("bob_doe", "%bob\\_doe%"),
+		("a\\b", "%a\\\\b%"),
+	],
+)
+def test_contains_pattern_escapes_wildcards(value: str, pattern: str) -> None:
+	"""Should match the value literally anywhere in the column."""
+	assert contains_pattern(value) == pattern
+
+
+def test_search_query_matches_through_indexed_predicates() -> None:
+	"""Should only filter with predicates the trigram and full-text indexes serve."""
+	sql = str(search_query("doe").compile(dialect=POSTGRESQL))
+
+	assert "users.name ILIKE" in sql
+	assert "users.email ILIKE" in sql
+	assert "search_vector @@ plainto_tsquery('simple'" in sql
+	assert "ORDER BY greatest(similarity(users.name" in sql
+
+
+def test_search_query_seeks_past_cursor() -> None:
+	"""Should continue after the cursor's score and id."""
+	compiled = search_query("doe", SearchCursor(score=0.5, id=3)).compile(dialect=POSTGRESQL)
+
+	assert "users.id >" in str(compiled)
+	assert {0.5, 3} <= set(compiled.params.values())
@@ -0,0 +1,166 @@
+"""Tests for admission control and rate limiting middleware."""
+
+import asyncio
+from collections.abc import Callable
+
+import pytest
+from httpx import AsyncClient
+from starlette.types import Receive, Scope, Send
+
+from app.presentation.middleware.admission import (
+	ADMISSION_REJECTIONS,
+	AdmissionControlMiddleware,
+	ConcurrencyLimiter,
+	TokenBucketLimiter,
+)
+
+
+class FakeClock:
+	"""Manually advanced monotonic clock."""
+
+	def __init__(self) -> None:
+		self.now = 0.0
+
+	def __call__(self) -> float:
+		return self.now
+
+
+class BlockingApp:
+	"""ASGI app answering once released, counting requests it started handling."""
+
+	def __init__(self) -> None:
+		self.release = asyncio.Event()
+		self.started = 0
+
+	async def __call__(self, scope: Scope, _receive: Receive, send: Send) -> None:
+		self.started += 1
+		if scope["path"] == "/slow":
+			await self.release.wait()
+		await send({"type": "http.response.start", "status": 200, "headers": []})
+		await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def wait_until(condition: Callable[[], bool]) -> None:
+	"""Yield to other tasks until a condition holds."""
+	for _ in range(100):
+		if condition():
+			return
+		await asyncio.sleep(0.001)
+	pytest.fail("condition not reached")
+
+
+def client_for(app: AdmissionControlMiddleware) -> AsyncClient:
+	"""In-process client for a middleware-wrapped app."""
+	return AsyncClient(app=app, base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_requests_beyond_limit_and_queue_are_rejected() -> None:
+	"""Should queue one request over the limit and reject the next with 503 right away."""
+	inner = BlockingApp()
+	limiter = ConcurrencyLimiter(limit=1, max_queue=1, queue_timeout=5)
+	async with client_for(AdmissionControlMiddleware(inner, limiter)) as client:
+		first = asyncio.create_task(client.get("/slow"))
+		second = asyncio.create_task(client.get("/slow"))
+		await wait_until(lambda: inner.started == 1 and len(limiter._waiters) == 1)
+
+		rejected = await client.get("/slow")
+		assert rejected.status_code == 503
+		assert rejected.headers["Retry-After"] == "1"
+
+		inner.release.set()
+		responses = await asyncio.gather(first, second)
+
+	assert [response.status_code for response in responses] == [200, 200]
+	assert inner.started == 2
+	assert limiter.active == 0
+
+
+@pytest.mark.asyncio
+async def test_queued_requests_give_up_after_timeout() -> None:
+	"""Should reject a queued request that waited longer than the queue timeout."""
+	inner = BlockingApp()
+	limiter = ConcurrencyLimiter(limit=1, max_queue=10, queue_timeout=0.01)
+	rejections = ADMISSION_REJECTIONS.labels("queue_timeout")
+	before = rejections._value.get()
+	async with client_for(AdmissionControlMiddleware(inner, limiter)) as client:
+		first = asyncio.create_task(client.get("/slow"))
+		await wait_until(lambda: inner.started == 1)
+
+		timed_out = await client.get("/slow")
+
+		inner.release.set()
+		await first
+
+	assert timed_out.status_code == 503
+	assert rejections._value.get() == before + 1
+	assert limiter.active == 0
+	assert not limiter._waiters
+
+
+@pytest.mark.asyncio
+async def test_exempt_paths_bypass_limits() -> None:
+	"""Should answer probes even when no slot is free."""
+	inner = BlockingApp()
+	limiter = ConcurrencyLimiter(limit=1, max_queue=0, queue_timeout=5)
+	middleware = AdmissionControlMiddleware(inner, limiter, exempt_paths=["/health"])
+	async with client_for(middleware) as client:
+		blocked = asyncio.create_task(client.get("/slow"))
+		await wait_until(lambda: inner.started == 1)
+
+		assert (await client.get("/other")).status_code == 503
+		assert (await client.get("/health")).status_code == 200
+
+		inner.release.set()
+		await blocked
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_clients_get_429_until_refilled() -> None:
+	"""Should reject a client past its burst with Retry-After, and admit it again once refilled."""
+	clock = FakeClock()
+	rate_limiter = TokenBucketLimiter(rate=0.5, burst=2, clock=clock)
+	limiter = ConcurrencyLimiter(limit=10, max_queue=0, queue_timeout=1)
+	async with client_for(AdmissionControlMiddleware(BlockingApp(), limiter, rate_limiter)) as client:
+		assert [(await client.get("/")).status_code for _ in range(2)] == [200, 200]
+
+		limited = await client.get("/")
+		assert limited.status_code == 429
+		assert limited.headers["Retry-After"] == "2"
+
+		clock.now += 2
+		assert (await client.get("/")).status_code == 200
+
+
+def test_token_buckets_are_per_client() -> None:
+	"""Should limit each client separately."""
+	rate_limiter = TokenBucketLimiter(rate=1, burst=1, clock=FakeClock())
+
+	assert rate_limiter.acquire("10.0.0.1") == 0
+	assert rate_limiter.acquire("10.0.0.1") == pytest.approx(1.0)
+	assert rate_limiter.acquire("10.0.0.2") == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+	("trusted_proxies", "forwarded_for", "limited"),
+	[
+		# Behind the proxy, clients get their own buckets
+		(["127.0.0.0/8"], ["203.0.113.1", "203.0.113.2"], False),
+		# Addresses a client prepends itself are ignored
+		(["127.0.0.1"], ["198.51.100.7, 203.0.113.1", "198.51.100.8, 203.0.113.1"], True),
+		# Without trusted proxies the header is ignored altogether
+		([], ["203.0.113.1", "203.0.113.2"], True),
+	],
+)
+async def test_rate_limit_keys_on_forwarded_client_behind_trusted_proxies(
+	trusted_proxies: list[str], forwarded_for: list[str], limited: bool
+) -> None:
+	"""Should tell clients behind a trusted proxy apart by the address it forwarded."""
+	rate_limiter = TokenBucketLimiter(rate=1, burst=1, clock=FakeClock())
+	limiter = ConcurrencyLimiter(limit=10, max_queue=0, queue_timeout=1)
+	middleware = AdmissionControlMiddleware(BlockingApp(), limiter, rate_limiter, trusted_proxies=trusted_proxies)
+	async with client_for(middleware) as client:
+		statuses = [(await client.get("/", headers={"X-Forwarded-For": hops})).status_code for hops in forwarded_for]
+
+	assert statuses == [200, 429 if limited else 200]
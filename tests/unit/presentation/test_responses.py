@@ -0,0 +1,23 @@
+"""Unit tests for the fast JSON response helper."""
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from app.presentation.responses import json_response
+
+
+def test_json_response_keeps_repeated_headers() -> None:
+	"""Should carry over every header of the route's response, including repeated ones."""
+	route_response = Response()
+	del route_response.headers["content-length"]
+	route_response.set_cookie("session", "abc")
+	route_response.set_cookie("theme", "dark")
+	route_response.headers["ETag"] = '"v1"'
+
+	response = json_response(TypeAdapter(dict[str, int]), {"total": 1}, route_response)
+
+	assert response.body == b'{"total":1}'
+	assert response.headers["content-type"] == "application/json"
+	assert response.headers["content-length"] == "11"
+	assert response.headers["etag"] == '"v1"'
+	assert [cookie.split("=")[0] for cookie in response.headers.getlist("set-cookie")] == ["session", "theme"]